@@ -0,0 +1,177 @@
+"""Arka plan iş motoru (tarama, yeniden adlandırma, geri alma).
+
+Uzun işler ayrı bir thread'de çalışır ve arayüz thread'ine yalnızca bir
+kuyruk üzerinden olay gönderir: ilerleme (sayılar, hız, kalan süre), ara
+sonuçlar ve bitiş. Ana thread olayları `poll()` ile (Tk tarafında `after()`
+döngüsünden) alır ve geri çağrıları kendi thread'inde çalıştırır; böylece
+geri çağrılar widget'lara güvenle dokunabilir. İşler iptal edilebilir: iş
+fonksiyonu `JobContext.check()` ile iptal isteğini kontrol eder.
+"""
+import queue
+import threading
+import time
+
+# İlerleme olaylarının en sık gönderilme aralığı (saniye)
+PROGRESS_INTERVAL = 0.1
+
+
+class JobCancelled(Exception):
+    """İş kullanıcı tarafından iptal edildi"""
+
+
+class JobProgress:
+    """Bir işin anlık ilerleme durumu"""
+
+    __slots__ = ("done", "total", "elapsed", "message")
+
+    def __init__(self, done, total, elapsed, message=None):
+        self.done = done
+        self.total = total  # Bilinmiyorsa None
+        self.elapsed = elapsed
+        self.message = message
+
+    @property
+    def rate(self):
+        """Saniyede işlenen öğe sayısı"""
+        return self.done / self.elapsed if self.elapsed > 0 else 0.0
+
+    @property
+    def eta(self):
+        """Tahmini kalan süre (saniye); hesaplanamıyorsa None"""
+        if self.total is None or self.done <= 0:
+            return None
+        return max(0.0, (self.total - self.done) / self.rate)
+
+    @property
+    def fraction(self):
+        """Tamamlanma oranı (0-1); toplam bilinmiyorsa None"""
+        if not self.total:
+            return None
+        return min(1.0, self.done / self.total)
+
+
+class JobContext:
+    """İş fonksiyonuna verilen bağlam: ilerleme, ara sonuç ve iptal kontrolü"""
+
+    def __init__(self, job):
+        self._job = job
+        self._last_progress = 0.0
+
+    @property
+    def cancel_event(self):
+        """İptal isteğinde ayarlanan threading.Event"""
+        return self._job.cancel_event
+
+    @property
+    def cancelled(self):
+        return self._job.cancel_event.is_set()
+
+    def check(self):
+        """İptal istendiyse JobCancelled fırlat"""
+        if self._job.cancel_event.is_set():
+            raise JobCancelled()
+
+    def progress(self, done, total=None, message=None, force=False):
+        """İlerlemeyi bildir (sık çağrılar PROGRESS_INTERVAL'e göre seyreltilir)"""
+        now = time.monotonic()
+        if not force and done != total and now - self._last_progress < PROGRESS_INTERVAL:
+            return
+        self._last_progress = now
+        self._job.post("progress", JobProgress(done, total, now - self._job.started, message))
+
+    def emit(self, value):
+        """Ara sonucu ana thread'e gönder"""
+        self._job.post("partial", value)
+
+
+class Job:
+    """Çalışan bir arka plan işi"""
+
+    def __init__(self, runner, name, func, on_progress, on_partial, on_done):
+        self.name = name
+        self.cancel_event = threading.Event()
+        self.started = time.monotonic()
+        self.finished = False
+        self._runner = runner
+        self._func = func
+        self._callbacks = {"progress": on_progress, "partial": on_partial, "done": on_done}
+        self._thread = threading.Thread(target=self._run, name=f"job-{name}", daemon=True)
+
+    def cancel(self):
+        """İşin durmasını iste (iş bir sonraki kontrolde durur)"""
+        self.cancel_event.set()
+
+    @property
+    def cancelled(self):
+        return self.cancel_event.is_set()
+
+    def post(self, kind, value, error=None):
+        self._runner._events.put((self, kind, value, error))
+
+    def join(self, timeout=None):
+        self._thread.join(timeout)
+
+    def _run(self):
+        try:
+            value, error = self._func(JobContext(self)), None
+        except Exception as e:
+            value, error = None, e
+        if error is None and self.cancel_event.is_set():
+            # İş iptali kendi yakalayıp erken döndüyse de iptal olarak bildir
+            error = JobCancelled()
+        self.post("done", value, error)
+
+    def _dispatch(self, kind, value, error):
+        callback = self._callbacks[kind]
+        if kind == "done":
+            self.finished = True
+            if callback is not None:
+                callback(value, error)
+        elif callback is not None and not self.cancelled:
+            # İptal edilmiş işin ilerleme ve ara sonuçları atılır
+            callback(value)
+
+
+class JobRunner:
+    """Arka plan işlerini başlatır ve olaylarını ana thread'e taşır"""
+
+    def __init__(self):
+        self._events = queue.SimpleQueue()
+        self._jobs = []
+
+    def start(self, name, func, on_progress=None, on_partial=None, on_done=None):
+        """func(context)'i arka planda çalıştır
+
+        Geri çağrılar `poll()` sırasında ana thread'de çalışır:
+        on_progress(JobProgress), on_partial(değer) ve on_done(sonuç, hata).
+        İptal edilen işlerde hata JobCancelled olur.
+        """
+        job = Job(self, name, func, on_progress, on_partial, on_done)
+        self._jobs.append(job)
+        job._thread.start()
+        return job
+
+    def poll(self, limit=None):
+        """Bekleyen olayların geri çağrılarını çalıştır (ana thread'den çağrılmalı)"""
+        processed = 0
+        while limit is None or processed < limit:
+            try:
+                job, kind, value, error = self._events.get_nowait()
+            except queue.Empty:
+                break
+            processed += 1
+            job._dispatch(kind, value, error)
+        self._jobs = [job for job in self._jobs if not job.finished]
+        return processed
+
+    @property
+    def busy(self):
+        """Bitmemiş veya olayları teslim edilmemiş iş var mı?"""
+        return bool(self._jobs) or not self._events.empty()
+
+    def shutdown(self, timeout=None):
+        """Tüm işleri iptal et ve bitmelerini bekle"""
+        for job in self._jobs:
+            job.cancel()
+        for job in self._jobs:
+            job.join(timeout)
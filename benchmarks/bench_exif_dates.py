@@ -0,0 +1,109 @@
+"""EXIF tarih okuma kıyaslaması.
+
+Eski yol (Image.open + getexif + ExifTags.TAGS üzerinde isimle arama +
+strptime) ile başlık tabanlı `exif_reader.read_exif_date`'i saniyedeki dosya
+sayısı cinsinden karşılaştırır ve iki yolun aynı tarihi bulduğunu kontrol eder.
+
+Kullanım:
+    python benchmarks/bench_exif_dates.py            # sentetik JPEG/PNG/TIFF/WebP
+    python benchmarks/bench_exif_dates.py KLASÖR      # klasördeki gerçek dosyalar
+"""
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PIL import ExifTags, Image  # noqa: E402
+
+from exif_reader import read_exif_date  # noqa: E402
+
+SYNTHETIC_COUNT = 250  # Format başına dosya
+SYNTHETIC_FORMATS = {"JPEG": ".jpg", "PNG": ".png", "TIFF": ".tif", "WEBP": ".webp"}
+EXTENSIONS = {'.jpg', '.jpeg', '.png', '.tiff', '.tif', '.webp'}
+
+
+def legacy_date(photo_path):
+    """Eski get_photo_date'in EXIF kısmı (dosya tarihi yedeği olmadan)"""
+    img = Image.open(photo_path)
+    exif = img.getexif()
+    if exif:
+        for tag_id, value in exif.items():
+            tag = ExifTags.TAGS.get(tag_id, tag_id)
+            if tag == 'DateTime' or tag == 'DateTimeOriginal' or tag == 'DateTimeDigitized':
+                try:
+                    return datetime.strptime(str(value), "%Y:%m:%d %H:%M:%S")
+                except ValueError:
+                    pass
+    return None
+
+
+def make_synthetic(folder):
+    """Kamera benzeri EXIF bloklu, 800x600 test dosyaları üret"""
+    img = Image.effect_noise((800, 600), 20).convert("RGB")
+    start = datetime(2020, 1, 1)
+    paths = []
+    for fmt, ext in SYNTHETIC_FORMATS.items():
+        for i in range(SYNTHETIC_COUNT):
+            stamp = (start + timedelta(minutes=i)).strftime("%Y:%m:%d %H:%M:%S")
+            exif = Image.Exif()
+            exif[0x010F] = "Camera Maker"
+            exif[0x0110] = "Model X"
+            exif[0x0131] = "Firmware 1.0"
+            exif[0x0132] = stamp
+            exif_ifd = exif.get_ifd(0x8769)
+            exif_ifd[0x9003] = stamp
+            exif_ifd[0x9004] = stamp
+            exif_ifd[0x829A] = 0.01
+            exif_ifd[0x8827] = 100
+            path = os.path.join(folder, f"img_{fmt}_{i:04d}{ext}")
+            img.save(path, format=fmt, exif=exif)
+            paths.append(path)
+    return paths
+
+
+def rate(func, paths):
+    start = time.perf_counter()
+    results = [func(path) for path in paths]
+    elapsed = time.perf_counter() - start
+    return len(paths) / elapsed, results
+
+
+def main():
+    if len(sys.argv) > 1:
+        folder = sys.argv[1]
+        paths = [os.path.join(root, name)
+                 for root, _, files in os.walk(folder) for name in files
+                 if os.path.splitext(name)[1].lower() in EXTENSIONS]
+        tmp = None
+    else:
+        tmp = tempfile.TemporaryDirectory()
+        paths = make_synthetic(tmp.name)
+
+    by_ext = {}
+    for path in paths:
+        by_ext.setdefault(os.path.splitext(path)[1].lower(), []).append(path)
+
+    print(f"{'uzantı':<8}{'dosya':>7}{'eski (dosya/s)':>16}{'yeni (dosya/s)':>16}{'hızlanma':>10}")
+    for ext, group in sorted(by_ext.items()):
+        # Isınma (dosya sistemi önbelleği)
+        for path in group:
+            with open(path, "rb") as f:
+                f.read(65536)
+        old_rate, old_results = rate(legacy_date, group)
+        new_rate, new_results = rate(read_exif_date, group)
+        print(f"{ext:<8}{len(group):>7}{old_rate:>16.0f}{new_rate:>16.0f}{new_rate / old_rate:>9.1f}x")
+        if tmp is not None:
+            # Sentetik dosyalarda tüm tarih etiketleri aynı - sonuçlar eşleşmeli
+            mismatches = sum(1 for a, b in zip(old_results, new_results) if a != b)
+            if mismatches:
+                print(f"  UYARI: {mismatches} dosyada sonuçlar farklı")
+
+    if tmp is not None:
+        tmp.cleanup()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""Önizleme yükleyici kıyaslaması.
+
+Eski yol (tam çözme + LANCZOS) ile `preview_loader.load_preview`'i galeri
+(240x240), büyük görünüm (900x550) ve swipe (2048x2048) hedefleri için her
+formatta karşılaştırır.
+
+Kullanım:
+    python benchmarks/bench_preview_loader.py            # sentetik 24 MP görseller
+    python benchmarks/bench_preview_loader.py KLASÖR      # klasördeki gerçek dosyalar
+"""
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PIL import Image  # noqa: E402
+
+from preview_loader import fit_size, load_preview  # noqa: E402
+
+TARGETS = {
+    "gallery": ((240, 240), True),
+    "large": ((900, 550), True),
+    "swipe": ((2048, 2048), False),
+}
+SYNTHETIC_SIZE = (6000, 4000)  # 24 MP
+SYNTHETIC_FORMATS = {"JPEG": ".jpg", "PNG": ".png", "WEBP": ".webp", "TIFF": ".tif"}
+
+
+def legacy_preview(photo_path, size, allow_upscale=True):
+    """Eski yol: tam çözünürlükte aç ve LANCZOS ile küçült"""
+    img = Image.open(photo_path)
+    target = fit_size(img.width, img.height, size[0], size[1], allow_upscale)
+    return img.resize(target, Image.Resampling.LANCZOS)
+
+
+def make_synthetic(folder):
+    """Gürültü + gradyan içeren (sıkıştırması gerçekçi) test görselleri üret"""
+    width, height = SYNTHETIC_SIZE
+    base = Image.radial_gradient("L").resize((width, height))
+    noise = Image.effect_noise((width, height), 40)
+    img = Image.merge("RGB", (base, noise, Image.linear_gradient("L").resize((width, height))))
+    paths = []
+    for fmt, ext in SYNTHETIC_FORMATS.items():
+        path = os.path.join(folder, f"synthetic{ext}")
+        img.save(path, format=fmt, **({"quality": 90} if fmt in ("JPEG", "WEBP") else {}))
+        paths.append(path)
+    return paths
+
+
+def timed(func, *args, repeat=3):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    if len(sys.argv) > 1:
+        folder = sys.argv[1]
+        paths = [os.path.join(folder, name) for name in sorted(os.listdir(folder))
+                 if os.path.splitext(name)[1].lower() in
+                 {'.jpg', '.jpeg', '.png', '.gif', '.bmp', '.tiff', '.tif', '.webp'}]
+        tmp = None
+    else:
+        tmp = tempfile.TemporaryDirectory()
+        paths = make_synthetic(tmp.name)
+
+    print(f"{'dosya':<24}{'format':<8}{'hedef':<9}{'eski (ms)':>11}{'yeni (ms)':>11}{'hızlanma':>10}")
+    for path in paths:
+        fmt = Image.open(path).format
+        for name, (size, upscale) in TARGETS.items():
+            old = timed(legacy_preview, path, size, upscale)
+            new = timed(load_preview, path, size, upscale)
+            print(f"{os.path.basename(path)[:23]:<24}{fmt:<8}{name:<9}"
+                  f"{old * 1000:>11.1f}{new * 1000:>11.1f}{old / new:>9.1f}x")
+
+    if tmp is not None:
+        tmp.cleanup()
+
+
+if __name__ == "__main__":
+    main()
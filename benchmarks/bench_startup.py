@@ -0,0 +1,115 @@
+"""Açılış süresi (cold start) kıyaslaması.
+
+Uygulamayı ayrı süreçlerde `PHOTO_SORTER_STARTUP_PROFILE=exit` ile açar;
+pencere ilk kez etkileşime hazır olunca uygulama kendini kapatır. Her aşamanın
+(modül yükleme, pencere, depolar, widget'lar, hazır) medyan süresi ve sürecin
+başlatılmasından kapanışına kadar geçen toplam süre yazılır.
+
+Ekran yoksa (ör. DISPLAY ayarlı değilse) yalnızca modül yükleme süresi ölçülür.
+Her iki durumda da açılışta yüklenmemesi gereken modüllerin (görsel çözme
+katmanı, multiprocessing) yüklenmediği kontrol edilir.
+
+Kullanım:
+    python benchmarks/bench_startup.py                 # 5 açılış
+    python benchmarks/bench_startup.py --runs 10
+    python benchmarks/bench_startup.py --budget 800    # medyan > 800 ms ise çıkış kodu 1
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from startup_profile import PROFILE_ENV, parse_report  # noqa: E402
+
+# Açılışta yüklenmemesi gereken (ilk kullanımda yüklenen) modüller
+LAZY_MODULES = ("preview_loader", "concurrent.futures.process", "multiprocessing")
+
+IMPORT_ONLY_CODE = (
+    "import sys, startup_profile, photo_sorter; "
+    "startup_profile.PROFILE.report(); "
+    f"print('lazy:', ','.join(m for m in {LAZY_MODULES!r} if m in sys.modules), file=sys.stderr)"
+)
+
+
+def has_display():
+    if sys.platform in ("win32", "darwin"):
+        return True
+    return bool(os.environ.get("DISPLAY") or os.environ.get("WAYLAND_DISPLAY"))
+
+
+def run_once(args, mode, timeout=60):
+    """Bir açılışı ölç: ({aşama: (aşama ms, toplam ms)}, duvar saati ms, stderr)"""
+    env = dict(os.environ, **{PROFILE_ENV: mode})
+    start = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, *args], cwd=ROOT, env=env,
+        stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, timeout=timeout
+    )
+    wall = (time.perf_counter() - start) * 1000
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip() or f"çıkış kodu {result.returncode}")
+    return parse_report(result.stderr), wall, result.stderr
+
+
+def lazy_modules_loaded():
+    """Açılışta yüklenmiş tembel modüllerin listesi"""
+    _, _, stderr = run_once(["-c", IMPORT_ONLY_CODE], "1")
+    for line in stderr.splitlines():
+        if line.startswith("lazy:"):
+            return [name for name in line[len("lazy:"):].strip().split(",") if name]
+    return []
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5, help="ölçülen açılış sayısı")
+    parser.add_argument("--budget", type=float, default=None,
+                        help="medyan toplam açılış süresi üst sınırı (ms)")
+    parser.add_argument("--import-only", action="store_true",
+                        help="pencere açmadan yalnızca modül yüklemeyi ölç")
+    args = parser.parse_args()
+
+    gui = has_display() and not args.import_only
+    if gui:
+        command, mode, final = ["photo_sorter.py"], "exit", "ready"
+    else:
+        command, mode, final = ["-c", IMPORT_ONLY_CODE], "1", "imports"
+        print("Ekran yok veya --import-only: yalnızca modül yükleme ölçülüyor")
+
+    # İlk çalıştırma .pyc dosyalarını ve disk önbelleğini ısıtır, ölçüme katılmaz
+    run_once(command, mode)
+    phases = {}
+    walls = []
+    for _ in range(args.runs):
+        report, wall, _ = run_once(command, mode)
+        for phase, (duration, _) in report.items():
+            phases.setdefault(phase, []).append(duration)
+        walls.append(wall)
+
+    print(f"{'aşama':<10} {'medyan':>10} {'en iyi':>10}")
+    for phase, durations in phases.items():
+        print(f"{phase:<10} {statistics.median(durations):8.1f} ms {min(durations):8.1f} ms")
+    total = statistics.median(
+        sum(durations[i] for durations in phases.values()) for i in range(args.runs)
+    )
+    print(f"{'toplam':<10} {total:8.1f} ms  ('{final}' aşamasına kadar)")
+    print(f"{'süreç':<10} {statistics.median(walls):8.1f} ms  (yorumlayıcı başlatma ve kapanış dahil)")
+
+    status = 0
+    loaded = lazy_modules_loaded()
+    if loaded:
+        print(f"HATA: açılışta yüklenmemesi gereken modüller yüklendi: {', '.join(loaded)}")
+        status = 1
+    if args.budget is not None and total > args.budget:
+        print(f"HATA: açılış süresi bütçeyi aştı ({total:.1f} ms > {args.budget:.1f} ms)")
+        status = 1
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
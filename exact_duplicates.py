@@ -0,0 +1,126 @@
+"""Bayt bayt aynı (kopyalanmış) fotoğraf dosyalarını bulur.
+
+Dosyalar aşamalı olarak elenir; her aşamada grubunda tek kalan dosya
+bırakılır:
+
+1. Boyut: taramadaki stat bilgisinden gelir, dosya açılmaz. Boyutu başka
+   hiçbir dosyayla aynı olmayan dosya kopya olamaz.
+2. Baş blok: aynı boyuttaki dosyaların yalnızca ilk `HEAD_BYTES` baytı
+   hash'lenir. Farklı fotoğraflarda başlık (EXIF tarihleri, önizleme) bu
+   blokta ayrışır.
+3. Tam hash: baş bloğu da aynı olan dosyalar bütünüyle, mmap ile (olmazsa
+   parça parça okunarak) hash'lenir.
+
+Böylece dosyaların çok azı tam okunur. Hash'leme worker thread'lerde yapılır
+(hashlib büyük bloklarda GIL'i bırakır).
+"""
+import hashlib
+import mmap
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+HEAD_BYTES = 64 * 1024  # Baş blok hash'inde okunan bayt
+READ_CHUNK_BYTES = 1024 * 1024  # mmap kullanılamazsa akış halinde okuma boyutu
+HASH_BATCH_FILES = 64  # İlerleme ve iptal kontrolü arasında hash'lenen dosya sayısı
+
+
+def _digest():
+    return hashlib.blake2b(digest_size=16)
+
+
+def head_digest(photo_path, size=HEAD_BYTES):
+    """Dosyanın ilk `size` baytının hash'i"""
+    digest = _digest()
+    with open(photo_path, "rb") as f:
+        digest.update(f.read(size))
+    return digest.digest()
+
+
+def full_digest(photo_path):
+    """Dosyanın tamamının hash'i (mmap ile; olmazsa parça parça okunur)"""
+    digest = _digest()
+    with open(photo_path, "rb") as f:
+        try:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                digest.update(data)
+            return digest.digest()
+        except (OSError, ValueError):
+            pass  # Boş dosya veya mmap desteklemeyen dosya sistemi
+        f.seek(0)
+        for chunk in iter(lambda: f.read(READ_CHUNK_BYTES), b""):
+            digest.update(chunk)
+    return digest.digest()
+
+
+def _regroup(groups, digest_of, executor, report):
+    """Her grubu digest_of(yol) değerine göre böl; tek kalanları at
+
+    Grup öğeleri (sıra, anahtar, yol, boyut) biçimindedir; okunamayan
+    dosyalar elenir.
+    """
+    def compute(photo_path):
+        try:
+            return digest_of(photo_path)
+        except OSError:
+            return None
+
+    total = sum(map(len, groups))
+    result = []
+    done = 0
+    # Küçük gruplar birlikte gönderilir: tüm worker'lar meşgul kalır
+    start = 0
+    while start < len(groups):
+        end, count = start, 0
+        while end < len(groups) and count < HASH_BATCH_FILES:
+            count += len(groups[end])
+            end += 1
+        batch = groups[start:end]
+        values = iter(executor.map(compute, [item[2] for group in batch for item in group]))
+        for group in batch:
+            buckets = {}
+            for item, value in zip(group, values):
+                if value is not None:
+                    buckets.setdefault(value, []).append(item)
+            result.extend(bucket for bucket in buckets.values() if len(bucket) > 1)
+        done += count
+        report(done, total)
+        start = end
+    return result
+
+
+def find_duplicates(files, workers=None, check=None, progress=None):
+    """[(anahtar, yol, boyut), ...] -> aynı içerikli dosyaların anahtar grupları
+
+    Boyutu None olan dosyalar için stat yapılır; boş dosyalar atlanır. Her
+    grup en az iki anahtar içerir; gruplar ve grup içindeki anahtarlar
+    girişteki sıradadır. Her grup hash'lendikten sonra check() (iptal için
+    istisna fırlatabilir) ve progress(işlenen, toplam, aşama) çağrılır.
+    """
+    by_size = {}
+    for position, (key, photo_path, size) in enumerate(files):
+        if size is None:
+            try:
+                size = os.stat(photo_path).st_size
+            except OSError:
+                continue
+        if size > 0:
+            by_size.setdefault(size, []).append((position, key, photo_path, size))
+    groups = [group for group in by_size.values() if len(group) > 1]
+
+    def stage(name):
+        def report(done, total):
+            if check is not None:
+                check()
+            if progress is not None:
+                progress(done, total, name)
+        return report
+
+    with ThreadPoolExecutor(max_workers=workers or min(8, (os.cpu_count() or 2) * 2)) as executor:
+        groups = _regroup(groups, head_digest, executor, stage("head"))
+        # Baş bloğa sığan dosyalar bu aşamada zaten tümüyle hash'lendi
+        large = [group for group in groups if group[0][3] > HEAD_BYTES]
+        groups = [group for group in groups if group[0][3] <= HEAD_BYTES]
+        groups += _regroup(large, full_digest, executor, stage("full"))
+
+    groups.sort(key=lambda group: group[0][0])
+    return [[key for _, key, _, _ in group] for group in groups]
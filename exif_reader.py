@@ -0,0 +1,290 @@
+"""Başlık tabanlı (header-only) EXIF okuyucu.
+
+PIL ile tüm dosyayı açmak yerine yalnızca ihtiyaç duyulan baytları okur:
+JPEG dosyalarında APP1 (Exif) segmentini, TIFF dosyalarında IFD zincirini,
+PNG dosyalarında eXIf chunk'ını ve WebP dosyalarında EXIF chunk'ını doğrudan
+ayrıştırır. Tarih etiketleri isimle değil, ID ile aranır.
+"""
+import struct
+from datetime import datetime
+
+EXIF_HEADER = b"Exif\x00\x00"
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+# TIFF veri tiplerinin bayt boyutları
+TYPE_SIZES = {1: 1, 2: 1, 3: 2, 4: 4, 5: 8, 6: 1, 7: 1, 8: 2, 9: 4, 10: 8, 11: 4, 12: 8}
+
+# Bir IFD'de kabul edilen en fazla kayıt (bozuk dosyalara karşı)
+MAX_IFD_ENTRIES = 1024
+
+# Tek bir kaydın değeri için okunan en fazla bayt (bozuk adet alanına karşı)
+MAX_VALUE_BYTES = 64 * 1024
+
+# Gömülü thumbnail için kabul edilen en fazla bayt (APP1 segmenti en fazla 64 KB'tır)
+MAX_THUMBNAIL_BYTES = 1024 * 1024
+
+# Tarih etiketleri ("YYYY:MM:DD HH:MM:SS\0" = 20 bayt) için kabul edilen en fazla bayt
+MAX_DATE_BYTES = 32
+
+TYPE_ASCII = 2
+TYPE_SHORT = 3
+TYPE_LONG = 4
+
+# IFD1 (thumbnail) etiketleri
+TAG_JPEG_INTERCHANGE_FORMAT = 0x0201
+TAG_JPEG_INTERCHANGE_FORMAT_LENGTH = 0x0202
+
+# Tarih etiketleri
+TAG_DATETIME = 0x0132  # IFD0
+TAG_EXIF_IFD = 0x8769  # IFD0 -> Exif alt IFD'si
+TAG_DATETIME_ORIGINAL = 0x9003  # Exif IFD
+TAG_DATETIME_DIGITIZED = 0x9004  # Exif IFD
+
+# Bu uzantılar başlık okuyucuyla tam olarak desteklenir
+HEADER_EXTENSIONS = {'.jpg', '.jpeg', '.png', '.tiff', '.tif', '.webp'}
+
+
+class TiffReader:
+    """Bir TIFF yapısındaki IFD'leri okur
+
+    read_at(offset, size) TIFF başlangıcına göre bayt okuyan bir fonksiyondur;
+    böylece aynı kod hem bellekteki APP1 bloğu hem de diskteki TIFF dosyası
+    için çalışır.
+    """
+
+    def __init__(self, read_at):
+        self.read_at = read_at
+        header = read_at(0, 8)
+        if header[:2] == b"II":
+            self.endian = "<"
+        elif header[:2] == b"MM":
+            self.endian = ">"
+        else:
+            raise ValueError("Geçersiz TIFF başlığı")
+        magic, self.first_ifd = struct.unpack(self.endian + "HI", header[2:8])
+        if magic != 42:
+            raise ValueError("Geçersiz TIFF başlığı")
+
+    @classmethod
+    def from_bytes(cls, data):
+        return cls(lambda offset, size: data[offset:offset + size])
+
+    def read_ifd(self, offset):
+        """IFD'yi oku: ({etiket: (tip, adet, ham_değer)}, sonraki_ifd_offseti)"""
+        raw = self.read_at(offset, 2)
+        if len(raw) < 2:
+            return {}, 0
+        count = struct.unpack(self.endian + "H", raw)[0]
+        if count > MAX_IFD_ENTRIES:
+            return {}, 0
+        data = self.read_at(offset + 2, count * 12 + 4)
+        entries = {}
+        for i in range(min(count, len(data) // 12)):
+            tag, typ, n = struct.unpack(self.endian + "HHI", data[i * 12:i * 12 + 8])
+            entries[tag] = (typ, n, data[i * 12 + 8:i * 12 + 12])
+        next_offset = 0
+        if len(data) >= count * 12 + 4:
+            next_offset = struct.unpack(self.endian + "I", data[count * 12:count * 12 + 4])[0]
+        return entries, next_offset
+
+    def value(self, entry, max_size=MAX_VALUE_BYTES):
+        """Kaydın değerini çöz (ASCII -> str, SHORT/LONG -> int veya tuple)
+
+        Değeri max_size bayttan büyük olan veya dosyada tamamı bulunmayan
+        kayıtlar için ValueError fırlatır.
+        """
+        typ, count, raw = entry
+        size = TYPE_SIZES.get(typ, 1) * count
+        if size > max_size:
+            raise ValueError("EXIF kaydı çok büyük")
+        if size > 4:
+            offset = struct.unpack(self.endian + "I", raw)[0]
+            raw = self.read_at(offset, size)
+        else:
+            raw = raw[:size]
+        if len(raw) < size:
+            raise ValueError("EXIF kaydı dosyanın dışına taşıyor")
+        if typ == TYPE_ASCII:
+            return raw.split(b"\x00", 1)[0].decode("ascii", "replace")
+        if typ in (TYPE_SHORT, TYPE_LONG):
+            fmt = "H" if typ == TYPE_SHORT else "I"
+            values = struct.unpack_from(f"{self.endian}{count}{fmt}", raw)
+            return values[0] if count == 1 else values
+        return raw
+
+    def long(self, entry):
+        """Tek bir LONG değeri olan kaydın değeri (offset ve uzunluk etiketleri); değilse None"""
+        typ, count, raw = entry
+        if typ != TYPE_LONG or count != 1:
+            return None
+        return struct.unpack(self.endian + "I", raw)[0]
+
+
+def read_jpeg_exif(f):
+    """JPEG dosyasındaki APP1 Exif bloğunun TIFF kısmını döndür (yoksa None)
+
+    Yalnızca SOS (görüntü verisi) öncesindeki segment başlıkları okunur.
+    """
+    if f.read(2) != b"\xff\xd8":
+        return None
+    while True:
+        marker = f.read(2)
+        if len(marker) < 2 or marker[0] != 0xFF:
+            return None
+        code = marker[1]
+        while code == 0xFF:  # Dolgu baytları
+            byte = f.read(1)
+            if not byte:
+                return None
+            code = byte[0]
+        if code in (0xD9, 0xDA):  # EOI / SOS - Exif bulunamadı
+            return None
+        if code == 0x01 or 0xD0 <= code <= 0xD7:  # Uzunluk alanı olmayan işaretler
+            continue
+        length_bytes = f.read(2)
+        if len(length_bytes) < 2:
+            return None
+        length = struct.unpack(">H", length_bytes)[0]
+        if length < 2:
+            return None
+        if code == 0xE1:
+            payload = f.read(length - 2)
+            if payload.startswith(EXIF_HEADER):
+                return payload[len(EXIF_HEADER):]
+        else:
+            f.seek(length - 2, 1)
+
+
+def read_png_exif(f):
+    """PNG dosyasındaki eXIf chunk'ını döndür (yoksa None)
+
+    Görüntü verisine (IDAT) ulaşınca durur; yalnızca chunk başlıkları okunur.
+    """
+    if f.read(8) != PNG_SIGNATURE:
+        return None
+    while True:
+        header = f.read(8)
+        if len(header) < 8:
+            return None
+        length, chunk_type = struct.unpack(">I4s", header)
+        if chunk_type == b"eXIf":
+            data = f.read(length)
+            # Bazı yazılımlar "Exif\0\0" önekini de ekler
+            return data[len(EXIF_HEADER):] if data.startswith(EXIF_HEADER) else data
+        if chunk_type in (b"IDAT", b"IEND"):
+            return None
+        f.seek(length + 4, 1)  # veri + CRC
+
+
+def read_webp_exif(f):
+    """WebP (RIFF) dosyasındaki EXIF chunk'ını döndür (yoksa None)"""
+    header = f.read(12)
+    if len(header) < 12 or header[:4] != b"RIFF" or header[8:12] != b"WEBP":
+        return None
+    while True:
+        chunk = f.read(8)
+        if len(chunk) < 8:
+            return None
+        chunk_type, length = struct.unpack("<4sI", chunk)
+        if chunk_type == b"EXIF":
+            data = f.read(length)
+            return data[len(EXIF_HEADER):] if data.startswith(EXIF_HEADER) else data
+        f.seek(length + (length & 1), 1)  # Chunk'lar çift uzunluğa hizalanır
+
+
+def open_exif(f):
+    """Dosya türünü başlıktan tanı ve EXIF için bir TiffReader döndür (yoksa None)"""
+    head = f.read(12)
+    f.seek(0)
+    try:
+        if head[:2] == b"\xff\xd8":
+            data = read_jpeg_exif(f)
+            return TiffReader.from_bytes(data) if data else None
+        if head[:8] == PNG_SIGNATURE:
+            data = read_png_exif(f)
+            return TiffReader.from_bytes(data) if data else None
+        if head[:4] == b"RIFF" and head[8:12] == b"WEBP":
+            data = read_webp_exif(f)
+            return TiffReader.from_bytes(data) if data else None
+        if head[:4] in (b"II*\x00", b"MM\x00*"):
+            def read_at(offset, size):
+                f.seek(offset)
+                return f.read(size)
+            return TiffReader(read_at)
+    except (ValueError, struct.error):
+        return None
+    return None
+
+
+def read_embedded_thumbnail(photo_path):
+    """EXIF IFD1'deki gömülü JPEG thumbnail'in baytlarını döndür (yoksa None)"""
+    try:
+        with open(photo_path, "rb") as f:
+            reader = open_exif(f)
+            if reader is None:
+                return None
+            _, ifd1_offset = reader.read_ifd(reader.first_ifd)
+            if not ifd1_offset:
+                return None
+            ifd1, _ = reader.read_ifd(ifd1_offset)
+            if TAG_JPEG_INTERCHANGE_FORMAT not in ifd1 or TAG_JPEG_INTERCHANGE_FORMAT_LENGTH not in ifd1:
+                return None
+            offset = reader.long(ifd1[TAG_JPEG_INTERCHANGE_FORMAT])
+            length = reader.long(ifd1[TAG_JPEG_INTERCHANGE_FORMAT_LENGTH])
+            if offset is None or length is None or not 0 < length <= MAX_THUMBNAIL_BYTES:
+                return None
+            data = reader.read_at(offset, length)
+            if len(data) != length or not data.startswith(b"\xff\xd8"):
+                return None
+            return data
+    except (OSError, ValueError, struct.error, MemoryError):
+        return None
+
+
+def parse_exif_datetime(value):
+    """EXIF tarih metnini ("YYYY:MM:DD HH:MM:SS") datetime'a çevir (geçersizse None)
+
+    strptime yerine sabit konumlardan dilimleyerek ayrıştırır.
+    """
+    value = str(value).strip()
+    if len(value) < 19 or value[4] != ":" or value[7] != ":" or value[10] not in " T" \
+            or value[13] != ":" or value[16] != ":":
+        return None
+    try:
+        return datetime(
+            int(value[0:4]), int(value[5:7]), int(value[8:10]),
+            int(value[11:13]), int(value[14:16]), int(value[17:19])
+        )
+    except ValueError:
+        return None
+
+
+def read_exif_date(photo_path):
+    """Çekim tarihini yalnızca dosya başlığından oku (bulunamazsa None)
+
+    Öncelik sırası: DateTimeOriginal, DateTimeDigitized, DateTime.
+    """
+    try:
+        with open(photo_path, "rb") as f:
+            reader = open_exif(f)
+            if reader is None:
+                return None
+            ifd0, _ = reader.read_ifd(reader.first_ifd)
+            exif_ifd = {}
+            if TAG_EXIF_IFD in ifd0:
+                exif_offset = reader.long(ifd0[TAG_EXIF_IFD])
+                if exif_offset is not None:
+                    exif_ifd, _ = reader.read_ifd(exif_offset)
+
+            for ifd, tag in ((exif_ifd, TAG_DATETIME_ORIGINAL),
+                             (exif_ifd, TAG_DATETIME_DIGITIZED),
+                             (ifd0, TAG_DATETIME)):
+                entry = ifd.get(tag)
+                if entry is None or entry[0] != TYPE_ASCII or entry[1] > MAX_DATE_BYTES:
+                    continue
+                date = parse_exif_datetime(reader.value(entry, MAX_DATE_BYTES))
+                if date is not None:
+                    return date
+    except (OSError, ValueError, struct.error, MemoryError):
+        return None
+    return None
@@ -0,0 +1,143 @@
+"""Kalıcı metadata indeksi (SQLite).
+
+Her dosya için yol, boyut, mtime_ns ve çıkarılan çekim tarihini (ISO metni
+olarak, saat dilimi dönüşümü olmadan) saklar. Yeniden taramada yalnızca `stat` yapılır; boyutu ve mtime_ns'i değişmemiş
+dosyaların tarihi indeksten okunur, yalnızca yeni veya değişmiş dosyalar
+için EXIF yeniden çıkarılır.
+
+Benzer fotoğraf gruplaması için hesaplanan algısal hash (dHash) da aynı
+kayıtta tutulur. Değişen dosyanın kaydı yeniden yazıldığında hash boşalır ve
+bir sonraki gruplamada yeniden hesaplanır.
+"""
+import os
+import sqlite3
+import threading
+from datetime import datetime
+
+from thumbnail_cache import default_cache_dir
+
+
+_HASH_MASK = (1 << 64) - 1
+
+
+def _signed(value):
+    """64 bitlik işaretsiz hash'i SQLite'ın işaretli tam sayısına çevir"""
+    return value - (1 << 64) if value >= 1 << 63 else value
+
+
+def default_index_path():
+    """Önbellek klasöründeki indeks veritabanının yolu"""
+    return default_cache_dir() / "metadata.sqlite3"
+
+
+class MetadataIndex:
+    """Dosya yolu -> (boyut, mtime_ns, tarih) indeksi (thread-safe)"""
+
+    def __init__(self, db_path=None):
+        db_path = db_path or default_index_path()
+        os.makedirs(os.path.dirname(os.fspath(db_path)), exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(os.fspath(db_path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS photos ("
+            " path TEXT PRIMARY KEY,"
+            " size INTEGER NOT NULL,"
+            " mtime_ns INTEGER NOT NULL,"
+            " taken TEXT NOT NULL)"
+        )
+        # Eski sürümde oluşturulmuş veritabanlarına hash sütununu ekle
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(photos)")}
+        if "dhash" not in columns:
+            self._conn.execute("ALTER TABLE photos ADD COLUMN dhash INTEGER")
+        self._conn.commit()
+
+    def load_folder(self, folder):
+        """Klasör altındaki tüm kayıtları {yol: (boyut, mtime_ns, tarih)} olarak döndür"""
+        prefix = os.path.join(os.path.abspath(folder), "")
+        # LIKE yerine aralık sorgusu: birincil anahtar indeksini kullanır
+        upper = prefix[:-1] + chr(ord(prefix[-1]) + 1)
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT path, size, mtime_ns, taken FROM photos WHERE path >= ? AND path < ?",
+                (prefix, upper)
+            ).fetchall()
+        return {
+            path: (size, mtime_ns, datetime.fromisoformat(taken))
+            for path, size, mtime_ns, taken in rows
+        }
+
+    def load_hashes(self, folder):
+        """Klasör altındaki hesaplanmış algısal hash'leri {yol: hash} olarak döndür"""
+        prefix = os.path.join(os.path.abspath(folder), "")
+        upper = prefix[:-1] + chr(ord(prefix[-1]) + 1)
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT path, dhash FROM photos WHERE path >= ? AND path < ? AND dhash IS NOT NULL",
+                (prefix, upper)
+            ).fetchall()
+        # SQLite tam sayıları işaretlidir: 64 bitlik hash geri çevrilir
+        return {path: value & _HASH_MASK for path, value in rows}
+
+    def set_hashes(self, records):
+        """[(yol, hash), ...] algısal hash'lerini tek işlemde yaz (kaydı olan dosyalar için)"""
+        if not records:
+            return
+        with self._lock:
+            self._conn.executemany(
+                "UPDATE photos SET dhash = ? WHERE path = ?",
+                [(_signed(value), os.path.abspath(path)) for path, value in records]
+            )
+            self._conn.commit()
+
+    def update(self, records):
+        """[(yol, boyut, mtime_ns, tarih), ...] kayıtlarını tek işlemde yaz"""
+        if not records:
+            return
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO photos (path, size, mtime_ns, taken) VALUES (?, ?, ?, ?)",
+                [(os.path.abspath(path), size, mtime_ns, date.isoformat())
+                 for path, size, mtime_ns, date in records]
+            )
+            self._conn.commit()
+
+    def remove(self, paths):
+        """Artık var olmayan dosyaların kayıtlarını sil"""
+        if not paths:
+            return
+        with self._lock:
+            self._conn.executemany(
+                "DELETE FROM photos WHERE path = ?",
+                [(os.path.abspath(path),) for path in paths]
+            )
+            self._conn.commit()
+
+    def rename(self, moves):
+        """[(eski_yol, yeni_yol), ...] yeniden adlandırmalarını indekse yansıt
+
+        Yeniden adlandırma boyut ve mtime'ı değiştirmediği için kayıt korunur.
+        """
+        if not moves:
+            return
+        with self._lock:
+            rows = []
+            for old_path, new_path in moves:
+                row = self._conn.execute(
+                    "SELECT size, mtime_ns, taken, dhash FROM photos WHERE path = ?",
+                    (os.path.abspath(old_path),)
+                ).fetchone()
+                if row is not None:
+                    rows.append((os.path.abspath(old_path), os.path.abspath(new_path), row))
+            # Önce hepsini sil, sonra ekle - takas/döngü durumlarında çakışmayı önler
+            self._conn.executemany("DELETE FROM photos WHERE path = ?", [(old,) for old, _, _ in rows])
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO photos (path, size, mtime_ns, taken, dhash) VALUES (?, ?, ?, ?, ?)",
+                [(new, *row) for _, new, row in rows]
+            )
+            self._conn.commit()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,143 @@
+"""Algısal hash ile benzer (seri çekim, neredeyse aynı) fotoğraf grupları.
+
+Her fotoğraf için 64 bitlik fark hash'i (dHash) hesaplanır: görüntü küçük bir
+gri tonlu ızgaraya indirilip yan yana piksellerin parlaklık farkının işareti
+alınır. Ölçek, sıkıştırma ve küçük pozlama farkları hash'i az değiştirir;
+iki hash arasındaki Hamming mesafesi görsel benzerliği ölçer.
+
+Benzer çiftler çoklu indeks hash'leme (multi-index hashing) ile bulunur:
+64 bit `radius // 2 + 1` parçaya bölünür. Mesafesi en fazla `radius` olan
+iki hash'in güvercin yuvası ilkesine göre en az bir parçası en fazla bir bit
+farklıdır. Her parça için hash'ler kovalara ayrılır; yalnızca aynı veya tek
+bit farklı kovalardaki hash'ler karşılaştırılır. Böylece 100 bin fotoğrafta
+tüm çiftleri karşılaştırmak (O(n²)) gerekmez. Birbirine benzeyen fotoğraflar
+zincirleme birleştirilerek gruplanır (union-find).
+"""
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from PIL import Image
+
+HASH_SIZE = 8  # 8x8 = 64 bit
+HASH_SOURCE_SIZE = (64, 64)  # Hash için çözülen önizleme kutusu (JPEG'de 1/8 DCT ölçeği yeter)
+DEFAULT_RADIUS = 5  # Bu kadar bit farkına kadar "benzer"
+HASH_BATCH_SIZE = 256  # İlerleme ve indeks yazımı için grup boyutu
+
+
+def dhash(image):
+    """Görselin 64 bitlik fark hash'i"""
+    width = HASH_SIZE + 1
+    pixels = image.convert("L").resize((width, HASH_SIZE), Image.Resampling.BOX).tobytes()
+    value = 0
+    for row in range(0, width * HASH_SIZE, width):
+        for left, right in zip(pixels[row:row + HASH_SIZE], pixels[row + 1:row + width]):
+            value = (value << 1) | (left < right)
+    return value
+
+
+def photo_hash(photo_path):
+    """Fotoğrafın dHash'i (çözücü ölçeklemesiyle küçük boyutta çözülür)"""
+    from preview_loader import load_preview
+
+    return dhash(load_preview(photo_path, HASH_SOURCE_SIZE, allow_upscale=False))
+
+
+def hamming(a, b):
+    """İki hash arasındaki farklı bit sayısı"""
+    return (a ^ b).bit_count()
+
+
+def iter_hashes(photos, known=None, workers=None, cancel=None):
+    """[(anahtar, yol), ...] için [(anahtar, yol, hash, yeni mi), ...] grupları üret
+
+    known ({mutlak yol: hash}) indeksteki hazır hash'lerdir; diğerleri
+    worker thread'lerde hesaplanır (PIL çözme sırasında GIL'i bırakır).
+    Okunamayan dosyalar atlanır.
+    """
+    known = known or {}
+
+    def compute(photo_path):
+        try:
+            return photo_hash(photo_path)
+        except Exception:
+            return None
+
+    with ThreadPoolExecutor(max_workers=workers or max(2, (os.cpu_count() or 2) - 1)) as executor:
+        for start in range(0, len(photos), HASH_BATCH_SIZE):
+            if cancel is not None and cancel():
+                return
+            batch = photos[start:start + HASH_BATCH_SIZE]
+            cached = [known.get(os.path.abspath(photo_path)) for _, photo_path in batch]
+            missing = [photo_path for (_, photo_path), value in zip(batch, cached) if value is None]
+            computed = iter(executor.map(compute, missing))
+            results = []
+            for (key, photo_path), value in zip(batch, cached):
+                fresh = value is None
+                if fresh:
+                    value = next(computed)
+                if value is not None:
+                    results.append((key, photo_path, value, fresh))
+            yield results
+
+
+def _chunks(radius, bits=HASH_SIZE * HASH_SIZE):
+    """Hash'i radius // 2 + 1 parçaya böl: [(kaydırma, bit sayısı), ...]
+
+    Mesafesi en fazla radius olan iki hash'in en az bir parçası en fazla
+    radius // parça sayısı (yani 0 veya 1) bit farklıdır.
+    """
+    count = min(bits, radius // 2 + 1)
+    bounds = [bits * i // count for i in range(count + 1)]
+    return [(low, high - low) for low, high in zip(bounds, bounds[1:])]
+
+
+def find_groups(hashes, radius=DEFAULT_RADIUS):
+    """{anahtar: hash} -> benzer grupların listesi
+
+    Her grup en az iki anahtar içerir; gruplar ve grup içindeki anahtarlar
+    girişteki sıradadır.
+    """
+    # Aynı hash'e sahip fotoğraflar tek değer olarak karşılaştırılır
+    keys_by_value = {}
+    for key, value in hashes.items():
+        keys_by_value.setdefault(value, []).append(key)
+    values = list(keys_by_value)
+    parent = list(range(len(values)))
+
+    def find(i):
+        root = i
+        while parent[root] != root:
+            root = parent[root]
+        while parent[i] != root:
+            parent[i], i = root, parent[i]
+        return root
+
+    chunks = _chunks(radius)
+    sub_radius = radius // len(chunks)
+    for shift, width in chunks:
+        mask = (1 << width) - 1
+        buckets = {}
+        for i, value in enumerate(values):
+            buckets.setdefault((value >> shift) & mask, []).append(i)
+        # Parçası aynı veya (sub_radius 1 ise) tek bit farklı kovalar yoklanır
+        flips = [0] + ([1 << bit for bit in range(width)] if sub_radius else [])
+        for chunk, members in buckets.items():
+            for flip in flips:
+                others = buckets.get(chunk ^ flip)
+                if others is None:
+                    continue
+                for a in members:
+                    value = values[a]
+                    for b in others:
+                        if b > a and (value ^ values[b]).bit_count() <= radius:
+                            root_a, root_b = find(a), find(b)
+                            if root_a != root_b:
+                                parent[max(root_a, root_b)] = min(root_a, root_b)
+
+    groups = {}
+    for i, value in enumerate(values):
+        groups.setdefault(find(i), []).extend(keys_by_value[value])
+    order = {key: position for position, key in enumerate(hashes)}
+    result = [sorted(keys, key=order.__getitem__) for keys in groups.values() if len(keys) > 1]
+    result.sort(key=lambda keys: order[keys[0]])
+    return result
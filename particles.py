@@ -0,0 +1,158 @@
+"""Tuval üzerinde kalıcı öğelerle çizilen parçacık sistemi.
+
+Her parçacık için tuval öğesi bir kez oluşturulur ve karelerde yalnızca
+`coords` ile taşınır; ekrandan çıkan parçacıkların öğeleri silinir. Konum ve
+hızlar parçacık başına sözlükler yerine paralel dizilerde tutulur ve her
+karede tek geçişte toplu olarak güncellenir.
+
+Fizik gerçek geçen süreye göre ilerler: ana thread meşgulken kareler geç
+gelse de parçacıklar aynı hızla düşer. Karelerin ne kadar geciktiği ve
+çizimin ne kadar sürdüğü izlenir; yük arttıkça kare aralığı uzatılarak
+arayüze (ör. swipe sürüklemesine) zaman bırakılır, yük azalınca ~60 FPS'e
+geri dönülür.
+
+Konfeti dışındaki geçişler de aynı sistemi `add()` ile kendi parçacıklarını
+ekleyerek kullanabilir.
+"""
+import math
+import random
+import time
+
+MIN_FRAME_MS = 16  # ~60 FPS
+MAX_FRAME_MS = 50  # Yük altında en fazla ~20 FPS'e düşülür
+
+# Hız ve yerçekimi 16 ms'lik kare başına piksel olarak verilir
+REFERENCE_FRAME_S = MIN_FRAME_MS / 1000
+
+# Ekran dışına bu kadar çıkan parçacıklar kaldırılır
+MARGIN = 50
+
+CONFETTI_COLORS = ('#FF3B30', '#FF9500', '#FFCC00', '#34C759', '#007AFF', '#5856D6', '#AF52DE', '#FF2D55')
+
+
+class ParticleSystem:
+    """Yerçekimiyle düşen oval parçacıkları tuvalde canlandırır"""
+
+    def __init__(self, canvas, gravity=0.2, tag="particle", on_finish=None):
+        self.canvas = canvas
+        self.gravity = gravity  # Kare başına dikey hız artışı (piksel)
+        self.tag = tag
+        self.on_finish = on_finish  # Son parçacık kaybolunca çağrılır
+        self.width = 0
+        self.height = 0
+        self.interval = MIN_FRAME_MS  # Güncel kare aralığı (ms)
+        self._clear_particles()
+        self._job = None
+        self._last_frame = None
+        self._load = 0.0  # Gecikme + çizim süresinin üstel ortalaması (ms)
+
+    def _clear_particles(self):
+        self._items = []
+        self._xs = []
+        self._ys = []
+        self._vxs = []
+        self._vys = []
+        self._radii = []
+
+    @property
+    def running(self):
+        return self._job is not None
+
+    def __len__(self):
+        return len(self._items)
+
+    def set_bounds(self, width, height):
+        """Parçacıkların kaldırılacağı alanın boyutu (tuval yeniden boyutlanınca)"""
+        self.width = width
+        self.height = height
+
+    def add(self, x, y, vx, vy, size, color):
+        """Parçacık ekle; tuval öğesi burada bir kez oluşturulur"""
+        radius = size / 2
+        item = self.canvas.create_oval(
+            x - radius, y - radius, x + radius, y + radius,
+            fill=color, outline="", width=0, tags=(self.tag,)
+        )
+        self._items.append(item)
+        self._xs.append(x)
+        self._ys.append(y)
+        self._vxs.append(vx)
+        self._vys.append(vy)
+        self._radii.append(radius)
+
+    def start(self):
+        """Animasyonu başlat (zaten çalışıyorsa bir şey yapmaz)"""
+        if self._job is None and self._items:
+            self._last_frame = time.perf_counter()
+            self._job = self.canvas.after(self.interval, self._frame)
+
+    def stop(self):
+        """Animasyonu durdur ve tüm parçacıkları sil"""
+        if self._job is not None:
+            self.canvas.after_cancel(self._job)
+            self._job = None
+        self.canvas.delete(self.tag)
+        self._clear_particles()
+
+    def step(self, steps):
+        """Fiziği `steps` referans kare kadar ilerlet; ekran dışına çıkanları kaldır"""
+        gravity = self.gravity * steps
+        # Sabit ivmeli hareket: konum ortalama hızla ilerler
+        self._xs = [x + vx * steps for x, vx in zip(self._xs, self._vxs)]
+        self._ys = [y + (vy + gravity / 2) * steps for y, vy in zip(self._ys, self._vys)]
+        self._vys = [vy + gravity for vy in self._vys]
+
+        low_x, high_x, high_y = -MARGIN, self.width + MARGIN, self.height + MARGIN
+        alive = [
+            low_x <= x <= high_x and y <= high_y
+            for x, y in zip(self._xs, self._ys)
+        ]
+        if not all(alive):
+            self.canvas.delete(*(item for item, keep in zip(self._items, alive) if not keep))
+            self._items, self._xs, self._ys, self._vxs, self._vys, self._radii = (
+                [value for value, keep in zip(values, alive) if keep]
+                for values in (self._items, self._xs, self._ys, self._vxs, self._vys, self._radii)
+            )
+
+    def draw(self):
+        """Öğeleri güncel konumlarına taşı"""
+        coords = self.canvas.coords
+        for item, x, y, radius in zip(self._items, self._xs, self._ys, self._radii):
+            coords(item, x - radius, y - radius, x + radius, y + radius)
+
+    def _frame(self):
+        now = time.perf_counter()
+        elapsed_ms = (now - self._last_frame) * 1000
+        self._last_frame = now
+
+        self.step(elapsed_ms / 1000 / REFERENCE_FRAME_S)
+        self.draw()
+
+        if not self._items:
+            self._job = None
+            if self.on_finish is not None:
+                self.on_finish()
+            return
+
+        # Kare geç geldiyse veya çizim uzun sürdüyse aralığı uzat
+        cost_ms = (time.perf_counter() - now) * 1000
+        lateness_ms = max(0.0, elapsed_ms - self.interval)
+        self._load = self._load * 0.8 + (lateness_ms + cost_ms) * 0.2
+        self.interval = int(min(MAX_FRAME_MS, max(MIN_FRAME_MS, MIN_FRAME_MS + 2 * self._load)))
+        self._job = self.canvas.after(self.interval, self._frame)
+
+
+def confetti_burst(system, count=50, colors=CONFETTI_COLORS, rng=random):
+    """Alanın üstünden dağılarak düşen konfeti parçacıkları ekle ve başlat"""
+    for _ in range(count):
+        speed = rng.uniform(2, 5)
+        angle = rng.uniform(0, 2 * math.pi)
+        system.add(
+            x=rng.randint(0, max(0, int(system.width))),
+            y=rng.randint(-100, -10),
+            vx=math.cos(angle) * speed,
+            vy=math.sin(angle) * speed + rng.uniform(1, 3),
+            size=rng.randint(5, 15),
+            color=rng.choice(colors)
+        )
+    system.start()
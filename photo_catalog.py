@@ -0,0 +1,247 @@
+"""Sıkışık, indeksli fotoğraf kataloğu.
+
+Her fotoğrafa kararlı bir tam sayı ID verilir. Yol bir listede; çekim tarihi
+paketlenmiş tam sayı zaman damgası (mikrosaniye) olarak, tarama sırası ve
+taramadaki dosya boyutu `array('q')` dizilerinde saklanır; dosya adı yoldan
+türetilir. Böylece milyonlarca kayıt için fotoğraf başına `(yol, datetime, ad)` tuple'ı ve
+datetime nesnesi tutulmaz. Görünümler (sıralı liste, swipe listesi, silinenler)
+bu ID'leri tutar; yol -> ID ve ID -> sıradaki konum aramaları O(1)'dir.
+
+Tarama sürerken kayıtlar geldikçe ikili arama ile sıralı yerlerine eklenir;
+büyük gruplar birleştirilip tek seferde sıralanır. Eşit tarihlerde taramadaki
+sıra korunur, yani sonuç tüm listeyi `sort(key=tarih, reverse=...)` ile
+sıralamakla birebir aynıdır.
+"""
+import os
+from array import array
+from bisect import bisect_left, bisect_right
+from collections.abc import Sequence
+from datetime import datetime, timedelta
+
+# Bu boyuttan büyük gruplar tek tek eklemek yerine birleştirilerek sıralanır
+MERGE_BATCH_SIZE = 64
+
+_MICROSECONDS_PER_DAY = 86_400_000_000
+
+
+def _timestamp(date):
+    """datetime'ı karşılaştırılabilir tam sayıya çevir (mikrosaniye)"""
+    seconds = date.toordinal() * 86400 + date.hour * 3600 + date.minute * 60 + date.second
+    return seconds * 1_000_000 + date.microsecond
+
+
+def _datetime(stamp):
+    """_timestamp() ile paketlenmiş zaman damgasını datetime'a geri çevir"""
+    days, microseconds = divmod(stamp, _MICROSECONDS_PER_DAY)
+    return datetime.fromordinal(days) + timedelta(microseconds=microseconds)
+
+
+class PhotoView(Sequence):
+    """Kataloğun sıralı halini `(yol, tarih, dosya adı)` dizisi olarak gösterir
+
+    Tuple'lar yalnızca erişildiğinde üretilir; üyelik ve konum aramaları
+    katalogdaki indeksler üzerinden O(1)'dir.
+    """
+
+    __slots__ = ("_catalog",)
+
+    def __init__(self, catalog):
+        self._catalog = catalog
+
+    def __len__(self):
+        return len(self._catalog.order)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._catalog.photo(photo_id) for photo_id in self._catalog.order[index]]
+        return self._catalog.photo(self._catalog.order[index])
+
+    def __iter__(self):
+        photo = self._catalog.photo
+        for photo_id in self._catalog.order:
+            yield photo(photo_id)
+
+    def __contains__(self, photo):
+        return self._catalog.id_of(photo[0]) is not None
+
+    def index(self, photo, start=0, stop=None):
+        position = self._catalog.position(self._catalog.id_of(photo[0]))
+        if position is None or position < start or (stop is not None and position >= stop):
+            raise ValueError(f"{photo[0]} katalogda yok")
+        return position
+
+
+class PhotoCatalog:
+    """Fotoğrafları kararlı ID'lerle saklayan ve tarihe göre sıralı tutan katalog
+
+    `order` tarihe göre sıralı ID dizisidir, `photos` ise aynı sıranın tuple
+    görünümüdür. `reset()` sıralamayı temizler ama ID'leri korur; böylece
+    yeniden taramada aynı yoldaki dosya aynı ID'yi alır ve ID tutan görünümler
+    (ör. silinenler) geçerli kalır.
+    """
+
+    def __init__(self, reverse=False):
+        self.reverse = reverse
+        self._paths = []  # ID -> yol
+        self._stamps = array("q")  # ID -> paketlenmiş çekim zamanı (mikrosaniye)
+        self._seqs = array("q")  # ID -> tarama sırası (eşit tarihlerde sıralama)
+        self._sizes = array("q")  # ID -> taramadaki dosya boyutu (bilinmiyorsa -1)
+        self._ids = {}  # yol -> ID
+        self._hashes = {}  # ID -> algısal hash (benzer fotoğraf gruplaması için)
+        self.order = array("q")  # Tarihe göre sıralı ID'ler
+        self._keys = array("q")  # order ile paralel zaman damgaları (ters sırada negatif)
+        self._positions = None  # ID -> order'daki konum (gerektiğinde yeniden kurulur)
+        self.photos = PhotoView(self)
+
+    def __len__(self):
+        return len(self.order)
+
+    def reset(self, reverse=None):
+        """Sıralı listeyi boşalt (ID'ler korunur); yeni tarama için"""
+        if reverse is not None:
+            self.reverse = reverse
+        self.order = array("q")
+        self._keys = array("q")
+        self._positions = None
+        self._hashes.clear()  # Dosyalar taramalar arasında değişmiş olabilir
+
+    # --- Kayıt erişimi --------------------------------------------------
+
+    def id_of(self, photo_path):
+        """Yolun ID'si (katalogda yoksa None)"""
+        return self._ids.get(photo_path)
+
+    def path(self, photo_id):
+        return self._paths[photo_id]
+
+    def name(self, photo_id):
+        return os.path.basename(self._paths[photo_id])
+
+    def date(self, photo_id):
+        return _datetime(self._stamps[photo_id])
+
+    def photo(self, photo_id):
+        """ID'nin `(yol, tarih, dosya adı)` kaydı"""
+        photo_path = self._paths[photo_id]
+        return (photo_path, _datetime(self._stamps[photo_id]), os.path.basename(photo_path))
+
+    def size(self, photo_id):
+        """ID'nin taramadaki dosya boyutu (bilinmiyorsa None)"""
+        size = self._sizes[photo_id]
+        return size if size >= 0 else None
+
+    def hash(self, photo_id):
+        """ID'nin algısal hash'i (henüz hesaplanmadıysa None)"""
+        return self._hashes.get(photo_id)
+
+    def position(self, photo_id):
+        """ID'nin sıralı listedeki konumu (listede değilse None)"""
+        if photo_id is None:
+            return None
+        if self._positions is None:
+            positions = array("q", [-1]) * len(self._paths)
+            for position, listed_id in enumerate(self.order):
+                positions[listed_id] = position
+            self._positions = positions
+        position = self._positions[photo_id] if photo_id < len(self._positions) else -1
+        return position if position >= 0 else None
+
+    def ids(self, exclude=()):
+        """Sıralı ID'ler; exclude (ID kümesi) verilirse onlar hariç"""
+        if not exclude:
+            return array("q", self.order)
+        return array("q", (photo_id for photo_id in self.order if photo_id not in exclude))
+
+    # --- Güncelleme -----------------------------------------------------
+
+    def _stamp_key(self, photo_id):
+        stamp = self._stamps[photo_id]
+        return -stamp if self.reverse else stamp
+
+    def _sort_key(self, photo_id):
+        return (self._stamp_key(photo_id), self._seqs[photo_id])
+
+    def _store(self, seq, photo_path, date, size):
+        """Kaydı sakla ve ID'sini döndür (bilinen yol aynı ID'yi korur)"""
+        stamp = _timestamp(date)
+        size = -1 if size is None else size
+        photo_id = self._ids.get(photo_path)
+        if photo_id is None:
+            photo_id = len(self._paths)
+            self._paths.append(photo_path)
+            self._stamps.append(stamp)
+            self._seqs.append(seq)
+            self._sizes.append(size)
+            self._ids[photo_path] = photo_id
+        else:
+            self._stamps[photo_id] = stamp
+            self._seqs[photo_id] = seq
+            self._sizes[photo_id] = size
+        return photo_id
+
+    def _insert_position(self, photo_id, low=0):
+        """ID'nin order'daki sıralı yeri (low'dan itibaren)
+
+        Tarih aralığı C'deki bisect ile bulunur; eşit tarihler arasında
+        tarama sırasına göre ikili arama yapılır.
+        """
+        key = self._stamp_key(photo_id)
+        low = bisect_left(self._keys, key, low)
+        high = bisect_right(self._keys, key, low)
+        seq = self._seqs[photo_id]
+        while low < high:
+            middle = (low + high) // 2
+            if seq < self._seqs[self.order[middle]]:
+                high = middle
+            else:
+                low = middle + 1
+        return low
+
+    def add(self, records):
+        """Tarayıcıdan gelen [(sıra, yol, tarih, dosya adı, boyut), ...] kayıtlarını ekle"""
+        if not records:
+            return
+        self._positions = None
+        new_ids = [self._store(seq, photo_path, date, size) for seq, photo_path, date, _, size in records]
+        if len(new_ids) <= MERGE_BATCH_SIZE:
+            for photo_id in new_ids:
+                position = self._insert_position(photo_id)
+                self.order.insert(position, photo_id)
+                self._keys.insert(position, self._stamp_key(photo_id))
+            return
+        # Büyük gruplar: yalnızca yeni kayıtlar sıralanır ve mevcut diziyle
+        # birleştirilir (mevcut kayıtların anahtarları yeniden hesaplanmaz,
+        # aradaki bloklar dilim olarak kopyalanır)
+        new_ids.sort(key=self._sort_key)
+        order, keys = array("q"), array("q")
+        start = 0
+        for photo_id in new_ids:
+            position = self._insert_position(photo_id, start)
+            order.extend(self.order[start:position])
+            keys.extend(self._keys[start:position])
+            order.append(photo_id)
+            keys.append(self._stamp_key(photo_id))
+            start = position
+        order.extend(self.order[start:])
+        keys.extend(self._keys[start:])
+        self.order, self._keys = order, keys
+
+    def set_hashes(self, pairs):
+        """[(ID, algısal hash), ...] değerlerini sakla"""
+        self._hashes.update(pairs)
+
+    def rename(self, moves):
+        """{eski_yol: yeni_yol} yeniden adlandırmalarını yerinde uygula
+
+        Çekim tarihi değişmediği için ID'ler, sıra ve konumlar korunur;
+        maliyet yalnızca taşınan dosya sayısıyla orantılıdır.
+        """
+        # Zincir ve takaslarda (A -> B, B -> A) yeni yol eski bir yolla aynı
+        # olabilir: önce tüm eski yollar çıkarılır, sonra yenileri eklenir
+        renamed = [
+            (self._ids.pop(old_path), new_path)
+            for old_path, new_path in moves.items() if old_path in self._ids
+        ]
+        for photo_id, new_path in renamed:
+            self._paths[photo_id] = new_path
+            self._ids[new_path] = photo_id
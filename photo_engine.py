@@ -0,0 +1,130 @@
+"""Arayüzden bağımsız sıralama motoru.
+
+Tarama, tarihe göre sıralama, yeniden adlandırma planı, günlüklü uygulama ve
+geri alma işlemlerini tek yerde toplar. Masaüstü uygulaması ve komut satırı
+aracı (`photo_sorter_cli.py`) aynı fonksiyonları kullanır. Bu modül ve
+bağımlılıkları tkinter/customtkinter yüklemez; PIL yalnızca başlık
+okuyucunun desteklemediği formatlarda gerektiğinde yüklenir.
+"""
+import photo_scanner
+from metadata_index import MetadataIndex
+from photo_catalog import PhotoCatalog
+from rename_journal import RenameJournal
+from rename_planner import plan_moves, plan_renames
+
+
+def open_index(enabled=True):
+    """Kalıcı metadata indeksini aç (kapalıysa veya açılamazsa None)"""
+    if not enabled:
+        return None
+    try:
+        return MetadataIndex()
+    except Exception:
+        return None
+
+
+def open_journal(enabled=True):
+    """Yeniden adlandırma günlüğünü aç (kapalıysa veya açılamazsa None)"""
+    if not enabled:
+        return None
+    try:
+        return RenameJournal()
+    except Exception:
+        return None
+
+
+def scan_sorted(folder, reverse=False, workers=1, index=None, cancel=None, progress=None):
+    """Klasörü tara ve tarihe göre sıralı `(yol, tarih, dosya adı)` dizisi döndür
+
+    Tüm kayıtlar toplandıktan sonra tek seferde sıralanır (çok büyük
+    ağaçlarda artımlı eklemeden hızlı). Dönen dizi kataloğun görünümüdür;
+    tuple'lar yalnızca erişildiğinde üretilir. progress(bulunan) her grupta
+    çağrılır.
+    """
+    records = []
+    for batch in photo_scanner.iter_scan(folder, workers=workers, index=index, cancel=cancel):
+        records.extend(batch)
+        if progress is not None:
+            progress(len(records))
+    catalog = PhotoCatalog(reverse=reverse)
+    catalog.add(records)
+    return catalog.photos
+
+
+def execute_plan(plan, journal=None, kind="apply", folder=None, undoes=None,
+                 check=None, progress=None):
+    """Planı önce günlüğe yazıp yürüt
+
+    Günlük yoksa plan doğrudan yürütülür. İptal veya hata durumunda da
+    yapılan adımlar commit edilir; geçici adda dosya kalmışsa grup yarım
+    bırakılır ve bir sonraki kurtarmada tamamlanır ya da geri sarılır.
+    """
+    if journal is None or not plan.steps:
+        plan.execute(check=check, progress=progress)
+        return plan
+    writer = journal.begin(plan, kind, folder, undoes=undoes)
+    plan.journal_id = writer.id
+
+    def on_step(done, total):
+        writer.progress(done)
+        if progress is not None:
+            progress(done, total)
+
+    try:
+        plan.execute(check=check, progress=on_step)
+    finally:
+        writer.finish(plan)
+    return plan
+
+
+def plan_undo(moves):
+    """[(eski_yol, yeni_yol), ...] taşımalarını geri alan planı oluştur"""
+    return plan_moves([(new_path, old_path) for old_path, new_path in moves])
+
+
+def record_renames(index, moves):
+    """Yeniden adlandırmaları metadata indeksine yansıt (tarihler yeniden okunmaz)"""
+    if index is not None and moves:
+        try:
+            index.rename(moves)
+        except Exception:
+            # İndeks yalnızca hızlandırma amaçlı - sonraki tarama düzeltir
+            pass
+
+
+def apply_order(photos, journal=None, index=None, folder=None, check=None, progress=None):
+    """Sıralı listeyi `IMG_0001...` adlarına günlüklü olarak uygula; planı döndürür"""
+    plan = plan_renames(photos)
+    try:
+        execute_plan(plan, journal, "apply", folder, check=check, progress=progress)
+    finally:
+        record_renames(index, plan.completed_moves())
+    return plan
+
+
+def undo_last(journal, index=None, check=None, progress=None):
+    """Günlükteki son uygulamayı (önceki oturumlar dahil) geri al
+
+    Geri alınacak bir şey yoksa None, varsa yürütülen planı döndürür.
+    """
+    undoable = journal.undoable()
+    if undoable is None:
+        return None
+    batch, moves = undoable
+    plan = plan_undo(moves)
+    try:
+        execute_plan(plan, journal, "undo", batch.folder, undoes=batch.id,
+                     check=check, progress=progress)
+    finally:
+        record_renames(index, plan.completed_moves())
+    return plan
+
+
+def recover(journal, forward, index=None, progress=None):
+    """Yarıda kalmış tüm grupları ileri veya geri sar; taşımaları döndürür"""
+    moves = []
+    for batch in journal.incomplete():
+        plan = journal.recover(batch, forward, progress=progress)
+        moves.extend(plan.completed_moves())
+    record_renames(index, moves)
+    return moves
@@ -0,0 +1,249 @@
+"""Klasör tarama ve çekim tarihi çıkarma (arayüzden bağımsız).
+
+Tarih çıkarma işi büyük klasörlerde bir process havuzuna parçalar halinde
+dağıtılabilir. Paralel yol, seri yolla aynı fonksiyonu (`get_photo_date`)
+kullandığı için sonuçlar (dosya tarihi ve `datetime.now()` yedekleri dahil)
+birebir aynıdır.
+
+Bir `MetadataIndex` verilirse yalnızca yeni veya (boyut, mtime_ns) değişmiş
+dosyalar için tarih çıkarılır; diğerleri indeksten okunur.
+
+Tarama `os.scandir` ile akış halinde yapılır: kayıtlar bulundukça gruplar
+halinde üretilir, böylece arayüz tarama bitmeden sonuçları gösterebilir.
+"""
+import os
+import time
+from collections import deque
+from datetime import datetime
+from pathlib import Path
+
+from exif_reader import (
+    HEADER_EXTENSIONS, TAG_DATETIME, TAG_DATETIME_DIGITIZED, TAG_DATETIME_ORIGINAL,
+    TAG_EXIF_IFD, parse_exif_datetime, read_exif_date
+)
+
+# Desteklenen formatlar
+PHOTO_EXTENSIONS = {'.jpg', '.jpeg', '.png', '.gif', '.bmp', '.tiff', '.tif', '.heic', '.webp'}
+
+# Process havuzu, tarihi çıkarılacak dosya sayısı buna ulaşınca başlatılır
+# (küçük klasörlerde process başlatma maliyeti kazançtan büyük)
+PARALLEL_SCAN_MIN_FILES = 2000
+
+# Her worker'a tek seferde gönderilen dosya sayısı
+SCAN_CHUNK_SIZE = 256
+
+
+def default_scan_workers():
+    """PHOTO_SORTER_SCAN_WORKERS ortam değişkeni veya çekirdek sayısı"""
+    value = os.environ.get("PHOTO_SORTER_SCAN_WORKERS")
+    if value:
+        try:
+            return max(1, int(value))
+        except ValueError:
+            pass
+    return os.cpu_count() or 1
+
+
+def get_photo_date(photo_path, mtime=None):
+    """Fotoğrafın çekilme tarihini alır (EXIF veya dosya tarihi)
+
+    Tarama sırasında alınmış mtime verilirse dosya tarihi için tekrar stat yapılmaz.
+    """
+    try:
+        # EXIF tarihini yalnızca dosya başlığından oku (JPEG/TIFF/PNG/WebP)
+        date_obj = read_exif_date(photo_path)
+        if date_obj is not None:
+            return date_obj
+
+        # Başlık okuyucunun desteklemediği formatlar için PIL'e başvur
+        if Path(photo_path).suffix.lower() not in HEADER_EXTENSIONS:
+            date_obj = get_photo_date_pil(photo_path)
+            if date_obj is not None:
+                return date_obj
+
+        # EXIF yoksa dosya oluşturulma tarihini kullan
+        file_time = mtime if mtime is not None else os.path.getmtime(photo_path)
+        return datetime.fromtimestamp(file_time)
+
+    except Exception:
+        # Hata durumunda dosya tarihini kullan
+        try:
+            file_time = os.path.getmtime(photo_path)
+            return datetime.fromtimestamp(file_time)
+        except Exception:
+            return datetime.now()
+
+
+def get_photo_date_pil(photo_path):
+    """EXIF tarihini PIL ile oku (etiketler ID ile aranır, bulunamazsa None)"""
+    from PIL import Image
+
+    try:
+        exif = Image.open(photo_path).getexif()
+    except Exception:
+        return None
+    if not exif:
+        return None
+    exif_ifd = exif.get_ifd(TAG_EXIF_IFD)
+    for ifd, tag in ((exif_ifd, TAG_DATETIME_ORIGINAL),
+                     (exif_ifd, TAG_DATETIME_DIGITIZED),
+                     (exif, TAG_DATETIME)):
+        value = ifd.get(tag)
+        if value:
+            date_obj = parse_exif_datetime(value)
+            if date_obj is not None:
+                return date_obj
+    return None
+
+
+def iter_photo_entries(folder):
+    """Klasörü os.scandir ile os.walk sırasıyla gez: (yol, dosya adı, stat) üretir
+
+    Dizin kayıtlarının taşıdığı tür bilgisi kullanılır; stat alınamayan
+    dosyalarda stat None olur.
+    """
+    stack = [folder]
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as iterator:
+                entries = list(iterator)
+        except OSError:
+            continue
+        subdirs = []
+        for entry in entries:
+            try:
+                is_dir = entry.is_dir()
+            except OSError:
+                is_dir = False
+            if is_dir:
+                # os.walk gibi sembolik bağlantılı klasörlere girme
+                if not entry.is_symlink():
+                    subdirs.append(entry.path)
+                continue
+            if Path(entry.name).suffix.lower() not in PHOTO_EXTENSIONS:
+                continue
+            try:
+                st = entry.stat()
+            except OSError:
+                st = None
+            yield entry.path, entry.name, st
+        # Alt klasörleri sırayla (derinlik öncelikli) gez
+        stack.extend(reversed(subdirs))
+
+
+def _date_chunk(items):
+    """Worker process'te bir dosya grubunun tarihlerini çıkar: [(yol, mtime), ...]"""
+    return [get_photo_date(path, mtime) for path, mtime in items]
+
+
+def iter_scan(folder, workers=1, index=None, cancel=None, flush_interval=0.2):
+    """Klasörü akış halinde tara; hazır kayıtları gruplar halinde üretir
+
+    Her kayıt (sıra, yol, tarih, dosya adı, boyut) biçimindedir; sıra os.walk
+    sırasındaki konumdur ve eşit tarihlerde sıralamayı belirler. Boyut
+    taramadaki stat'tan gelir (alınamadıysa None). Kayıtlar
+    bulundukça (indeksten gelenler hemen, diğerleri tarihleri çıkarıldıkça)
+    en geç flush_interval saniyede bir üretilir. cancel (threading.Event)
+    ayarlanırsa tarama durur.
+    """
+    known = index.load_folder(folder) if index is not None else {}
+    seen = set()
+    ready = []  # Üretilmeyi bekleyen kayıtlar
+    chunk = []  # Tarihi çıkarılacak (sıra, yol, dosya adı, stat)
+    futures = deque()  # (chunk, future)
+    index_updates = []
+    misses = 0
+    executor = None
+    last_flush = time.monotonic()
+    completed = False
+
+    def finish_chunk(items, dates):
+        for (seq, photo_path, name, st), date in zip(items, dates):
+            ready.append((seq, photo_path, date, name, st.st_size if st is not None else None))
+            if st is not None:
+                index_updates.append((photo_path, st.st_size, st.st_mtime_ns, date))
+
+    def dispatch(items):
+        nonlocal executor
+        if executor is None and workers > 1 and misses >= PARALLEL_SCAN_MIN_FILES:
+            # multiprocessing yalnızca gerektiğinde yüklenir (açılışı yavaşlatmaz)
+            import multiprocessing
+            from concurrent.futures import ProcessPoolExecutor
+            # Tarama bir iş thread'inde, thumbnail worker'larının yanında çalışır:
+            # fork, başka thread'lerin tuttuğu kilitleri çocuğa kopyalayıp
+            # kilitlenmeye yol açabilir. Worker'lar temiz bir süreçten başlatılır.
+            methods = multiprocessing.get_all_start_methods()
+            context = multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+            try:
+                executor = ProcessPoolExecutor(max_workers=workers, mp_context=context)
+            except OSError:
+                executor = False  # Process başlatılamıyor - seri devam et
+        args = [(photo_path, st.st_mtime if st is not None else None)
+                for _, photo_path, _, st in items]
+        if executor:
+            futures.append((items, executor.submit(_date_chunk, args)))
+        else:
+            finish_chunk(items, _date_chunk(args))
+
+    def collect(block=False):
+        while futures and (block or futures[0][1].done()):
+            from concurrent.futures.process import BrokenProcessPool
+
+            items, future = futures.popleft()
+            try:
+                dates = future.result()
+            except BrokenProcessPool:
+                dates = _date_chunk([(photo_path, st.st_mtime if st is not None else None)
+                                     for _, photo_path, _, st in items])
+            finish_chunk(items, dates)
+
+    try:
+        for seq, (photo_path, name, st) in enumerate(iter_photo_entries(folder)):
+            if cancel is not None and cancel.is_set():
+                return
+            abs_path = os.path.abspath(photo_path)
+            seen.add(abs_path)
+            record = known.get(abs_path)
+            if record is not None and st is not None \
+                    and record[0] == st.st_size and record[1] == st.st_mtime_ns:
+                ready.append((seq, photo_path, record[2], name, st.st_size))
+            else:
+                chunk.append((seq, photo_path, name, st))
+                misses += 1
+                if len(chunk) >= SCAN_CHUNK_SIZE:
+                    dispatch(chunk)
+                    chunk = []
+            collect()
+            if ready and time.monotonic() - last_flush >= flush_interval:
+                yield ready
+                ready = []
+                last_flush = time.monotonic()
+
+        if chunk:
+            dispatch(chunk)
+        while futures:
+            if cancel is not None and cancel.is_set():
+                return
+            collect(block=True)
+            if ready:
+                yield ready
+                ready = []
+        if ready:
+            yield ready
+        completed = True
+    finally:
+        if executor:
+            executor.shutdown(wait=False, cancel_futures=True)
+        if index is not None:
+            # Çıkarılan tarihler iptal durumunda da kaydedilir
+            index.update(index_updates)
+            if completed:
+                index.remove([path for path in known if path not in seen])
+
+
+def scan_photos(folder, workers=1, index=None):
+    """Klasörü tara: [(yol, tarih, dosya adı), ...] (sıralanmamış, os.walk sırasıyla)"""
+    records = [record for batch in iter_scan(folder, workers, index) for record in batch]
+    records.sort(key=lambda record: record[0])
+    return [(photo_path, date, name) for _, photo_path, date, name, _ in records]
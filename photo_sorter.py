@@ -1,11 +1,24 @@
+from startup_profile import PROFILE as STARTUP_PROFILE
 import customtkinter as ctk
 from tkinter import filedialog, messagebox, Canvas
-from PIL import Image, ExifTags
 import os
-from datetime import datetime
-from pathlib import Path
-import random
-import math
+from array import array
+from functools import partial
+from thumbnail_cache import ThumbnailCache, DEFAULT_MAX_BYTES, DEFAULT_PREVIEW_MAX_BYTES, PREVIEWS_NAME
+from thumbnail_pipeline import ThumbnailPipeline
+from swipe_prefetch import SwipePrefetcher
+import photo_scanner
+from metadata_index import MetadataIndex
+from photo_catalog import PhotoCatalog
+from background_jobs import JobCancelled, JobRunner
+from rename_planner import plan_renames
+from rename_journal import RenameJournal
+import photo_engine
+from theme import ThemeRegistry
+from particles import ParticleSystem, confetti_burst
+from virtual_gallery import VirtualGallery
+
+STARTUP_PROFILE.mark("imports")
 
 # macOS benzeri tema ayarları
 ctk.set_appearance_mode("light")
@@ -51,26 +64,218 @@ MACOS_COLORS_DARK = {
 # Başlangıçta light mode
 MACOS_COLORS = MACOS_COLORS_LIGHT
 
+# Önizleme boyutları (genişlik, yükseklik)
+THUMBNAIL_SIZE = (240, 240)  # Galeri kartları
+SWIPE_MASTER_SIZE = (2048, 2048)  # Swipe modu ana önizlemesi (container'a buradan ölçeklenir)
+
+# Swipe modunda önden hazırlanan sonraki/önceki fotoğraf sayısı ve bellekteki kare sayısı
+SWIPE_PREFETCH_AHEAD = 3
+SWIPE_PREFETCH_BEHIND = 1
+SWIPE_FRAME_CACHE_SIZE = 12
+
+# Pencere boyutlandırılırken olayların birleştirildiği bekleme süresi (ms)
+SWIPE_RESIZE_DEBOUNCE_MS = 120
+
+# Swipe tuvali: sürükleme ve animasyonlarda kare süresi (~60 FPS) ve
+# yuvarlatılmış kenarlığın görünmesi için kart alanından içeride bırakılan boşluk
+SWIPE_FRAME_MS = 16
+SWIPE_CANVAS_INSET = 20
+
+# Benzer fotoğraf grubu şeridi: küçük önizleme boyutu ve aynı anda gösterilen üye sayısı
+SWIPE_GROUP_THUMB_SIZE = (64, 64)
+SWIPE_GROUP_STRIP_MAX = 12
+SWIPE_GROUP_THUMB_GROUP = "swipe-group"
+
+# Swipe gruplama türleri: (buton metni, simge, grup üyesinin adı)
+SWIPE_GROUP_MODES = {
+    "similar": ("🧩 Benzerleri Grupla", "🧩", "benzer"),
+    "duplicates": ("🧬 Kopyaları Bul", "🧬", "kopya"),
+}
+
+# Tarih çıkarma için process sayısı - PHOTO_SORTER_SCAN_WORKERS ile değiştirilebilir
+SCAN_WORKERS = photo_scanner.default_scan_workers()
+
+# Arka plan işlerinin olaylarının arayüze aktarılma aralığı (ms)
+JOB_POLL_INTERVAL_MS = 50
+
+# Thumbnail önbelleği bütçesi (MB) - PHOTO_SORTER_CACHE_MB ile değiştirilebilir
+THUMBNAIL_CACHE_MAX_BYTES = int(
+    os.environ.get("PHOTO_SORTER_CACHE_MB", DEFAULT_MAX_BYTES // (1024 * 1024))
+) * 1024 * 1024
+
+# Büyük önizleme (swipe, büyük görünüm, döşemeler) önbelleği bütçesi (MB) -
+# PHOTO_SORTER_PREVIEW_CACHE_MB ile değiştirilebilir
+PREVIEW_CACHE_MAX_BYTES = int(
+    os.environ.get("PHOTO_SORTER_PREVIEW_CACHE_MB", DEFAULT_PREVIEW_MAX_BYTES // (1024 * 1024))
+) * 1024 * 1024
+
+
+def format_duration(seconds):
+    """Saniyeyi kısa okunur metne çevir ("45 sn", "3 dk 05 sn")"""
+    seconds = int(round(seconds))
+    if seconds < 60:
+        return f"{max(seconds, 1)} sn"
+    minutes, seconds = divmod(seconds, 60)
+    if minutes < 60:
+        return f"{minutes} dk {seconds:02d} sn"
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours} sa {minutes:02d} dk"
+
+
 class PhotoSorterApp(ctk.CTk):
     def __init__(self):
         super().__init__()
+        STARTUP_PROFILE.mark("window")
         
         self.title("Fotoğraf Tarih Sıralayıcı")
         self.geometry("1400x900")
         self.minsize(1000, 700)
         self.selected_folder = None
-        self.photos = []
+        self.catalog = PhotoCatalog()  # Fotoğraf kayıtları (kararlı tam sayı ID'lerle)
+        self.photos = self.catalog.photos  # Kataloğun sıralı (yol, tarih, ad) görünümü
         self.backup_info = []  # Geri alma için yedek bilgiler
+        self.undo_batch_id = None  # backup_info'nun ait olduğu günlük grubu
         self.is_dark_mode = False  # Karanlık mod durumu
         self.current_view = "gallery"  # "gallery" veya "swipe"
-        self.deleted_photos = []  # Silinen fotoğraflar (geri getirme için)
+        self.deleted_photos = set()  # Silinen fotoğrafların ID'leri (geri getirme için)
         self.current_swipe_index = 0  # Swipe modunda gösterilen fotoğraf indeksi
-        self.swipe_photos = []  # Swipe modunda kullanılacak fotoğraflar
+        self.swipe_photos = []  # Swipe modunda gösterilecek fotoğrafların ID'leri
+        self.swipe_group_mode = None  # Swipe gruplaması: None, "similar" (benzer) veya "duplicates" (aynı dosya)
+        self.swipe_group_of = {}  # ID -> grubunun ilk üyesinin ID'si
+        self.swipe_groups = {}  # Grubun ilk üyesinin ID'si -> sıralı üye ID'leri
+        self.active_job = None  # Devam eden arka plan işi (tarama, uygulama, geri alma)
+        self.previews_paused = False  # Yeniden adlandırma sürerken önizlemeler yüklenmez
+        self.job_poll_pending = False
+        
+        # Kalıcı thumbnail önbelleği (açılamazsa önizlemeler doğrudan üretilir)
+        try:
+            self.thumbnail_cache = ThumbnailCache(max_bytes=THUMBNAIL_CACHE_MAX_BYTES)
+        except Exception:
+            self.thumbnail_cache = None
+        
+        # Büyük önizlemeler ayrı bütçeyle saklanır (galeri thumbnail'lerini LRU'dan atmasın)
+        try:
+            self.preview_cache = ThumbnailCache(max_bytes=PREVIEW_CACHE_MAX_BYTES, name=PREVIEWS_NAME)
+        except Exception:
+            self.preview_cache = None
+        
+        # Kalıcı metadata indeksi (yeniden taramada değişmeyen dosyalar okunmaz)
+        try:
+            self.metadata_index = MetadataIndex()
+        except Exception:
+            self.metadata_index = None
+        
+        # Yeniden adlandırmaların diskteki günlüğü (çökme sonrası kurtarma, kalıcı geri alma)
+        try:
+            self.rename_journal = RenameJournal()
+        except Exception:
+            self.rename_journal = None
+        
+        # Thumbnail'leri arka planda üreten worker havuzu
+        self.thumbnail_pipeline = ThumbnailPipeline()
+        
+        # Büyük görünüm penceresi ilk açılışta oluşturulur
+        self.photo_viewer = None
+        
+        # Swipe modunda sonraki/önceki fotoğrafları önden hazırlayan kare önbelleği
+        self.swipe_prefetcher = SwipePrefetcher(
+            self,
+            self.thumbnail_pipeline,
+            self.load_swipe_master,
+            self.scale_swipe_frame,
+            make_image=self.make_swipe_image,
+            ahead=SWIPE_PREFETCH_AHEAD,
+            behind=SWIPE_PREFETCH_BEHIND,
+            capacity=SWIPE_FRAME_CACHE_SIZE
+        )
+        
+        # Tarama ve yeniden adlandırma işlerini arayüzü kilitlemeden yürütür
+        self.jobs = JobRunner()
+        STARTUP_PROFILE.mark("stores")
+        
+        # Tema değişince yerinde yeniden renklendirilecek widget'ların kaydı
+        self.theme = ThemeRegistry(MACOS_COLORS)
         
         # macOS benzeri arka plan rengi
         self.configure(fg_color=MACOS_COLORS['background'])
+        self.theme.register(self, fg_color="background")
         
         self.create_widgets()
+        STARTUP_PROFILE.mark("widgets")
+        
+        self.protocol("WM_DELETE_WINDOW", self.on_close)
+        
+        # Önceki oturumdan yarım kalan veya geri alınabilir işlemleri ara
+        self.after(200, self.check_rename_journal)
+        
+        # İlk boşta anı: pencere çizildi ve olay döngüsü etkileşime hazır
+        if STARTUP_PROFILE.enabled:
+            self.after_idle(self.on_startup_ready)
+    
+    def on_startup_ready(self):
+        """Açılış süresini raporla (PHOTO_SORTER_STARTUP_PROFILE ayarlıysa)"""
+        STARTUP_PROFILE.mark("ready")
+        STARTUP_PROFILE.report()
+        if STARTUP_PROFILE.exit_when_ready:
+            self.on_close()
+    
+    def on_close(self):
+        """Pencere kapatılırken worker'ları durdur, indeksi ve önbelleği kapat"""
+        # İşleri iptal et; yarım kalan yeniden adlandırmanın bitmesini bekle
+        self.jobs.shutdown(timeout=5)
+        self.thumbnail_pipeline.shutdown()
+        if self.metadata_index is not None:
+            try:
+                self.metadata_index.close()
+            except Exception:
+                pass
+            self.metadata_index = None
+        for cache in (self.thumbnail_cache, self.preview_cache):
+            if cache is not None:
+                try:
+                    cache.close()
+                except Exception:
+                    pass
+        self.thumbnail_cache = self.preview_cache = None
+        self.destroy()
+    
+    def get_preview(self, photo_path, size, allow_upscale=True, cache=None):
+        """Önizlemeyi önbellekten al, yoksa çözücü ölçeklemesiyle oluşturup kaydet
+        
+        cache verilmezse galeri thumbnail önbelleği kullanılır.
+        """
+        # Görsel çözme katmanı ilk önizlemede yüklenir (açılışı yavaşlatmaz)
+        from preview_loader import load_preview
+        
+        cache = cache or self.thumbnail_cache
+        if cache is None:
+            return load_preview(photo_path, size, allow_upscale)
+        return cache.get_or_create(
+            photo_path, size,
+            lambda path, box: load_preview(path, box, allow_upscale)
+        )
+    
+    def get_large_preview(self, photo_path, size):
+        """Swipe ve büyük görünüm önizlemesi (büyük önizleme önbelleğinden)"""
+        if self.preview_cache is None:
+            from preview_loader import load_preview
+            
+            return load_preview(photo_path, size, allow_upscale=False)
+        return self.get_preview(photo_path, size, allow_upscale=False, cache=self.preview_cache)
+    
+    def get_quick_preview(self, photo_path, size):
+        """Hızlı önizleme: (görsel veya None, nihai mi?)
+        
+        Önbellekte kalıcı thumbnail varsa o döner; yoksa EXIF'e gömülü küçük
+        önizleme geçici olarak kullanılır.
+        """
+        from preview_loader import load_embedded_preview
+        
+        if self.thumbnail_cache is not None:
+            img = self.thumbnail_cache.get(photo_path, size)
+            if img is not None:
+                return img, True
+        return load_embedded_preview(photo_path, size), False
     
     def toggle_dark_mode(self):
         """Karanlık modu aç/kapat"""
@@ -84,49 +289,17 @@ class PhotoSorterApp(ctk.CTk):
             ctk.set_appearance_mode("light")
             MACOS_COLORS = MACOS_COLORS_LIGHT
         
-        # Tüm widget'ları yeniden yükle
+        # Mevcut widget'ları yerinde yeniden renklendir
         self.update_colors()
     
     def update_colors(self):
-        """Tüm widget'ların renklerini güncelle"""
-        # Ana pencere
-        self.configure(fg_color=MACOS_COLORS['background'])
-        
-        # Mevcut durumları sakla
-        photos_backup = self.photos.copy()
-        folder_backup = self.selected_folder
-        sort_order_backup = self.sort_order.get() if hasattr(self, 'sort_order') else "ascending"
-        backup_info_backup = self.backup_info.copy()
-        current_view_backup = self.current_view
-        deleted_photos_backup = self.deleted_photos.copy()
-        current_swipe_index_backup = self.current_swipe_index
-        
-        # Widget'ları yeniden oluştur
-        for widget in self.winfo_children():
-            widget.destroy()
-        
-        # Durumları geri yükle
-        self.photos = photos_backup
-        self.selected_folder = folder_backup
-        self.backup_info = backup_info_backup
-        self.current_view = current_view_backup
-        self.deleted_photos = deleted_photos_backup
-        self.current_swipe_index = current_swipe_index_backup
-        
-        self.create_widgets()
-        
-        # Sıralama seçeneğini geri yükle
-        if hasattr(self, 'sort_order'):
-            self.sort_order.set(sort_order_backup)
-        
-        # Eğer fotoğraflar yüklüyse, onları da yeniden göster
-        if self.photos:
-            if self.current_view == "gallery":
-                self.display_photos()
-            else:
-                self.swipe_photos = [p for p in self.photos if p not in self.deleted_photos]
-                self.load_swipe_photo()
+        """Kayıtlı widget'ları yeni paletle yerinde yeniden renklendir
         
+        Widget'lar yeniden oluşturulmaz; galeri kartları ve önbellekteki
+        thumbnail'ler aynen kullanılır, süre fotoğraf sayısından bağımsızdır.
+        """
+        self.theme.apply(MACOS_COLORS)
+    
     def create_widgets(self):
         # Apple Music benzeri minimal header - %25 daha büyük
         header_frame = ctk.CTkFrame(
@@ -135,6 +308,7 @@ class PhotoSorterApp(ctk.CTk):
             corner_radius=0,
             height=63  # 50 * 1.25 = 62.5, yaklaşık 63
         )
+        self.theme.register(header_frame, fg_color="surface")
         header_frame.pack(fill="x", padx=0, pady=0)
         header_frame.pack_propagate(False)
         
@@ -145,6 +319,7 @@ class PhotoSorterApp(ctk.CTk):
             font=ctk.CTkFont(size=20, weight="bold"),
             text_color=MACOS_COLORS['text_primary']
         )
+        self.theme.register(title_label, text_color="text_primary")
         title_label.pack(side="left", padx=20, pady=18)
         
         # Sağ üst - Karanlık mod switch (güneş ve ay sembolleri ile)
@@ -158,6 +333,10 @@ class PhotoSorterApp(ctk.CTk):
             font=ctk.CTkFont(size=22),
             text_color="#FF9500" if not self.is_dark_mode else MACOS_COLORS['text_tertiary']
         )
+        self.theme.register(
+            sun_label,
+            text_color=lambda colors: "#FF9500" if not self.is_dark_mode else colors['text_tertiary']
+        )
         sun_label.pack(side="right", padx=(0, 10))
         
         # Switch için beyaz border'lı frame
@@ -184,6 +363,11 @@ class PhotoSorterApp(ctk.CTk):
             button_color=MACOS_COLORS['surface'],
             button_hover_color=MACOS_COLORS['card_hover']
         )
+        self.theme.register(
+            self.dark_mode_switch,
+            fg_color="border", progress_color="primary", button_color="surface",
+            button_hover_color="card_hover"
+        )
         self.dark_mode_switch.pack(padx=2, pady=2)
         
         # Ay sembolü (dark mode)
@@ -193,6 +377,10 @@ class PhotoSorterApp(ctk.CTk):
             font=ctk.CTkFont(size=22),
             text_color=MACOS_COLORS['text_tertiary'] if not self.is_dark_mode else "#FFD700"
         )
+        self.theme.register(
+            moon_label,
+            text_color=lambda colors: colors['text_tertiary'] if not self.is_dark_mode else "#FFD700"
+        )
         moon_label.pack(side="right")
         
         # Sembolleri sakla (güncelleme için)
@@ -211,6 +399,7 @@ class PhotoSorterApp(ctk.CTk):
             fg_color=MACOS_COLORS['background'],
             corner_radius=0
         )
+        self.theme.register(main_container, fg_color="background")
         main_container.pack(fill="both", expand=True, padx=0, pady=0)
         
         # Sol sidebar - Apple Music benzeri
@@ -220,6 +409,7 @@ class PhotoSorterApp(ctk.CTk):
             corner_radius=0,
             width=280
         )
+        self.theme.register(sidebar, fg_color="sidebar")
         sidebar.pack(side="left", fill="y", padx=0, pady=0)
         sidebar.pack_propagate(False)
         
@@ -235,6 +425,7 @@ class PhotoSorterApp(ctk.CTk):
             text_color=MACOS_COLORS['text_tertiary'],
             anchor="w"
         )
+        self.theme.register(folder_section_label, text_color="text_tertiary")
         folder_section_label.pack(fill="x", pady=(0, 8))
         
         self.folder_label = ctk.CTkLabel(
@@ -245,6 +436,7 @@ class PhotoSorterApp(ctk.CTk):
             anchor="w",
             wraplength=240
         )
+        self.theme.register(self.folder_label, text_color="text_secondary")
         self.folder_label.pack(fill="x", pady=(0, 12))
         
         select_btn = ctk.CTkButton(
@@ -258,6 +450,7 @@ class PhotoSorterApp(ctk.CTk):
             hover_color=MACOS_COLORS['primary_hover'],
             corner_radius=8
         )
+        self.theme.register(select_btn, fg_color="primary", hover_color="primary_hover")
         select_btn.pack(fill="x", pady=(0, 30))
         
         # Görünüm seçimi bölümü
@@ -268,6 +461,7 @@ class PhotoSorterApp(ctk.CTk):
             text_color=MACOS_COLORS['text_tertiary'],
             anchor="w"
         )
+        self.theme.register(view_section_label, text_color="text_tertiary")
         view_section_label.pack(fill="x", pady=(0, 8))
         
         view_buttons_frame = ctk.CTkFrame(sidebar_content, fg_color="transparent")
@@ -287,6 +481,11 @@ class PhotoSorterApp(ctk.CTk):
             border_width=1 if self.current_view != "gallery" else 0,
             border_color=MACOS_COLORS['border']
         )
+        self.theme.register(
+            self.gallery_view_btn,
+            fg_color=lambda colors: colors['primary'] if self.current_view == "gallery" else colors['card_hover'],
+            hover_color="primary_hover", text_color="text_primary", border_color="border"
+        )
         self.gallery_view_btn.pack(side="left", padx=(0, 10))
         
         self.swipe_view_btn = ctk.CTkButton(
@@ -303,6 +502,11 @@ class PhotoSorterApp(ctk.CTk):
             border_width=1 if self.current_view != "swipe" else 0,
             border_color=MACOS_COLORS['border']
         )
+        self.theme.register(
+            self.swipe_view_btn,
+            fg_color=lambda colors: colors['primary'] if self.current_view == "swipe" else colors['card_hover'],
+            hover_color="primary_hover", text_color="text_primary", border_color="border"
+        )
         self.swipe_view_btn.pack(side="left")
         
         # Sıralama bölümü
@@ -313,6 +517,7 @@ class PhotoSorterApp(ctk.CTk):
             text_color=MACOS_COLORS['text_tertiary'],
             anchor="w"
         )
+        self.theme.register(sort_section_label, text_color="text_tertiary")
         sort_section_label.pack(fill="x", pady=(0, 12))
         
         self.sort_order = ctk.StringVar(value="ascending")
@@ -326,6 +531,9 @@ class PhotoSorterApp(ctk.CTk):
             hover_color=MACOS_COLORS['primary_hover'],
             text_color=MACOS_COLORS['text_primary']
         )
+        self.theme.register(
+            ascending_radio, fg_color="primary", hover_color="primary_hover", text_color="text_primary"
+        )
         ascending_radio.pack(fill="x", pady=(0, 8))
         
         descending_radio = ctk.CTkRadioButton(
@@ -338,6 +546,9 @@ class PhotoSorterApp(ctk.CTk):
             hover_color=MACOS_COLORS['primary_hover'],
             text_color=MACOS_COLORS['text_primary']
         )
+        self.theme.register(
+            descending_radio, fg_color="primary", hover_color="primary_hover", text_color="text_primary"
+        )
         descending_radio.pack(fill="x", pady=(0, 20))
         
         # Sırala butonu
@@ -352,6 +563,7 @@ class PhotoSorterApp(ctk.CTk):
             hover_color="#30B04F",
             corner_radius=8
         )
+        self.theme.register(sort_btn, fg_color="success")
         sort_btn.pack(fill="x", pady=(0, 30))
         
         # İşlemler bölümü
@@ -362,6 +574,7 @@ class PhotoSorterApp(ctk.CTk):
             text_color=MACOS_COLORS['text_tertiary'],
             anchor="w"
         )
+        self.theme.register(actions_section_label, text_color="text_tertiary")
         actions_section_label.pack(fill="x", pady=(0, 12))
         
         self.apply_btn = ctk.CTkButton(
@@ -376,6 +589,7 @@ class PhotoSorterApp(ctk.CTk):
             corner_radius=8,
             state="disabled"
         )
+        self.theme.register(self.apply_btn, fg_color="primary", hover_color="primary_hover")
         self.apply_btn.pack(fill="x", pady=(0, 12))
         
         self.undo_btn = ctk.CTkButton(
@@ -390,6 +604,7 @@ class PhotoSorterApp(ctk.CTk):
             corner_radius=8,
             state="disabled"
         )
+        self.theme.register(self.undo_btn, fg_color="danger")
         self.undo_btn.pack(fill="x", pady=(0, 12))
         
         # Geri Getir butonu (Swipe modu için)
@@ -405,6 +620,7 @@ class PhotoSorterApp(ctk.CTk):
             corner_radius=8,
             state="disabled"
         )
+        self.theme.register(self.restore_btn, fg_color="secondary")
         self.restore_btn.pack(fill="x", pady=(0, 20))
         
         # Durum etiketi
@@ -415,19 +631,54 @@ class PhotoSorterApp(ctk.CTk):
             text_color=MACOS_COLORS['text_secondary'],
             anchor="w"
         )
+        self.theme.register(self.status_label, text_color="text_secondary")
         self.status_label.pack(fill="x", pady=(0, 0))
         
+        # Arka plan işi ilerlemesi ve iptal butonu (yalnızca iş sürerken görünür)
+        self.job_frame = ctk.CTkFrame(sidebar_content, fg_color="transparent")
+        self.job_progress = ctk.CTkProgressBar(
+            self.job_frame,
+            height=6,
+            progress_color=MACOS_COLORS['primary'],
+            fg_color=MACOS_COLORS['border']
+        )
+        self.theme.register(self.job_progress, progress_color="primary", fg_color="border")
+        self.job_progress.pack(fill="x", pady=(10, 10))
+        self.job_cancel_btn = ctk.CTkButton(
+            self.job_frame,
+            text="İptal",
+            command=self.cancel_active_job,
+            width=240,
+            height=32,
+            font=ctk.CTkFont(size=13, weight="normal"),
+            fg_color=MACOS_COLORS['card_hover'],
+            hover_color=MACOS_COLORS['border'],
+            text_color=MACOS_COLORS['text_primary'],
+            corner_radius=8
+        )
+        self.theme.register(
+            self.job_cancel_btn, fg_color="card_hover", hover_color="border", text_color="text_primary"
+        )
+        self.job_cancel_btn.pack(fill="x")
+        if self.active_job is not None:
+            self.show_job_widgets()
+        
         # Sağ taraf - Ana içerik alanı (Apple Music benzeri)
         self.content_area = ctk.CTkFrame(
             main_container,
             fg_color=MACOS_COLORS['background'],
             corner_radius=0
         )
+        self.theme.register(self.content_area, fg_color="background")
         self.content_area.pack(side="right", fill="both", expand=True, padx=0, pady=0)
         
-        # Görünümleri oluştur
+        # Görünümleri oluştur - swipe görünümü ilk kullanımda oluşturulur
         self.create_gallery_view()
-        self.create_swipe_view()
+        self.swipe_header = None
+        self.swipe_resize_job = None  # Bekleyen yeniden ölçekleme (olaylar birleştirilir)
+        self.swipe_last_box = None  # Son gösterilen karenin kutusu
+        self.swipe_group_images = {}  # Yol -> grup şeridi CTkImage'ı
+        self.swipe_group_poll_job = None
         
         # Başlangıç görünümünü göster
         self.show_current_view()
@@ -448,14 +699,19 @@ class PhotoSorterApp(ctk.CTk):
             text_color=MACOS_COLORS['text_primary'],
             anchor="w"
         )
+        self.theme.register(gallery_title, text_color="text_primary")
         gallery_title.pack(side="left", padx=30, pady=15)
         
-        # Scrollable frame - Apple Music benzeri grid
-        self.scrollable_frame = ctk.CTkScrollableFrame(
+        # Sanal grid - yalnızca görünür satırların kartları oluşturulur
+        self.gallery = VirtualGallery(
             self.content_area,
-            fg_color=MACOS_COLORS['background'],
-            corner_radius=0
+            MACOS_COLORS,
+            self.thumbnail_pipeline,
+            load_thumbnail=lambda path: self.get_preview(path, THUMBNAIL_SIZE),
+            on_open=self.show_large_image,
+            load_quick_thumbnail=lambda path: self.get_quick_preview(path, THUMBNAIL_SIZE)
         )
+        self.theme.add_listener(self.gallery.set_colors)
     
     def create_swipe_view(self):
         """Swipe görünümünü oluştur"""
@@ -473,14 +729,34 @@ class PhotoSorterApp(ctk.CTk):
             text_color=MACOS_COLORS['text_primary'],
             anchor="w"
         )
+        self.theme.register(swipe_title, text_color="text_primary")
         swipe_title.pack(side="left", padx=30, pady=15)
         
+        # Benzer fotoğrafları veya aynı dosyanın kopyalarını grupla (tek kararda ayıklanır)
+        self.swipe_group_btns = {}
+        for mode in ("duplicates", "similar"):
+            button = ctk.CTkButton(
+                self.swipe_header,
+                text=SWIPE_GROUP_MODES[mode][0],
+                command=partial(self.toggle_swipe_grouping, mode),
+                width=170,
+                height=32,
+                font=ctk.CTkFont(size=13, weight="normal"),
+                fg_color=MACOS_COLORS['secondary'],
+                hover_color="#4A4AC4",
+                corner_radius=8
+            )
+            self.theme.register(button, fg_color="secondary")
+            button.pack(side="right", padx=(0, 30) if mode == "duplicates" else (0, 10), pady=15)
+            self.swipe_group_btns[mode] = button
+        
         # Swipe içerik alanı
         self.swipe_content = ctk.CTkFrame(
             self.content_area,
             fg_color=MACOS_COLORS['background'],
             corner_radius=0
         )
+        self.theme.register(self.swipe_content, fg_color="background")
         
         # Fotoğraf gösterim alanı
         self.swipe_photo_container = ctk.CTkFrame(
@@ -490,18 +766,43 @@ class PhotoSorterApp(ctk.CTk):
             border_width=2,
             border_color=MACOS_COLORS['border']
         )
+        self.theme.register(self.swipe_photo_container, fg_color="card", border_color="border")
         self.swipe_photo_container.pack(fill="both", expand=True, padx=50, pady=30)
         
-        # Fotoğraf label'ı - place ile konumlandırılacak (animasyon için)
-        self.swipe_photo_label = ctk.CTkLabel(
+        # Fotoğraf tuvali - kart bir görüntü öğesi olarak çizilir; sürükleme ve
+        # animasyonlar widget yerleştirmek yerine öğeyi coords/move ile taşır
+        self.swipe_canvas = Canvas(
             self.swipe_photo_container,
+            highlightthickness=0,
+            bg=MACOS_COLORS['card']
+        )
+        self.theme.register(self.swipe_canvas, bg="card")
+        self.swipe_canvas.place(
+            relx=0.5, rely=0.5, anchor="center", relwidth=1, relheight=1,
+            width=-2 * SWIPE_CANVAS_INSET, height=-2 * SWIPE_CANVAS_INSET
+        )
+        self.swipe_canvas_size = (0, 0)
+        self.swipe_card_x = 0  # Kartın (görsel ve mesaj öğeleri) yatay merkezi
+        self.swipe_image_item = self.swipe_canvas.create_image(
+            0, 0, anchor="center", state="hidden", tags=("card",)
+        )
+        self.swipe_text_item = self.swipe_canvas.create_text(
+            0, 0, anchor="center", justify="center", tags=("card",),
             text="Fotoğraf yükleniyor...",
             font=ctk.CTkFont(size=16),
-            text_color=MACOS_COLORS['text_secondary'],
-            fg_color="transparent"
+            fill=MACOS_COLORS['text_secondary']
+        )
+        self.swipe_current_image = None  # Gösterilen Tk görseli (LRU'dan düşse de silinmesin)
+        # Konfeti kartın üzerinde aynı tuvale çizilir
+        self.confetti = ParticleSystem(self.swipe_canvas, tag="confetti")
+        self.theme.add_listener(
+            lambda palette: self.swipe_canvas.itemconfigure(self.swipe_text_item, fill=palette['text_secondary'])
         )
-        # Başlangıçta merkeze yerleştir (pack yerine place kullan)
-        self.swipe_photo_label.place(relx=0.5, rely=0.5, anchor="center")
+        
+        # Benzer fotoğraf grubu şeridi (yalnızca gruptaki bir fotoğraf gösterilirken görünür)
+        self.swipe_group_frame = ctk.CTkFrame(self.swipe_content, fg_color="transparent")
+        self.swipe_group_buttons = []  # Yeniden kullanılan üye butonları
+        self.theme.add_listener(lambda palette: self.update_swipe_group_strip())
         
         # Bilgi etiketi
         self.swipe_info_label = ctk.CTkLabel(
@@ -510,6 +811,7 @@ class PhotoSorterApp(ctk.CTk):
             font=ctk.CTkFont(size=14),
             text_color=MACOS_COLORS['text_secondary']
         )
+        self.theme.register(self.swipe_info_label, text_color="text_secondary")
         self.swipe_info_label.pack(pady=(0, 15))
         
         # Kontrol butonları
@@ -529,6 +831,7 @@ class PhotoSorterApp(ctk.CTk):
             corner_radius=8,
             state="disabled"
         )
+        self.theme.register(self.swipe_prev_btn, fg_color="secondary")
         self.swipe_prev_btn.pack(side="left", padx=(0, 10))
         
         # İlerleme göstergesi
@@ -538,6 +841,7 @@ class PhotoSorterApp(ctk.CTk):
             font=ctk.CTkFont(size=12),
             text_color=MACOS_COLORS['text_tertiary']
         )
+        self.theme.register(self.swipe_progress_label, text_color="text_tertiary")
         self.swipe_progress_label.pack(side="left", padx=10)
         
         # İleri git butonu (opsiyonel - şimdilik eklemiyorum, sadece geri butonu yeterli)
@@ -548,25 +852,78 @@ class PhotoSorterApp(ctk.CTk):
         self.drag_offset_x = 0
         self.drag_offset_y = 0
         self.is_dragging = False
+        self.swipe_drag_job = None  # Bekleyen çizim (hareket olayları kare başına birleştirilir)
+        self.swipe_drag_state = 0  # -1: silinecek, 0: eşik altında, 1: tutulacak
         
-        # Mouse event'lerini hem container hem label'a bağla
-        # Container'a bağla (ana alan)
-        self.swipe_photo_container.bind("<Button-1>", self.on_swipe_press)
-        self.swipe_photo_container.bind("<B1-Motion>", self.on_swipe_drag)
-        self.swipe_photo_container.bind("<ButtonRelease-1>", self.on_swipe_release)
-        # Label'a da bağla (fotoğraf üzerinde)
-        self.swipe_photo_label.bind("<Button-1>", self.on_swipe_press)
-        self.swipe_photo_label.bind("<B1-Motion>", self.on_swipe_drag)
-        self.swipe_photo_label.bind("<ButtonRelease-1>", self.on_swipe_release)
+        # Mouse event'lerini hem container hem tuvale bağla
+        for widget in (self.swipe_photo_container, self.swipe_canvas):
+            widget.bind("<Button-1>", self.on_swipe_press)
+            widget.bind("<B1-Motion>", self.on_swipe_drag)
+            widget.bind("<ButtonRelease-1>", self.on_swipe_release)
         
         # Pencere yeniden boyutlandırma olayı
-        self.swipe_content.bind("<Configure>", self.on_swipe_resize)
+        self.swipe_canvas.bind("<Configure>", self.on_swipe_canvas_configure)
+    
+    def on_swipe_canvas_configure(self, event):
+        """Tuval boyutu değişince kartı ortala ve yeniden ölçeklemeyi planla"""
+        self.swipe_canvas_size = (event.width, event.height)
+        self.confetti.set_bounds(event.width, event.height)
+        self.swipe_canvas.itemconfigure(self.swipe_text_item, width=max(1, event.width - 40))
+        self.center_swipe_card()
+        self.on_swipe_resize(event)
+    
+    def center_swipe_card(self):
+        """Kartı tuvalin ortasına yerleştir"""
+        width, height = self.swipe_canvas_size
+        self.swipe_card_x = width / 2
+        self.swipe_canvas.coords(self.swipe_image_item, width / 2, height / 2)
+        self.swipe_canvas.coords(self.swipe_text_item, width / 2, height / 2)
+    
+    def move_swipe_card(self, x):
+        """Kartı yatayda x merkezine taşı (yalnızca öğeler kaydırılır)"""
+        self.swipe_canvas.move("card", x - self.swipe_card_x, 0)
+        self.swipe_card_x = x
+    
+    def show_swipe_image(self, image):
+        """Kartta fotoğrafı göster"""
+        self.swipe_current_image = image
+        self.confetti.stop()  # Son karedeki konfeti yeni fotoğrafın üstüne düşmesin
+        self.swipe_canvas.itemconfigure(self.swipe_image_item, image=image, state="normal")
+        self.swipe_canvas.itemconfigure(self.swipe_text_item, state="hidden")
+        self.center_swipe_card()
+    
+    def show_swipe_message(self, text):
+        """Kartta fotoğraf yerine mesaj göster"""
+        self.swipe_current_image = None
+        self.swipe_canvas.itemconfigure(self.swipe_image_item, image="", state="hidden")
+        self.swipe_canvas.itemconfigure(self.swipe_text_item, text=text, state="normal")
+        self.center_swipe_card()
+    
+    def make_swipe_image(self, frame):
+        """Hazır kareyi tuvalde gösterilecek Tk görseline çevir (ana thread'de çalışır)"""
+        from PIL import ImageTk
+        
+        return ImageTk.PhotoImage(frame)
     
     def on_swipe_resize(self, event):
-        """Swipe görünümü yeniden boyutlandırıldığında"""
-        if self.current_view == "swipe" and self.swipe_photos and self.current_swipe_index < len(self.swipe_photos):
-            # Fotoğrafı yeniden yükle
-            self.after(200, self.load_swipe_photo)
+        """Swipe görünümü yeniden boyutlandırıldığında
+        
+        Pencere kenarı sürüklenirken gelen olay dizisi tek bir yeniden ölçeklemede
+        birleştirilir: her olay bekleyen zamanlayıcıyı sıfırlar.
+        """
+        if self.swipe_resize_job is not None:
+            self.after_cancel(self.swipe_resize_job)
+        self.swipe_resize_job = self.after(SWIPE_RESIZE_DEBOUNCE_MS, self.rescale_swipe_photo)
+    
+    def rescale_swipe_photo(self):
+        """Boyut değiştiyse fotoğrafı yeni kutuya ölçekle (bellekteki ana önizlemeden)"""
+        self.swipe_resize_job = None
+        if not (self.current_view == "swipe" and self.swipe_photos and self.current_swipe_index < len(self.swipe_photos)):
+            return
+        # Yalnızca konum değiştiren Configure olayları yeniden ölçekleme gerektirmez
+        if self.swipe_frame_box() == self.swipe_last_box:
+            return
+        self.load_swipe_photo()
     
     def show_current_view(self):
         """Mevcut görünümü göster"""
@@ -575,9 +932,13 @@ class PhotoSorterApp(ctk.CTk):
             widget.pack_forget()
         
         if self.current_view == "gallery":
+            # Swipe için bekleyen ön yüklemeler galeri thumbnail'lerini geciktirmesin
+            self.swipe_prefetcher.cancel()
             self.gallery_header.pack(fill="x", padx=0, pady=(25, 15))
-            self.scrollable_frame.pack(fill="both", expand=True, padx=30, pady=(0, 30))
+            self.gallery.pack(fill="both", expand=True, padx=30, pady=(0, 30))
         else:  # swipe
+            if self.swipe_header is None:
+                self.create_swipe_view()
             self.swipe_header.pack(fill="x", padx=0, pady=(25, 15))
             self.swipe_content.pack(fill="both", expand=True, padx=0, pady=0)
             self.load_swipe_photo()
@@ -615,7 +976,7 @@ class PhotoSorterApp(ctk.CTk):
         # Swipe moduna geçildiğinde fotoğrafları hazırla
         if view_name == "swipe" and self.photos:
             # Silinen fotoğrafları hariç tut
-            self.swipe_photos = [p for p in self.photos if p not in self.deleted_photos]
+            self.swipe_photos = self.build_swipe_list()
             self.current_swipe_index = 0
             # Geri Getir butonunu güncelle
             if hasattr(self, 'restore_btn'):
@@ -629,18 +990,22 @@ class PhotoSorterApp(ctk.CTk):
                         state="disabled",
                         text="🔄 Geri Getir"
                     )
-            # Geri butonunun durumunu güncelle
-            if hasattr(self, 'swipe_prev_btn'):
+            # Geri butonunun durumunu güncelle (görünüm henüz oluşturulmadıysa
+            # düğme zaten devre dışı başlar)
+            if self.swipe_header is not None:
                 self.swipe_prev_btn.configure(state="disabled")
         
         self.show_current_view()
     
     def load_swipe_photo(self):
         """Swipe modunda fotoğrafı yükle"""
+        if self.previews_paused:
+            self.show_swipe_message("Yeniden adlandırma sürüyor...")
+            return
+        self.update_swipe_group_strip()
         if not self.swipe_photos:
-            self.swipe_photo_label.configure(
-                text="Fotoğraf bulunamadı\nLütfen önce bir klasör seçin ve fotoğrafları yükleyin.",
-                image=None
+            self.show_swipe_message(
+                "Fotoğraf bulunamadı\nLütfen önce bir klasör seçin ve fotoğrafları yükleyin."
             )
             self.swipe_progress_label.configure(text="0 / 0")
             if hasattr(self, 'swipe_prev_btn'):
@@ -648,10 +1013,7 @@ class PhotoSorterApp(ctk.CTk):
             return
         
         if self.current_swipe_index >= len(self.swipe_photos):
-            self.swipe_photo_label.configure(
-                text="Tüm fotoğraflar gösterildi! 🎉",
-                image=None
-            )
+            self.show_swipe_message("Tüm fotoğraflar gösterildi! 🎉")
             self.swipe_progress_label.configure(text=f"{len(self.swipe_photos)} / {len(self.swipe_photos)}")
             if hasattr(self, 'swipe_prev_btn'):
                 self.swipe_prev_btn.configure(state="normal")
@@ -659,195 +1021,483 @@ class PhotoSorterApp(ctk.CTk):
             self.start_confetti_animation()
             return
         
-        photo_path, photo_date, filename = self.swipe_photos[self.current_swipe_index]
+        photo_id = self.swipe_photos[self.current_swipe_index]
         
-        def load_image():
-            try:
-                # Fotoğrafı yükle
-                img = Image.open(photo_path)
-                original_width, original_height = img.size
-                
-                # Container boyutuna göre ölçekle
-                container_width = self.swipe_photo_container.winfo_width()
-                container_height = self.swipe_photo_container.winfo_height()
-                
-                # Eğer container henüz render edilmemişse, bir kez daha dene
-                if container_width < 100 or container_height < 100:
-                    self.swipe_photo_container.update_idletasks()
-                    container_width = self.swipe_photo_container.winfo_width()
-                    container_height = self.swipe_photo_container.winfo_height()
-                
-                if container_width < 100 or container_height < 100:
-                    # İlk yüklemede varsayılan boyut kullan
-                    max_width = 800
-                    max_height = 600
-                else:
-                    max_width = container_width - 100
-                    max_height = container_height - 100
-                
-                # Aspect ratio korunarak boyutlandır
-                scale_w = max_width / original_width
-                scale_h = max_height / original_height
-                scale = min(scale_w, scale_h, 1.0)  # Büyütme yapma
-                
-                new_width = int(original_width * scale)
-                new_height = int(original_height * scale)
-                
-                img_resized = img.resize((new_width, new_height), Image.Resampling.LANCZOS)
-                photo_img = ctk.CTkImage(light_image=img_resized, dark_image=img_resized, size=(new_width, new_height))
-                
-                self.swipe_photo_label.configure(image=photo_img, text="")
-                
-                # Fotoğrafı merkeze yerleştir
-                self.swipe_photo_label.place(relx=0.5, rely=0.5, anchor="center")
-                
-                # İlerleme göstergesini güncelle
-                self.swipe_progress_label.configure(
-                    text=f"{self.current_swipe_index + 1} / {len(self.swipe_photos)}"
+        # İlerleme göstergesini güncelle
+        self.swipe_progress_label.configure(
+            text=f"{self.current_swipe_index + 1} / {len(self.swipe_photos)}"
+        )
+        
+        # Geri butonunun durumunu güncelle
+        if hasattr(self, 'swipe_prev_btn'):
+            if self.current_swipe_index > 0:
+                self.swipe_prev_btn.configure(state="normal")
+            else:
+                self.swipe_prev_btn.configure(state="disabled")
+        
+        def show_frame(photo_img, error):
+            # Kare gelene kadar başka fotoğrafa geçildiyse gösterme
+            if not self.is_current_swipe_photo(photo_id):
+                return
+            if error is not None:
+                self.show_swipe_message(f"Fotoğraf yüklenemedi: {str(error)}")
+            else:
+                self.show_swipe_image(photo_img)
+        
+        # Önden hazırlanmışsa kare hemen gösterilir; çevresindekiler arka planda hazırlanır
+        box = self.swipe_last_box = self.swipe_frame_box()
+        self.swipe_prefetcher.request(self.catalog.path(photo_id), box, show_frame)
+        self.prefetch_swipe_neighbours(box)
+    
+    def is_current_swipe_photo(self, photo_id):
+        """photo_id swipe modunda şu an gösterilen fotoğraf mı?"""
+        return (
+            self.current_view == "swipe"
+            and self.current_swipe_index < len(self.swipe_photos)
+            and self.swipe_photos[self.current_swipe_index] == photo_id
+        )
+    
+    def swipe_frame_box(self):
+        """Swipe karesinin sığacağı kutu (container boyutundan kenar boşlukları çıkarılır)"""
+        container_width = self.swipe_photo_container.winfo_width()
+        container_height = self.swipe_photo_container.winfo_height()
+        
+        # Eğer container henüz render edilmemişse, bir kez daha dene
+        if container_width < 100 or container_height < 100:
+            self.swipe_photo_container.update_idletasks()
+            container_width = self.swipe_photo_container.winfo_width()
+            container_height = self.swipe_photo_container.winfo_height()
+        
+        if container_width < 100 or container_height < 100:
+            # İlk yüklemede varsayılan boyut kullan
+            return (800, 600)
+        return (container_width - 100, container_height - 100)
+    
+    def load_swipe_master(self, photo_path):
+        """Swipe ana önizlemesi (worker thread'de çalışır; dosya yalnızca ilk seferde okunur)"""
+        return self.get_large_preview(photo_path, SWIPE_MASTER_SIZE)
+    
+    def scale_swipe_frame(self, master, box):
+        """Ana önizlemeyi aspect ratio korunarak kutuya küçült (büyütme yapılmaz)"""
+        from preview_loader import fit_image
+        
+        return fit_image(master, box, allow_upscale=False)
+    
+    def prefetch_swipe_neighbours(self, box):
+        """Sonraki ve önceki fotoğrafların karelerini arka planda hazırla"""
+        index = self.current_swipe_index
+        prefetcher = self.swipe_prefetcher
+        after = self.swipe_photos[index + 1:index + 1 + prefetcher.ahead]
+        before = self.swipe_photos[max(0, index - prefetcher.behind):index][::-1]
+        prefetcher.prefetch(
+            self.catalog.path(self.swipe_photos[index]),
+            [self.catalog.path(photo_id) for photo_id in before],
+            [self.catalog.path(photo_id) for photo_id in after],
+            box
+        )
+    
+    # --- Benzer fotoğraf grupları -------------------------------------------
+    
+    def build_swipe_list(self):
+        """Swipe listesi: silinenler hariç; gruplama açıksa grup üyeleri art arda"""
+        ids = self.catalog.ids(exclude=self.deleted_photos)
+        if not self.swipe_group_of:
+            return ids
+        swipe_photos = array("q")
+        placed = set()
+        for photo_id in ids:
+            group = self.swipe_group_of.get(photo_id)
+            if group is None:
+                swipe_photos.append(photo_id)
+            elif group not in placed:
+                # Grup, ilk üyesinin yerinde bir arada gösterilir
+                placed.add(group)
+                swipe_photos.extend(
+                    member for member in self.swipe_groups[group] if member not in self.deleted_photos
                 )
-                
-                # Geri butonunun durumunu güncelle
-                if hasattr(self, 'swipe_prev_btn'):
-                    if self.current_swipe_index > 0:
-                        self.swipe_prev_btn.configure(state="normal")
-                    else:
-                        self.swipe_prev_btn.configure(state="disabled")
-                
-            except Exception as e:
-                self.swipe_photo_label.configure(
-                    text=f"Fotoğraf yüklenemedi: {str(e)}",
-                    image=None
+        return swipe_photos
+    
+    def rebuild_swipe_list(self):
+        """Swipe listesini yeniden oluştur; gösterilen fotoğraf yerinde kalır"""
+        current = None
+        if self.current_swipe_index < len(self.swipe_photos):
+            current = self.swipe_photos[self.current_swipe_index]
+        self.swipe_photos = self.build_swipe_list()
+        try:
+            self.current_swipe_index = self.swipe_photos.index(current)
+        except ValueError:
+            self.current_swipe_index = 0
+        if self.current_view == "swipe" and self.swipe_header is not None:
+            self.load_swipe_photo()
+    
+    def swipe_group_span(self, index):
+        """index'teki fotoğrafın grubunun swipe listesindeki [başlangıç, bitiş) aralığı
+        
+        Fotoğraf bir grupta değilse veya grupta listede kalan tek fotoğrafsa None.
+        """
+        if index >= len(self.swipe_photos):
+            return None
+        group = self.swipe_group_of.get(self.swipe_photos[index])
+        if group is None:
+            return None
+        start, end = index, index + 1
+        while start > 0 and self.swipe_group_of.get(self.swipe_photos[start - 1]) == group:
+            start -= 1
+        while end < len(self.swipe_photos) and self.swipe_group_of.get(self.swipe_photos[end]) == group:
+            end += 1
+        return (start, end) if end - start > 1 else None
+    
+    def swipe_group_others(self, span):
+        """Gruptaki, gösterilen fotoğraf dışında henüz silinmemiş üyeler"""
+        current = self.swipe_photos[self.current_swipe_index]
+        return [
+            photo_id for photo_id in self.swipe_photos[span[0]:span[1]]
+            if photo_id != current and photo_id not in self.deleted_photos
+        ]
+    
+    def swipe_hint_text(self):
+        """Bilgi etiketinin varsayılan metni (grupta ne olacağı dahil)"""
+        span = self.swipe_group_span(self.current_swipe_index)
+        if span is None:
+            return "Sola sürükle: Sil  |  Sağa sürükle: Tut"
+        _, icon, noun = SWIPE_GROUP_MODES[self.swipe_group_mode]
+        others = len(self.swipe_group_others(span))
+        return (
+            f"{icon} {span[1] - span[0]} {noun} fotoğraf  •  Sola sürükle: Yalnızca bunu sil  |  "
+            f"Sağa sürükle: Bunu tut, diğer {others} silinir"
+        )
+    
+    def update_restore_button(self):
+        """Geri Getir butonunu silinen fotoğraf sayısına göre güncelle"""
+        if not hasattr(self, 'restore_btn'):
+            return
+        if self.deleted_photos:
+            self.restore_btn.configure(
+                state="normal",
+                text=f"🔄 Geri Getir ({len(self.deleted_photos)})"
+            )
+        else:
+            self.restore_btn.configure(
+                state="disabled",
+                text="🔄 Geri Getir"
+            )
+    
+    def update_swipe_group_strip(self):
+        """Gösterilen fotoğraf bir gruptaysa üyelerin şeridini göster
+        
+        Butonlar havuzdan yeniden kullanılır; küçük önizlemeler thumbnail
+        hattında üretilir (galeriyle aynı önbellekten).
+        """
+        if self.swipe_header is None:
+            return
+        if self.swipe_drag_state == 0:
+            self.swipe_info_label.configure(text=self.swipe_hint_text())
+        span = self.swipe_group_span(self.current_swipe_index)
+        if span is None:
+            self.swipe_group_frame.pack_forget()
+            self.thumbnail_pipeline.cancel(SWIPE_GROUP_THUMB_GROUP)
+            return
+        
+        # Büyük gruplarda gösterilen fotoğrafın çevresindeki üyeler
+        start, end = span
+        index = self.current_swipe_index
+        first = max(start, min(index - SWIPE_GROUP_STRIP_MAX // 2, end - SWIPE_GROUP_STRIP_MAX))
+        members = range(first, min(end, first + SWIPE_GROUP_STRIP_MAX))
+        
+        while len(self.swipe_group_buttons) < len(members):
+            button = ctk.CTkButton(
+                self.swipe_group_frame,
+                text="",
+                width=SWIPE_GROUP_THUMB_SIZE[0] + 8,
+                height=SWIPE_GROUP_THUMB_SIZE[1] + 8,
+                font=ctk.CTkFont(size=12),
+                fg_color=MACOS_COLORS['card'],
+                hover_color=MACOS_COLORS['card_hover'],
+                text_color=MACOS_COLORS['text_secondary'],
+                border_width=2,
+                corner_radius=8
+            )
+            self.theme.register(button, fg_color="card", hover_color="card_hover", text_color="text_secondary")
+            self.swipe_group_buttons.append(button)
+        
+        needed = set()
+        for button, member_index in zip(self.swipe_group_buttons, members):
+            photo_id = self.swipe_photos[member_index]
+            photo_path = self.catalog.path(photo_id)
+            image = self.swipe_group_images.get(photo_path)
+            deleted = photo_id in self.deleted_photos
+            button.configure(
+                image=image,
+                text="🗑" if deleted else ("" if image is not None else str(member_index - start + 1)),
+                compound="center",
+                border_color=MACOS_COLORS['primary'] if member_index == index else (
+                    MACOS_COLORS['danger'] if deleted else MACOS_COLORS['border']
+                ),
+                command=partial(self.select_swipe_group_member, member_index)
+            )
+            button.pack(side="left", padx=3)
+            if image is None:
+                key = photo_path
+                needed.add(key)
+                self.thumbnail_pipeline.submit(
+                    key, partial(self.load_swipe_group_thumbnail, photo_path),
+                    self.on_swipe_group_thumbnail,
+                    priority=abs(member_index - index), group=SWIPE_GROUP_THUMB_GROUP
                 )
+        for button in self.swipe_group_buttons[len(members):]:
+            button.pack_forget()
+        self.thumbnail_pipeline.cancel(SWIPE_GROUP_THUMB_GROUP, keep=needed)
+        if needed and self.swipe_group_poll_job is None:
+            self.swipe_group_poll_job = self.after(JOB_POLL_INTERVAL_MS, self.poll_swipe_group_thumbnails)
+        self.swipe_group_frame.pack(before=self.swipe_info_label, pady=(0, 10))
+    
+    def load_swipe_group_thumbnail(self, photo_path):
+        """Grup şeridi önizlemesi (worker thread'de çalışır)"""
+        from preview_loader import fit_image
         
-        # Container render edildikten sonra yükle
-        self.swipe_photo_container.update_idletasks()
-        self.after(50, load_image)
+        return fit_image(self.get_preview(photo_path, THUMBNAIL_SIZE), SWIPE_GROUP_THUMB_SIZE, allow_upscale=False)
+    
+    def on_swipe_group_thumbnail(self, photo_path, pil_image, error):
+        """Hazır önizlemeyi şeride yerleştir (ana thread)"""
+        if error is not None or pil_image is None:
+            return
+        self.swipe_group_images[photo_path] = ctk.CTkImage(
+            light_image=pil_image, dark_image=pil_image, size=pil_image.size
+        )
+        if len(self.swipe_group_images) > SWIPE_GROUP_STRIP_MAX * 8:
+            self.swipe_group_images.pop(next(iter(self.swipe_group_images)))
+        self.update_swipe_group_strip()
+    
+    def poll_swipe_group_thumbnails(self):
+        self.swipe_group_poll_job = None
+        self.thumbnail_pipeline.poll(limit=16)
+        if self.thumbnail_pipeline.busy:
+            self.swipe_group_poll_job = self.after(JOB_POLL_INTERVAL_MS, self.poll_swipe_group_thumbnails)
+    
+    def select_swipe_group_member(self, index):
+        """Şeritte seçilen grup üyesini göster (silinmişse geri getirilir)"""
+        if index >= len(self.swipe_photos) or self.navigation_blocked():
+            return
+        self.deleted_photos.discard(self.swipe_photos[index])
+        self.update_restore_button()
+        self.current_swipe_index = index
+        self.load_swipe_photo()
+    
+    def toggle_swipe_grouping(self, mode):
+        """Benzer fotoğraf veya kopya gruplamasını aç/kapat"""
+        searching = self.active_job is not None and self.active_job.name in SWIPE_GROUP_MODES
+        if self.swipe_group_mode == mode or (searching and self.active_job.name == mode):
+            if searching:
+                self.cancel_active_job()
+            self.set_swipe_groups(None)
+            self.rebuild_swipe_list()
+            self.status_label.configure(text="Gruplama kapatıldı")
+            return
+        if not self.photos:
+            messagebox.showinfo("Bilgi", "Önce fotoğrafları yükleyin!")
+            return
+        if self.active_job is not None:
+            messagebox.showwarning("Uyarı", "Devam eden işlem bitmeden gruplama yapılamaz!")
+            return
+        self.set_swipe_groups(None)
+        self.swipe_group_btns[mode].configure(text="✖️ Gruplamayı Kapat")
+        if mode == "similar":
+            self.find_similar_photos()
+        else:
+            self.find_duplicate_photos()
+    
+    def set_swipe_groups(self, groups, mode=None):
+        """Grupları ([[ID, ...], ...]) uygula; groups None ise gruplama kapanır"""
+        self.swipe_group_mode = mode if groups is not None else None
+        self.swipe_groups = {members[0]: members for members in groups or ()}
+        self.swipe_group_of = {
+            photo_id: group for group, members in self.swipe_groups.items() for photo_id in members
+        }
+        if self.swipe_header is not None:
+            for name, button in self.swipe_group_btns.items():
+                button.configure(
+                    text="✖️ Gruplamayı Kapat" if name == self.swipe_group_mode else SWIPE_GROUP_MODES[name][0]
+                )
+    
+    def finish_grouping_job(self, job, groups, error, mode, found_text):
+        """Gruplama işi bittiğinde grupları uygula veya hatayı göster"""
+        if not self.finish_job(job):
+            return  # Yerine yeni bir iş (ör. tarama) başlatıldı
+        if error is not None:
+            self.set_swipe_groups(None)
+            if isinstance(error, JobCancelled):
+                self.status_label.configure(text="Gruplama iptal edildi")
+            else:
+                messagebox.showerror("Hata", f"Gruplar aranırken hata oluştu: {str(error)}")
+                self.status_label.configure(text="Hata oluştu!")
+            return
+        self.set_swipe_groups(groups, mode)
+        self.rebuild_swipe_list()
+        self.status_label.configure(
+            text=f"{len(groups)} {found_text} grup bulundu ({sum(map(len, groups))} fotoğraf)"
+        )
+    
+    def find_similar_photos(self):
+        """Algısal hash'leri arka planda hesapla (indekstekiler yeniden hesaplanmaz) ve grupla"""
+        photos = [(photo_id, self.catalog.path(photo_id)) for photo_id in self.catalog.order]
+        known = {
+            os.path.abspath(photo_path): self.catalog.hash(photo_id)
+            for photo_id, photo_path in photos if self.catalog.hash(photo_id) is not None
+        }
+        folder = self.selected_folder
+        index = self.metadata_index
+        
+        def find(context):
+            from near_duplicates import HASH_BATCH_SIZE, find_groups, iter_hashes
+            
+            if index is not None and folder:
+                known.update(index.load_hashes(folder))
+            hashes = {}
+            done = 0
+            for batch in iter_hashes(photos, known, cancel=lambda: context.cancelled):
+                context.check()
+                hashes.update((photo_id, value) for photo_id, _, value, _ in batch)
+                # Yeni hesaplananlar indekse yazılır; sonraki aramada yeniden çözülmez
+                fresh = [(photo_path, value) for _, photo_path, value, is_new in batch if is_new]
+                if index is not None and fresh:
+                    index.set_hashes(fresh)
+                done = min(len(photos), done + HASH_BATCH_SIZE)
+                context.progress(done, len(photos))
+            context.check()
+            return hashes, find_groups(hashes)
+        
+        def on_done(result, error):
+            groups = None
+            if error is None:
+                hashes, groups = result
+                self.catalog.set_hashes(hashes.items())
+            self.finish_grouping_job(job, groups, error, "similar", "benzer")
+        
+        job = self.start_job("similar", "Benzerler aranıyor", find, on_done=on_done)
+    
+    def find_duplicate_photos(self):
+        """Bayt bayt aynı dosyaları arka planda bul: boyut, baş blok, tam hash aşamalarıyla"""
+        files = [
+            (photo_id, self.catalog.path(photo_id), self.catalog.size(photo_id))
+            for photo_id in self.catalog.order
+        ]
+        
+        def find(context):
+            from exact_duplicates import find_duplicates
+            
+            return find_duplicates(files, check=context.check, progress=context.progress)
+        
+        def on_done(groups, error):
+            self.finish_grouping_job(job, groups, error, "duplicates", "kopya")
+        
+        job = self.start_job("duplicates", "Kopyalar aranıyor", find, on_done=on_done)
     
     def on_swipe_press(self, event):
         """Mouse basıldığında"""
-        # Her zaman container'a göre pozisyonu hesapla
-        container_x = self.swipe_photo_container.winfo_rootx()
-        container_y = self.swipe_photo_container.winfo_rooty()
-        self.drag_start_x = event.x_root - container_x
-        self.drag_start_y = event.y_root - container_y
+        if self.navigation_blocked():
+            self.drag_start_x = None
+            return
+        # Sürükleme mesafesi ekran koordinatlarından hesaplanır (widget sorgusu gerekmez)
+        self.drag_start_x = event.x_root
+        self.drag_start_y = event.y_root
         
         self.drag_offset_x = 0
         self.drag_offset_y = 0
         self.is_dragging = False
     
     def on_swipe_drag(self, event):
-        """Mouse sürüklenirken"""
+        """Mouse sürüklenirken
+        
+        Olay başına yalnızca son konum kaydedilir; kart kare başına bir kez çizilir.
+        """
         if self.drag_start_x is None:
             return
         
-        # Her zaman container'a göre pozisyonu hesapla
-        container_x = self.swipe_photo_container.winfo_rootx()
-        container_y = self.swipe_photo_container.winfo_rooty()
-        current_x = event.x_root - container_x
-        current_y = event.y_root - container_y
-        
         # Drag mesafesini hesapla
-        self.drag_offset_x = current_x - self.drag_start_x
-        self.drag_offset_y = current_y - self.drag_start_y
+        self.drag_offset_x = event.x_root - self.drag_start_x
+        self.drag_offset_y = event.y_root - self.drag_start_y
         
         # Eğer yeterince hareket edildiyse drag başladı olarak işaretle
         if abs(self.drag_offset_x) > 3 or abs(self.drag_offset_y) > 3:
             self.is_dragging = True
         
-        # Container boyutunu al
-        container_width = self.swipe_photo_container.winfo_width()
-        if container_width == 0:
-            self.swipe_photo_container.update_idletasks()
-            container_width = self.swipe_photo_container.winfo_width()
-        
-        if container_width > 0:
-            # Fotoğrafı hareket ettir (animasyon)
-            # relx: 0.5 (merkez) + offset/container_width
-            # Maksimum hareket mesafesi container genişliğinin %40'ı
-            max_offset = container_width * 0.4
-            normalized_offset = max(-max_offset, min(max_offset, self.drag_offset_x))
-            new_relx = 0.5 + (normalized_offset / container_width)
-            
-            # Fotoğrafı yeni konuma taşı
-            self.swipe_photo_label.place(relx=new_relx, rely=0.5, anchor="center")
-            
-            # Opacity efekti (sürükleme mesafesine göre)
-            opacity_factor = min(1.0, abs(normalized_offset) / (container_width * 0.3))
-            if opacity_factor > 0.3:
-                # Fotoğrafı biraz şeffaflaştır
-                pass  # CTkLabel opacity desteği yok, sadece görsel efekt için renk kullanacağız
-        
-        # Görsel geri bildirim - container genişliğine göre dinamik
-        container_width = self.swipe_photo_container.winfo_width()
-        if container_width == 0:
-            self.swipe_photo_container.update_idletasks()
-            container_width = self.swipe_photo_container.winfo_width()
+        if self.swipe_drag_job is None:
+            self.swipe_drag_job = self.after(SWIPE_FRAME_MS, self.render_swipe_drag)
+    
+    def render_swipe_drag(self):
+        """Kartı son sürükleme konumuna taşı; eşik durumu değiştiyse renkleri güncelle"""
+        self.swipe_drag_job = None
+        if self.drag_start_x is None:
+            return
+        self.move_swipe_card(self.swipe_drag_position())
         
-        threshold = max(40, container_width * 0.10) if container_width > 0 else 60
+        # Görsel geri bildirim - tuval genişliğine göre dinamik eşik
+        threshold = self.swipe_threshold()
         if abs(self.drag_offset_x) > threshold:
-            if self.drag_offset_x < 0:  # Sola sürükleniyor
-                self.swipe_photo_container.configure(
-                    border_color=MACOS_COLORS['danger'],
-                    fg_color="#FFE5E3"
-                )
-                self.swipe_info_label.configure(
-                    text="⬅️ Silinecek - Bırak!",
-                    text_color=MACOS_COLORS['danger']
-                )
-            else:  # Sağa sürükleniyor
-                self.swipe_photo_container.configure(
-                    border_color=MACOS_COLORS['success'],
-                    fg_color="#E5F5E8"
-                )
-                self.swipe_info_label.configure(
-                    text="➡️ Tutulacak - Bırak!",
-                    text_color=MACOS_COLORS['success']
-                )
+            self.set_swipe_drag_state(-1 if self.drag_offset_x < 0 else 1)
         else:
-            self.swipe_photo_container.configure(
-                border_color=MACOS_COLORS['border'],
-                fg_color=MACOS_COLORS['card']
-            )
-            self.swipe_info_label.configure(
-                text="Sola sürükle: Sil  |  Sağa sürükle: Tut",
-                text_color=MACOS_COLORS['text_secondary']
-            )
+            self.set_swipe_drag_state(0)
+    
+    def swipe_drag_position(self):
+        """Sürükleme mesafesine göre kartın yatay merkezi"""
+        width = self.swipe_canvas_size[0]
+        # Maksimum hareket mesafesi tuval genişliğinin %40'ı
+        max_offset = width * 0.4
+        return width / 2 + max(-max_offset, min(max_offset, self.drag_offset_x))
+    
+    def swipe_threshold(self):
+        """Silme/tutma için gereken sürükleme mesafesi (genişliğin %10'u, en az 40 px)"""
+        width = self.swipe_canvas_size[0]
+        return max(40, width * 0.10) if width > 0 else 60
+    
+    def set_swipe_drag_state(self, state):
+        """Eşik durumuna göre kart ve bilgi etiketi renkleri (yalnızca durum değişince)"""
+        if state == self.swipe_drag_state:
+            return
+        self.swipe_drag_state = state
+        if state < 0:  # Sola sürükleniyor
+            border, fill = MACOS_COLORS['danger'], "#FFE5E3"
+            text, text_color = "⬅️ Silinecek - Bırak!", MACOS_COLORS['danger']
+        elif state > 0:  # Sağa sürükleniyor
+            border, fill = MACOS_COLORS['success'], "#E5F5E8"
+            text, text_color = "➡️ Tutulacak - Bırak!", MACOS_COLORS['success']
+            span = self.swipe_group_span(self.current_swipe_index)
+            if span is not None:
+                others = len(self.swipe_group_others(span))
+                text = f"➡️ Tutulacak, gruptaki diğer {others} fotoğraf silinecek - Bırak!"
+        else:
+            border, fill = MACOS_COLORS['border'], MACOS_COLORS['card']
+            text, text_color = self.swipe_hint_text(), MACOS_COLORS['text_secondary']
+        self.swipe_photo_container.configure(border_color=border, fg_color=fill)
+        self.swipe_canvas.configure(bg=fill)
+        self.swipe_info_label.configure(text=text, text_color=text_color)
     
     def on_swipe_release(self, event):
         """Mouse bırakıldığında"""
         if self.drag_start_x is None:
             return
         
-        # Her zaman container'a göre pozisyonu hesapla
-        container_x = self.swipe_photo_container.winfo_rootx()
-        container_y = self.swipe_photo_container.winfo_rooty()
-        current_x = event.x_root - container_x
-        current_y = event.y_root - container_y
+        # Bekleyen çizimi iptal et, son konum aşağıda doğrudan uygulanır
+        if self.swipe_drag_job is not None:
+            self.after_cancel(self.swipe_drag_job)
+            self.swipe_drag_job = None
         
         # Drag mesafesini hesapla
-        drag_distance = current_x - self.drag_start_x
+        drag_distance = event.x_root - self.drag_start_x
+        self.drag_offset_x = drag_distance
         
         # Eğer drag algılanmamışsa ama mesafe varsa, is_dragging'i True yap
         if not self.is_dragging and abs(drag_distance) > 3:
             self.is_dragging = True
         
-        # Container genişliğine göre dinamik threshold
-        container_width = self.swipe_photo_container.winfo_width()
-        if container_width == 0:
-            self.swipe_photo_container.update_idletasks()
-            container_width = self.swipe_photo_container.winfo_width()
-        
-        # Container genişliğinin %10'u kadar sürüklenmeli (daha kolay silme)
-        threshold = max(40, container_width * 0.10) if container_width > 0 else 60
+        if self.swipe_canvas_size[0] > 0:
+            self.move_swipe_card(self.swipe_drag_position())
         
-        # Container'ı normale döndür
-        self.swipe_photo_container.configure(
-            border_color=MACOS_COLORS['border'],
-            fg_color=MACOS_COLORS['card']
-        )
+        # Kartı ve bilgi etiketini normale döndür
+        self.set_swipe_drag_state(0)
         
         # Drag mesafesini kontrol et - mutlak değere bakıyoruz
-        if abs(drag_distance) > threshold:
+        if abs(drag_distance) > self.swipe_threshold():
             # Yeterince sürüklendi - animasyonla kaydır ve işlemi yap
             if drag_distance < 0:  # Sola sürüklendi - Sil
                 self.animate_photo_out("left")
@@ -856,10 +1506,6 @@ class PhotoSorterApp(ctk.CTk):
         else:
             # Yeterince sürüklenmedi, fotoğrafı merkeze geri döndür
             self.animate_photo_back()
-            self.swipe_info_label.configure(
-                text="Sola sürükle: Sil  |  Sağa sürükle: Tut",
-                text_color=MACOS_COLORS['text_secondary']
-            )
         
         # Değişkenleri sıfırla
         self.drag_start_x = None
@@ -870,28 +1516,27 @@ class PhotoSorterApp(ctk.CTk):
     
     def animate_photo_out(self, direction):
         """Fotoğrafı animasyonla dışarı kaydır (sola veya sağa)"""
-        container_width = self.swipe_photo_container.winfo_width()
-        if container_width == 0:
-            # Container henüz render edilmemiş, direkt işlemi yap
+        width = self.swipe_canvas_size[0]
+        if width == 0:
+            # Tuval henüz render edilmemiş, direkt işlemi yap
             if direction == "left":
                 self.delete_current_photo()
             else:
                 self.keep_current_photo()
             return
         
-        target_relx = 1.5 if direction == "right" else -0.5  # Ekran dışına kaydır
-        start_relx = float(self.swipe_photo_label.place_info().get('relx', 0.5))
+        # Ekran dışına kaydır (kart tuvalden dar olduğu için bir genişlik yeterli)
+        start_x = self.swipe_card_x
+        target_x = width / 2 + (width if direction == "right" else -width)
         
         def animate_step(step=0):
             if step <= 10:  # 10 adımda animasyon
                 # Yumuşak geçiş (ease-out)
                 progress = step / 10.0
                 ease_progress = 1 - (1 - progress) ** 2
-                new_relx = start_relx + (target_relx - start_relx) * ease_progress
-                
-                self.swipe_photo_label.place(relx=new_relx, rely=0.5, anchor="center")
+                self.move_swipe_card(start_x + (target_x - start_x) * ease_progress)
                 if step < 10:
-                    self.after(16, lambda: animate_step(step + 1))  # ~60 FPS
+                    self.after(SWIPE_FRAME_MS, lambda: animate_step(step + 1))  # ~60 FPS
                 else:
                     # Animasyon tamamlandı, işlemi yap
                     if direction == "left":
@@ -903,24 +1548,24 @@ class PhotoSorterApp(ctk.CTk):
     
     def animate_photo_back(self):
         """Fotoğrafı merkeze geri döndür"""
-        start_relx = float(self.swipe_photo_label.place_info().get('relx', 0.5))
+        width = self.swipe_canvas_size[0]
+        start_x = self.swipe_card_x
+        center_x = width / 2
         
         def animate_step(step=0):
-            if abs(start_relx - 0.5) > 0.01 and step <= 15:  # 15 adımda merkeze dön
+            if abs(start_x - center_x) > width * 0.01 and step <= 15:  # 15 adımda merkeze dön
                 # Yumuşak geçiş (ease-out)
                 progress = step / 15.0
                 ease_progress = 1 - (1 - progress) ** 2
-                new_relx = start_relx + (0.5 - start_relx) * ease_progress
-                
-                self.swipe_photo_label.place(relx=new_relx, rely=0.5, anchor="center")
+                self.move_swipe_card(start_x + (center_x - start_x) * ease_progress)
                 if step < 15:
-                    self.after(16, lambda: animate_step(step + 1))  # ~60 FPS
+                    self.after(SWIPE_FRAME_MS, lambda: animate_step(step + 1))  # ~60 FPS
                 else:
                     # Merkeze yerleştir
-                    self.swipe_photo_label.place(relx=0.5, rely=0.5, anchor="center")
+                    self.center_swipe_card()
             else:
                 # Zaten merkeze yakın, direkt yerleştir
-                self.swipe_photo_label.place(relx=0.5, rely=0.5, anchor="center")
+                self.center_swipe_card()
         
         animate_step()
     
@@ -928,9 +1573,10 @@ class PhotoSorterApp(ctk.CTk):
         """Mevcut fotoğrafı sil"""
         if not self.swipe_photos or self.current_swipe_index >= len(self.swipe_photos):
             return
+        if self.navigation_blocked():
+            return
         
-        photo = self.swipe_photos[self.current_swipe_index]
-        self.deleted_photos.append(photo)
+        self.deleted_photos.add(self.swipe_photos[self.current_swipe_index])
         
         # Geri Getir butonunu aktif et ve metni güncelle
         if hasattr(self, 'restore_btn'):
@@ -948,22 +1594,42 @@ class PhotoSorterApp(ctk.CTk):
         )
     
     def keep_current_photo(self):
-        """Mevcut fotoğrafı tut (sonraki fotoğrafa geç)"""
+        """Mevcut fotoğrafı tut (sonraki fotoğrafa geç)
+        
+        Fotoğraf bir gruptaysa (benzer veya kopya) grubun kalan diğer üyeleri silinir ve
+        grubun sonrasına geçilir.
+        """
         if not self.swipe_photos or self.current_swipe_index >= len(self.swipe_photos):
             return
+        if self.navigation_blocked():
+            return
         
-        self.current_swipe_index += 1
+        span = self.swipe_group_span(self.current_swipe_index)
+        if span is None:
+            self.current_swipe_index += 1
+            self.load_swipe_photo()
+            return
+        
+        others = self.swipe_group_others(span)
+        self.deleted_photos.update(others)
+        self.update_restore_button()
+        self.current_swipe_index = span[1]
         self.load_swipe_photo()
+        self.status_label.configure(
+            text=f"1 fotoğraf tutuldu, gruptaki {len(others)} fotoğraf silindi ({len(self.deleted_photos)} fotoğraf silindi)"
+        )
     
     def go_to_previous_photo(self):
         """Bir önceki fotoğrafa geri dön"""
+        if self.navigation_blocked():
+            return
         if self.current_swipe_index > 0:
             self.current_swipe_index -= 1
             # Eğer silinen fotoğraflar listesinde varsa, çıkar
             if self.swipe_photos and self.current_swipe_index < len(self.swipe_photos):
-                photo = self.swipe_photos[self.current_swipe_index]
-                if photo in self.deleted_photos:
-                    self.deleted_photos.remove(photo)
+                photo_id = self.swipe_photos[self.current_swipe_index]
+                if photo_id in self.deleted_photos:
+                    self.deleted_photos.discard(photo_id)
                     # Geri Getir butonunu güncelle
                     if hasattr(self, 'restore_btn'):
                         if len(self.deleted_photos) > 0:
@@ -979,109 +1645,15 @@ class PhotoSorterApp(ctk.CTk):
             self.load_swipe_photo()
     
     def start_confetti_animation(self):
-        """Konfeti animasyonu başlat"""
-        if not hasattr(self, 'swipe_content'):
+        """Konfeti animasyonu başlat (swipe tuvalinde, kalıcı öğelerle)"""
+        if self.swipe_header is None:
             return
         
-        # Canvas oluştur (konfeti için)
-        if hasattr(self, 'confetti_canvas'):
-            self.confetti_canvas.destroy()
-        
-        # Container'ın üzerine canvas yerleştir
-        self.confetti_canvas = Canvas(
-            self.swipe_photo_container,
-            highlightthickness=0,
-            bg=MACOS_COLORS['card']
-        )
-        self.confetti_canvas.place(relx=0, rely=0, relwidth=1, relheight=1)
-        
-        # Konfeti parçacıkları
-        self.confetti_particles = []
-        colors = ['#FF3B30', '#FF9500', '#FFCC00', '#34C759', '#007AFF', '#5856D6', '#AF52DE', '#FF2D55']
-        
-        # Container boyutunu al
-        self.swipe_photo_container.update_idletasks()
-        width = self.swipe_photo_container.winfo_width()
-        height = self.swipe_photo_container.winfo_height()
-        
+        width, height = self.swipe_canvas_size
+        self.confetti.stop()
         if width > 0 and height > 0:
-            # 50 konfeti parçacığı oluştur
-            for _ in range(50):
-                x = random.randint(0, width)
-                y = random.randint(-100, -10)
-                color = random.choice(colors)
-                size = random.randint(5, 15)
-                speed = random.uniform(2, 5)
-                angle = random.uniform(0, 2 * math.pi)
-                vx = math.cos(angle) * speed
-                vy = math.sin(angle) * speed + random.uniform(1, 3)
-                
-                particle = {
-                    'x': x,
-                    'y': y,
-                    'vx': vx,
-                    'vy': vy,
-                    'color': color,
-                    'size': size,
-                    'rotation': random.uniform(0, 360),
-                    'rotation_speed': random.uniform(-5, 5)
-                }
-                self.confetti_particles.append(particle)
-        
-        # Animasyonu başlat
-        self.animate_confetti()
-    
-    def animate_confetti(self):
-        """Konfeti animasyonunu güncelle"""
-        if not hasattr(self, 'confetti_canvas') or not hasattr(self, 'confetti_particles'):
-            return
-        
-        self.confetti_canvas.delete("all")
-        
-        # Container boyutunu al
-        width = self.swipe_photo_container.winfo_width()
-        height = self.swipe_photo_container.winfo_height()
-        
-        if width == 0 or height == 0:
-            return
-        
-        # Parçacıkları güncelle ve çiz
-        particles_to_remove = []
-        for i, particle in enumerate(self.confetti_particles):
-            # Fizik güncellemesi
-            particle['x'] += particle['vx']
-            particle['y'] += particle['vy']
-            particle['vy'] += 0.2  # Yerçekimi
-            particle['rotation'] += particle['rotation_speed']
-            
-            # Parçacığı çiz
-            x1 = particle['x'] - particle['size'] / 2
-            y1 = particle['y'] - particle['size'] / 2
-            x2 = particle['x'] + particle['size'] / 2
-            y2 = particle['y'] + particle['size'] / 2
-            
-            self.confetti_canvas.create_oval(
-                x1, y1, x2, y2,
-                fill=particle['color'],
-                outline=particle['color'],
-                width=0
-            )
-            
-            # Ekran dışına çıkan parçacıkları kaldır
-            if particle['y'] > height + 50 or particle['x'] < -50 or particle['x'] > width + 50:
-                particles_to_remove.append(i)
-        
-        # Parçacıkları kaldır (ters sırada)
-        for i in reversed(particles_to_remove):
-            self.confetti_particles.pop(i)
-        
-        # Eğer parçacık kaldıysa animasyonu devam ettir
-        if self.confetti_particles:
-            self.after(16, self.animate_confetti)  # ~60 FPS
-        else:
-            # Animasyon bitti, canvas'ı kaldır
-            if hasattr(self, 'confetti_canvas'):
-                self.after(500, lambda: self.confetti_canvas.destroy() if hasattr(self, 'confetti_canvas') else None)
+            self.confetti.set_bounds(width, height)
+            confetti_burst(self.confetti)
     
     def restore_deleted_photos(self):
         """Silinen fotoğrafları geri getir"""
@@ -1098,13 +1670,14 @@ class PhotoSorterApp(ctk.CTk):
             return
         
         # Silinen fotoğrafları geri ekle
-        self.deleted_photos = []
+        self.deleted_photos = set()
         
-        # Swipe fotoğraflarını yeniden oluştur
+        # Swipe fotoğraflarını yeniden oluştur (swipe görünümüne geçişte yüklenir)
         if self.photos:
-            self.swipe_photos = [p for p in self.photos if p not in self.deleted_photos]
+            self.swipe_photos = self.build_swipe_list()
             self.current_swipe_index = 0
-            self.load_swipe_photo()
+            if self.current_view == "swipe":
+                self.load_swipe_photo()
         
         # Geri Getir butonunu devre dışı bırak ve metni sıfırla
         if hasattr(self, 'restore_btn'):
@@ -1128,387 +1701,262 @@ class PhotoSorterApp(ctk.CTk):
             
     def get_photo_date(self, photo_path):
         """Fotoğrafın çekilme tarihini alır (EXIF veya dosya tarihi)"""
-        try:
-            # EXIF verilerinden tarih al
-            img = Image.open(photo_path)
-            exif = img.getexif()
-            
-            if exif:
-                # EXIF tarih etiketlerini kontrol et
-                for tag_id, value in exif.items():
-                    tag = ExifTags.TAGS.get(tag_id, tag_id)
-                    if tag == 'DateTime' or tag == 'DateTimeOriginal' or tag == 'DateTimeDigitized':
-                        try:
-                            date_str = str(value)
-                            # EXIF tarih formatı: "YYYY:MM:DD HH:MM:SS"
-                            date_obj = datetime.strptime(date_str, "%Y:%m:%d %H:%M:%S")
-                            return date_obj
-                        except:
-                            pass
-            
-            # EXIF yoksa dosya oluşturulma tarihini kullan
-            file_time = os.path.getmtime(photo_path)
-            return datetime.fromtimestamp(file_time)
-            
-        except Exception as e:
-            # Hata durumunda dosya tarihini kullan
-            try:
-                file_time = os.path.getmtime(photo_path)
-                return datetime.fromtimestamp(file_time)
-            except:
-                return datetime.now()
+        return photo_scanner.get_photo_date(photo_path)
+    
+    def record_renames(self, moves):
+        """Yeniden adlandırmaları metadata indeksine yansıt"""
+        photo_engine.record_renames(self.metadata_index, moves)
+    
+    def apply_renames(self, moves):
+        """Yeniden adlandırmaları kataloğa, görünümlere ve indekse yerinde yansıt
+
+        Klasör yeniden taranmaz: tarihler değişmediği için sıra korunur,
+        yalnızca yollar güncellenir. Swipe ve silinenler listeleri ID tuttuğu
+        için değişmez.
+        """
+        self.record_renames(moves)
+        if not moves:
+            return
+        mapping = dict(moves)
+        self.catalog.rename(mapping)
+        
+        # Galeri kartları yeniden oluşturulmaz, yalnızca yeniden etiketlenir
+        self.gallery.rename_photos(self.photos, mapping)
+        
+        # Yol ile anahtarlanmış önden hazırlıklar artık başka dosyayı gösterebilir
+        self.swipe_prefetcher.clear()
+        self.swipe_group_images.clear()
+        if self.photo_viewer is not None:
+            self.photo_viewer.forget_prefetched()
+        if self.current_view == "swipe":
+            self.load_swipe_photo()
+    
+    def pause_previews(self):
+        """Yeniden adlandırma başlarken yolla yüklenen tüm önizlemeleri durdur
+
+        Galeri, swipe ve büyük görünüm önizlemeleri katalog yoluyla yükler; iş
+        sürerken bir yol (ör. IMG_0005 -> IMG_0006 zincirinde) başka bir
+        fotoğrafı tutabilir. İş bitip yollar güncellenince resume_previews()
+        çağrılır.
+        """
+        self.previews_paused = True
+        self.gallery.pause()
+        self.swipe_prefetcher.pause()
+        self.thumbnail_pipeline.pause(SWIPE_GROUP_THUMB_GROUP)
+        self.swipe_group_images.clear()
+        if self.photo_viewer is not None:
+            self.photo_viewer.pause()
+    
+    def resume_previews(self):
+        """Yollar güncellendikten sonra önizlemelere devam et"""
+        if not self.previews_paused:
+            return
+        self.previews_paused = False
+        self.gallery.resume()
+        self.swipe_prefetcher.resume()
+        self.thumbnail_pipeline.resume(SWIPE_GROUP_THUMB_GROUP)
+        if self.photo_viewer is not None:
+            self.photo_viewer.resume()
+        if self.current_view == "swipe":
+            self.load_swipe_photo()
+    
+    def navigation_blocked(self):
+        """Yeniden adlandırma sürerken swipe ve büyük görünüm gezinmesi engellenir"""
+        if self.previews_paused:
+            self.status_label.configure(text="Yeniden adlandırma bitene kadar gezinme devre dışı")
+            return True
+        return False
     
     def clear_photos(self):
-        """Scrollable frame'i temizle"""
-        for widget in self.scrollable_frame.winfo_children():
-            widget.destroy()
+        """Galeriyi temizle"""
+        self.gallery.clear()
     
     def sort_photos(self):
         if not self.selected_folder:
             messagebox.showwarning("Uyarı", "Lütfen önce bir klasör seçin!")
             return
         
-        self.status_label.configure(text="Fotoğraflar yükleniyor...")
-        self.update()
-        
-        # Desteklenen formatlar
-        photo_extensions = {'.jpg', '.jpeg', '.png', '.gif', '.bmp', '.tiff', '.tif', '.heic', '.webp'}
-        
-        # Fotoğrafları bul
-        photos_with_dates = []
-        for root, dirs, files in os.walk(self.selected_folder):
-            for file in files:
-                if Path(file).suffix.lower() in photo_extensions:
-                    photo_path = os.path.join(root, file)
-                    try:
-                        photo_date = self.get_photo_date(photo_path)
-                        photos_with_dates.append((photo_path, photo_date, file))
-                    except Exception as e:
-                        continue
+        if self.active_job is not None:
+            if self.active_job.name != "scan" and self.active_job.name not in SWIPE_GROUP_MODES:
+                messagebox.showwarning("Uyarı", "Devam eden işlem bitmeden tarama başlatılamaz!")
+                return
+            # Önceki tarama veya gruplama araması hâlâ sürüyorsa durdur
+            self.active_job.cancel()
         
-        if not photos_with_dates:
-            messagebox.showinfo("Bilgi", "Seçilen klasörde fotoğraf bulunamadı!")
-            self.status_label.configure(text="Fotoğraf bulunamadı")
-            return
+        self.status_label.configure(text="Fotoğraflar yükleniyor...")
+        self.apply_btn.configure(state="disabled")
         
-        # Sıralama
+        # Sonuçlar geldikçe sıralı yerlerine eklenir
         reverse = (self.sort_order.get() == "descending")
-        photos_with_dates.sort(key=lambda x: x[1], reverse=reverse)
-        
-        self.photos = photos_with_dates
-        
-        # Mevcut görünüme göre göster
+        # ID'ler korunur: yeniden taramada aynı dosya aynı ID'yi alır, silinenler geçerli kalır
+        self.catalog.reset(reverse=reverse)
+        self.set_swipe_groups(None)  # Gruplar yeni tarama için yeniden hesaplanmalı
+        self.swipe_photos = []
+        self.current_swipe_index = 0
         if self.current_view == "gallery":
             self.display_photos()
         else:
-            # Swipe modunda, silinen fotoğrafları hariç tut
-            self.swipe_photos = [p for p in self.photos if p not in self.deleted_photos]
-            self.current_swipe_index = 0
             self.load_swipe_photo()
         
-        # Sıralama "Eskiden Yeniye" ise Uygula butonunu aktif et
-        if self.sort_order.get() == "ascending":
-            self.apply_btn.configure(state="normal")
-        else:
-            self.apply_btn.configure(state="disabled")
-        
-        self.status_label.configure(
-            text=f"{len(photos_with_dates)} fotoğraf bulundu ve sıralandı"
-        )
-    
-    def display_photos(self):
-        """Fotoğrafları grid layout'ta göster"""
-        self.clear_photos()
-        
-        if not self.photos:
-            return
-        
-        # Grid layout için frame'ler oluştur - Apple Music benzeri
-        row = 0
-        col = 0
-        max_cols = 6  # Apple Music benzeri daha geniş grid
-        
-        for photo_path, photo_date, filename in self.photos:
-            # Her fotoğraf için bir frame - Apple Music benzeri card
-            photo_frame = ctk.CTkFrame(
-                self.scrollable_frame,
-                fg_color=MACOS_COLORS['card'],
-                corner_radius=10,
-                border_width=0
-            )
-            photo_frame.grid(row=row, column=col, padx=10, pady=10, sticky="nsew")
-            
-            # Thumbnail oluştur (aspect ratio korunarak)
-            try:
-                img = Image.open(photo_path)
-                original_width, original_height = img.size
-                
-                # Maksimum boyut - Apple Music benzeri büyük thumbnail
-                max_size = 240
-                
-                # Aspect ratio'yu koruyarak boyutlandır
-                if original_width > original_height:
-                    # Yatay fotoğraf
-                    new_width = max_size
-                    new_height = int((original_height / original_width) * max_size)
-                else:
-                    # Dikey veya kare fotoğraf
-                    new_height = max_size
-                    new_width = int((original_width / original_height) * max_size)
-                
-                # Resmi yeniden boyutlandır
-                img_resized = img.resize((new_width, new_height), Image.Resampling.LANCZOS)
-                
-                # PIL Image'i CTkImage'a dönüştür (gerçek boyutlarla)
-                photo_img = ctk.CTkImage(light_image=img_resized, dark_image=img_resized, size=(new_width, new_height))
-                
-                # Apple Music benzeri thumbnail container
-                img_container = ctk.CTkFrame(photo_frame, fg_color="transparent")
-                img_container.pack(fill="x", padx=12, pady=(12, 0))
-                
-                img_label = ctk.CTkLabel(img_container, image=photo_img, text="", fg_color="transparent")
-                img_label.pack()
-                
-                # Cursor değişimi için wrapper fonksiyon
-                def make_click_handler(path):
-                    return lambda e: self.show_large_image(path)
-                
-                def make_cursor_handler(cursor_type):
-                    return lambda e: img_label.configure(cursor=cursor_type)
-                
-                # Mouse hover ve click event'leri
-                def on_enter(e):
-                    try:
-                        img_label.configure(cursor="hand2")
-                        # Tkinter widget'ına da cursor ayarla
-                        if hasattr(img_label, '_canvas'):
-                            img_label._canvas.configure(cursor="hand2")
-                    except:
-                        pass
-                
-                def on_leave(e):
-                    try:
-                        img_label.configure(cursor="")
-                        if hasattr(img_label, '_canvas'):
-                            img_label._canvas.configure(cursor="")
-                    except:
-                        pass
-                
-                img_label.bind("<Enter>", on_enter)
-                img_label.bind("<Leave>", on_leave)
-                img_label.bind("<Button-1>", make_click_handler(photo_path))
-                
-                # Frame'e de tıklama özelliği ekle
-                photo_frame.bind("<Button-1>", make_click_handler(photo_path))
-                try:
-                    if hasattr(photo_frame, '_canvas'):
-                        photo_frame._canvas.configure(cursor="hand2")
-                except:
-                    pass
-                
-            except Exception as e:
-                # Thumbnail oluşturulamazsa placeholder - Apple Music benzeri
-                placeholder_container = ctk.CTkFrame(photo_frame, fg_color="transparent")
-                placeholder_container.pack(fill="x", padx=12, pady=(12, 0))
-                
-                placeholder = ctk.CTkLabel(
-                    placeholder_container,
-                    text="📷",
-                    font=ctk.CTkFont(size=48),
-                    fg_color="transparent"
+        folder = self.selected_folder
+        index = self.metadata_index
+        
+        def scan(context):
+            # Fotoğrafları bul ve tarihlerini çıkar (büyük klasörlerde process havuzuyla)
+            found = 0
+            for batch in photo_scanner.iter_scan(
+                folder, workers=SCAN_WORKERS, index=index, cancel=context.cancel_event
+            ):
+                found += len(batch)
+                context.emit(batch)
+                context.progress(found)
+            return found
+        
+        def on_batch(records):
+            self.catalog.add(records)
+            self.refresh_scanned_photos()
+        
+        def on_done(found, error):
+            if not self.finish_job(job):
+                return  # Yerine yeni bir tarama başlatıldı
+            if isinstance(error, JobCancelled):
+                self.status_label.configure(
+                    text=f"Tarama iptal edildi ({len(self.photos)} fotoğraf)"
                 )
-                placeholder.pack(pady=80)
-                placeholder.configure(cursor="hand2")
-                try:
-                    placeholder._canvas.configure(cursor="hand2")
-                except:
-                    pass
-                placeholder.bind("<Button-1>", lambda e, path=photo_path: self.show_large_image(path))
-            
-            # Kart içerik container - Apple Music benzeri
-            card_content = ctk.CTkFrame(photo_frame, fg_color="transparent")
-            card_content.pack(fill="x", padx=12, pady=(0, 12))
+                return
+            if error is not None:
+                messagebox.showerror("Hata", f"Fotoğraflar taranırken hata oluştu: {str(error)}")
+                self.status_label.configure(text="Hata oluştu!")
+                return
             
-            # Dosya adı - Apple Music benzeri tipografi
-            name_label = ctk.CTkLabel(
-                card_content,
-                text=filename[:25] + "..." if len(filename) > 25 else filename,
-                font=ctk.CTkFont(size=13, weight="bold"),
-                wraplength=200,
-                text_color=MACOS_COLORS['text_primary'],
-                anchor="w"
-            )
-            name_label.pack(fill="x", pady=(10, 4))
+            if not self.photos:
+                messagebox.showinfo("Bilgi", "Seçilen klasörde fotoğraf bulunamadı!")
+                self.status_label.configure(text="Fotoğraf bulunamadı")
+                return
             
-            # Tarih bilgisi - Apple Music benzeri subtle text
-            date_str = photo_date.strftime("%d.%m.%Y")
-            date_label = ctk.CTkLabel(
-                card_content,
-                text=date_str,
-                font=ctk.CTkFont(size=12),
-                text_color=MACOS_COLORS['text_secondary'],
-                anchor="w"
-            )
-            date_label.pack(fill="x", pady=(0, 2))
+            # Sıralama "Eskiden Yeniye" ise Uygula butonunu aktif et
+            if self.sort_order.get() == "ascending":
+                self.apply_btn.configure(state="normal")
+            else:
+                self.apply_btn.configure(state="disabled")
             
-            # Sıra numarası - Apple Music benzeri subtle text
-            index = self.photos.index((photo_path, photo_date, filename)) + 1
-            index_label = ctk.CTkLabel(
-                card_content,
-                text=f"#{index}",
-                font=ctk.CTkFont(size=11),
-                text_color=MACOS_COLORS['text_tertiary'],
-                anchor="w"
+            self.status_label.configure(
+                text=f"{len(self.photos)} fotoğraf bulundu ve sıralandı"
             )
-            index_label.pack(fill="x", pady=(0, 0))
-            
-            # Grid pozisyonunu güncelle
-            col += 1
-            if col >= max_cols:
-                col = 0
-                row += 1
         
-        # Grid column ayarları
-        for i in range(max_cols):
-            self.scrollable_frame.grid_columnconfigure(i, weight=1)
+        job = self.start_job("scan", "Taranıyor", scan, on_partial=on_batch, on_done=on_done)
+    
+    def refresh_scanned_photos(self):
+        """Tarama sürerken büyüyen listeyi mevcut görünüme yansıt"""
+        if self.current_view == "gallery":
+            self.gallery.update_photos(self.photos)
+            return
+        
+        # Swipe modunda, gösterilen fotoğrafı yerinde tut
+        current = None
+        if self.current_swipe_index < len(self.swipe_photos):
+            current = self.swipe_photos[self.current_swipe_index]
+        self.swipe_photos = self.build_swipe_list()
+        if current is not None:
+            self.current_swipe_index = self.swipe_photos.index(current)
+            self.swipe_progress_label.configure(
+                text=f"{self.current_swipe_index + 1} / {len(self.swipe_photos)}"
+            )
+        elif self.current_swipe_index < len(self.swipe_photos):
+            # Henüz fotoğraf gösterilmiyordu - yeni gelenlerden ilkini göster
+            self.load_swipe_photo()
+    
+    # --- Arka plan işleri ---------------------------------------------------
+    
+    def start_job(self, name, title, func, on_partial=None, on_done=None):
+        """func(context)'i arka planda başlat; ilerleme kenar çubuğunda gösterilir"""
+        job = self.jobs.start(
+            name, func,
+            on_progress=lambda progress: self.show_job_progress(job, title, progress),
+            on_partial=on_partial,
+            on_done=on_done
+        )
+        self.active_job = job
+        self.show_job_widgets()
+        self.schedule_job_poll()
+        return job
+    
+    def finish_job(self, job):
+        """İş bittiğinde çağrılır; iş hâlâ etkin işse True döner"""
+        if job is not self.active_job:
+            return False
+        self.active_job = None
+        self.hide_job_widgets()
+        return True
+    
+    def cancel_active_job(self):
+        """Devam eden işi iptal et"""
+        if self.active_job is not None:
+            self.active_job.cancel()
+            self.job_cancel_btn.configure(state="disabled", text="İptal ediliyor...")
+    
+    def schedule_job_poll(self):
+        if not self.job_poll_pending:
+            self.job_poll_pending = True
+            self.after(JOB_POLL_INTERVAL_MS, self.poll_jobs)
+    
+    def poll_jobs(self):
+        """Arka plan işlerinin olaylarını ana thread'de işle"""
+        self.job_poll_pending = False
+        self.jobs.poll()
+        if self.jobs.busy:
+            self.schedule_job_poll()
+    
+    def show_job_widgets(self):
+        self.job_cancel_btn.configure(state="normal", text="İptal")
+        self.job_progress.configure(mode="indeterminate")
+        self.job_progress.start()
+        self.job_frame.pack(fill="x")
+    
+    def hide_job_widgets(self):
+        self.job_progress.stop()
+        self.job_frame.pack_forget()
+    
+    def show_job_progress(self, job, title, progress):
+        """İlerlemeyi (sayı, hız, kalan süre) durum etiketinde göster"""
+        if job is not self.active_job:
+            return
+        if progress.total is None:
+            text = f"{title}: {progress.done} • {progress.rate:.0f}/sn"
+        else:
+            text = f"{title}: {progress.done} / {progress.total} • {progress.rate:.0f}/sn"
+            if progress.eta is not None:
+                text += f" • ~{format_duration(progress.eta)} kaldı"
+            if self.job_progress.cget("mode") != "determinate":
+                self.job_progress.stop()
+                self.job_progress.configure(mode="determinate")
+            self.job_progress.set(progress.fraction or 0)
+        self.status_label.configure(text=text)
+    
+    def display_photos(self):
+        """Fotoğrafları grid layout'ta göster (yalnızca görünür kartlar oluşturulur)"""
+        self.gallery.set_photos(self.photos)
     
     def show_large_image(self, photo_path):
-        """Fotoğrafı büyük boyutta göster"""
+        """Fotoğrafı büyük görünümde göster (pencere bir kez oluşturulur, yeniden kullanılır)"""
+        photo_id = self.catalog.id_of(photo_path)
+        if photo_id is None or self.navigation_blocked():
+            return
         try:
-            # Yeni pencere oluştur - macOS benzeri
-            large_window = ctk.CTkToplevel(self)
-            large_window.title(f"Fotoğraf: {os.path.basename(photo_path)}")
-            large_window.geometry("1000x750")
-            large_window.configure(fg_color=MACOS_COLORS['background'])
-            
-            # Pencereyi modal yap (ana pencereyi blokla)
-            large_window.transient(self)
-            large_window.grab_set()
-            
-            # Pencere kapatma protokolünü ayarla
-            def on_close():
-                large_window.grab_release()
-                large_window.destroy()
-            large_window.protocol("WM_DELETE_WINDOW", on_close)
-            
-            # macOS benzeri header
-            header_frame = ctk.CTkFrame(
-                large_window,
-                fg_color=MACOS_COLORS['surface'],
-                corner_radius=0,
-                height=60
-            )
-            header_frame.pack(fill="x", padx=0, pady=0)
-            header_frame.pack_propagate(False)
-            
-            title_label = ctk.CTkLabel(
-                header_frame,
-                text=os.path.basename(photo_path),
-                font=ctk.CTkFont(size=18, weight="bold"),
-                text_color=MACOS_COLORS['text_primary']
-            )
-            title_label.pack(pady=18)
-            
-            # Ana içerik container
-            content_frame = ctk.CTkFrame(
-                large_window,
-                fg_color=MACOS_COLORS['background'],
-                corner_radius=0
-            )
-            content_frame.pack(fill="both", expand=True, padx=30, pady=25)
-            
-            # Fotoğraf kartı
-            photo_card = ctk.CTkFrame(
-                content_frame,
-                fg_color=MACOS_COLORS['card'],
-                corner_radius=12,
-                border_width=1,
-                border_color=MACOS_COLORS['border']
-            )
-            photo_card.pack(fill="both", expand=True, padx=0, pady=(0, 15))
-            
-            # Fotoğrafı yükle
-            img = Image.open(photo_path)
-            original_width, original_height = img.size
-            
-            # Pencere boyutuna göre ölçekle
-            max_width = 900
-            max_height = 550
-            
-            # Aspect ratio korunarak boyutlandır
-            scale_w = max_width / original_width
-            scale_h = max_height / original_height
-            scale = min(scale_w, scale_h)
-            
-            new_width = int(original_width * scale)
-            new_height = int(original_height * scale)
-            
-            img_resized = img.resize((new_width, new_height), Image.Resampling.LANCZOS)
-            photo_img = ctk.CTkImage(light_image=img_resized, dark_image=img_resized, size=(new_width, new_height))
-            
-            # Fotoğrafı göster
-            img_label = ctk.CTkLabel(photo_card, image=photo_img, text="", fg_color="transparent")
-            img_label.pack(pady=25, padx=25)
-            
-            # Event propagation'ı durdur (pencereyi kapatmayı önle)
-            def stop_propagation(event):
-                return "break"
-            
-            # Tüm widget'larda click event'lerini durdur
-            img_label.bind("<Button-1>", stop_propagation)
-            photo_card.bind("<Button-1>", stop_propagation)
-            content_frame.bind("<Button-1>", stop_propagation)
-            header_frame.bind("<Button-1>", stop_propagation)
-            
-            # ESC tuşu ile kapatma
-            def on_escape(event):
-                on_close()
-            large_window.bind("<Escape>", on_escape)
-            
-            # Dosya bilgileri kartı
-            info_card = ctk.CTkFrame(
-                content_frame,
-                fg_color=MACOS_COLORS['card'],
-                corner_radius=12,
-                border_width=1,
-                border_color=MACOS_COLORS['border']
-            )
-            info_card.pack(pady=(0, 15), padx=0, fill="x")
-            
-            info_inner = ctk.CTkFrame(info_card, fg_color="transparent")
-            info_inner.pack(fill="x", padx=20, pady=15)
-            
-            # Tarih bilgisi
-            photo_date = self.get_photo_date(photo_path)
-            date_str = photo_date.strftime("%d.%m.%Y %H:%M:%S")
-            
-            info_label = ctk.CTkLabel(
-                info_inner,
-                text=f"📅 {date_str}  •  📁 {os.path.basename(photo_path)}",
-                font=ctk.CTkFont(size=14),
-                text_color=MACOS_COLORS['text_primary']
-            )
-            info_label.pack(side="left")
-            
-            # Kapat butonu - macOS benzeri
-            close_btn = ctk.CTkButton(
-                content_frame,
-                text="Kapat (ESC)",
-                command=on_close,
-                width=120,
-                height=38,
-                font=ctk.CTkFont(size=14, weight="normal"),
-                fg_color=MACOS_COLORS['primary'],
-                hover_color=MACOS_COLORS['primary_hover'],
-                corner_radius=8
-            )
-            close_btn.pack(pady=(0, 0))
-            
-            # Pencereyi focus'a al ve güncelle
-            large_window.focus_set()
-            large_window.lift()
-            large_window.update_idletasks()
-            
+            if self.photo_viewer is None:
+                # Görüntüleyici ve döşeme piramidi ilk açılışta yüklenir
+                from photo_viewer import PhotoViewerWindow
+                from tile_pyramid import TilePyramid
+                
+                self.photo_viewer = PhotoViewerWindow(
+                    self,
+                    self.theme,
+                    self.thumbnail_pipeline,
+                    # Döşemeler büyük önizleme önbelleğinde saklanır
+                    load_pyramid=lambda path: TilePyramid(path, self.preview_cache),
+                    load_overview=lambda path: self.get_large_preview(path, SWIPE_MASTER_SIZE)
+                )
+            self.photo_viewer.show_photo(self.catalog, photo_id)
         except Exception as e:
             messagebox.showerror("Hata", f"Fotoğraf açılamadı: {str(e)}")
     
@@ -1522,6 +1970,10 @@ class PhotoSorterApp(ctk.CTk):
             messagebox.showwarning("Uyarı", "Bu özellik sadece 'Eskiden Yeniye' sıralamasında kullanılabilir!")
             return
         
+        if self.active_job is not None:
+            messagebox.showwarning("Uyarı", "Devam eden işlem bitmeden yeniden adlandırma yapılamaz!")
+            return
+        
         # Onay al
         result = messagebox.askyesno(
             "Onay",
@@ -1533,61 +1985,148 @@ class PhotoSorterApp(ctk.CTk):
             return
         
         self.status_label.configure(text="Fotoğraflar yeniden adlandırılıyor...")
-        self.update()
-        
-        # Geri alma için yedek oluştur
-        self.backup_info = []
+        self.apply_btn.configure(state="disabled")
         
         # Tüm fotoğrafları yeniden adlandır (swipe'da silinenler dahil)
-        photos_to_rename = self.photos
+        photos_to_rename = list(self.photos)
         
         if not photos_to_rename:
             messagebox.showinfo("Bilgi", "Yeniden adlandırılacak fotoğraf yok!")
             return
         
-        try:
-            for index, (photo_path, photo_date, filename) in enumerate(photos_to_rename, 1):
-                # Orijinal bilgileri kaydet
-                self.backup_info.append({
-                    'old_path': photo_path,
-                    'old_name': filename,
-                    'new_name': f"IMG_{index:04d}{Path(filename).suffix}"
-                })
-                
-                # Yeni dosya adı
-                new_filename = f"IMG_{index:04d}{Path(filename).suffix}"
-                new_path = os.path.join(os.path.dirname(photo_path), new_filename)
-                
-                # Eğer yeni isim zaten varsa, farklı bir isim kullan
-                if os.path.exists(new_path) and new_path != photo_path:
-                    counter = 1
-                    base_name = f"IMG_{index:04d}"
-                    while os.path.exists(new_path):
-                        new_filename = f"{base_name}_{counter}{Path(filename).suffix}"
-                        new_path = os.path.join(os.path.dirname(photo_path), new_filename)
-                        counter += 1
-                    self.backup_info[-1]['new_name'] = new_filename
-                
-                # Dosyayı yeniden adlandır
-                if photo_path != new_path:
-                    os.rename(photo_path, new_path)
-                    # Yedek bilgisini güncelle
-                    self.backup_info[-1]['new_path'] = new_path
+        plans = []  # İş bitene kadar yalnızca worker yazar
+        
+        journal = self.rename_journal
+        folder = self.selected_folder
+        
+        def rename_all(context):
+            # Tüm eski -> yeni eşlemesi önce bellekte hesaplanır (klasör başına tek listeleme)
+            plan = plan_renames(photos_to_rename)
+            plans.append(plan)
+            context.progress(0, len(plan.steps), force=True)
+            photo_engine.execute_plan(
+                plan, journal, "apply", folder, check=context.check, progress=context.progress
+            )
+            return plan
+        
+        def on_done(plan, error):
+            self.finish_job(job)
+            plan = plans[0] if plans else None
+            moves = plan.completed_moves() if plan is not None else []
             
-            # Fotoğrafları yeniden yükle
-            self.sort_photos()
+            # Geri alma için yedek oluştur (yarıda kalsa bile yapılanlar geri alınabilir)
+            self.set_undo(plan.journal_id if plan is not None else None, moves)
             
-            # Geri Al butonunu aktif et
-            self.undo_btn.configure(state="normal")
+            # Katalogu ve indeksteki tarihleri yeni yollara taşı (yeniden tarama yok)
+            self.apply_renames(moves)
+            self.resume_previews()
+            self.apply_btn.configure(state="normal")
             
-            self.status_label.configure(
-                text=f"{len(photos_to_rename)} fotoğraf başarıyla yeniden adlandırıldı!"
-            )
-            messagebox.showinfo("Başarılı", "Fotoğraflar başarıyla yeniden adlandırıldı!")
+            if moves:
+                self.undo_btn.configure(state="normal")
             
-        except Exception as e:
-            messagebox.showerror("Hata", f"Dosyalar yeniden adlandırılırken hata oluştu: {str(e)}")
-            self.status_label.configure(text="Hata oluştu!")
+            if isinstance(error, JobCancelled):
+                self.status_label.configure(
+                    text=f"Yeniden adlandırma iptal edildi ({len(moves)} dosya değişti)"
+                )
+            elif error is not None:
+                messagebox.showerror("Hata", f"Dosyalar yeniden adlandırılırken hata oluştu: {str(error)}")
+                self.status_label.configure(text="Hata oluştu!")
+                # Geçici adda kalan dosya varsa hemen kurtarma öner
+                if plan is not None and plan.parked:
+                    self.check_rename_journal()
+            else:
+                self.status_label.configure(
+                    text=f"{len(moves)} fotoğraf yeniden adlandırıldı, {plan.skipped} zaten doğru adda"
+                )
+                messagebox.showinfo("Başarılı", "Fotoğraflar başarıyla yeniden adlandırıldı!")
+        
+        self.pause_previews()
+        job = self.start_job("apply", "Yeniden adlandırılıyor", rename_all, on_done=on_done)
+    
+    def check_rename_journal(self):
+        """Günlükte yarım kalmış işlem varsa kurtar, geri alınabilir işlemi yükle"""
+        journal = self.rename_journal
+        if journal is None or self.active_job is not None:
+            return
+        
+        def inspect(context):
+            incomplete = [(batch, batch.probe_executed()) for batch in journal.incomplete()]
+            return incomplete, journal.undoable()
+        
+        def on_done(result, error):
+            self.finish_job(job)
+            if error is not None:
+                return
+            incomplete, undoable = result
+            if incomplete:
+                decisions = []
+                for batch, executed in incomplete:
+                    if batch.kind == "rollback":
+                        # Yarım kalmış geri sarma her zaman tamamlanır
+                        decisions.append((batch, True))
+                        continue
+                    forward = messagebox.askyesno(
+                        "Yarım Kalan İşlem",
+                        f"{batch.time} tarihinde başlayan yeniden adlandırma yarıda kalmış "
+                        f"({executed} / {len(batch.steps)} adım).\n\n"
+                        "Tamamlamak için 'Evet', yapılanları geri almak için 'Hayır' seçin."
+                    )
+                    decisions.append((batch, forward))
+                self.recover_rename_journal(decisions)
+            elif undoable is not None:
+                self.load_undoable(*undoable)
+        
+        job = self.start_job("journal", "Günlük kontrol ediliyor", inspect, on_done=on_done)
+    
+    def recover_rename_journal(self, decisions):
+        """Yarım kalmış grupları kullanıcının seçimine göre ileri veya geri sar"""
+        journal = self.rename_journal
+        
+        def recover_all(context):
+            moves = []
+            for batch, forward in decisions:
+                plan = journal.recover(batch, forward, progress=context.progress)
+                moves.extend(plan.completed_moves())
+            return moves
+        
+        def on_done(moves, error):
+            self.finish_job(job)
+            if error is not None:
+                self.resume_previews()
+                messagebox.showerror("Hata", f"Yarım kalan işlem kurtarılamadı: {str(error)}")
+                self.status_label.configure(text="Kurtarma hatası!")
+                return
+            # Bu oturumda yüklenmiş fotoğraflar varsa yeni yollarına taşı
+            self.apply_renames(moves)
+            self.resume_previews()
+            self.status_label.configure(text="Yarım kalan işlem kurtarıldı")
+            # Kurtarılan grup artık tamamlandı - geri alınabilir işlemi yeniden ara
+            self.check_rename_journal()
+        
+        self.pause_previews()
+        job = self.start_job("recover", "Kurtarılıyor", recover_all, on_done=on_done)
+    
+    def set_undo(self, batch_id, moves):
+        """[(eski_yol, yeni_yol), ...] taşımalarını geri alma yedeği olarak sakla"""
+        self.undo_batch_id = batch_id
+        self.backup_info = [
+            {
+                'old_path': old_path,
+                'old_name': os.path.basename(old_path),
+                'new_name': os.path.basename(new_path),
+                'new_path': new_path
+            }
+            for old_path, new_path in moves
+        ]
+    
+    def load_undoable(self, batch, moves):
+        """Önceki oturumdaki son uygulamayı geri alınabilir hale getir"""
+        self.set_undo(batch.id, moves)
+        self.undo_btn.configure(state="normal")
+        self.status_label.configure(
+            text=f"Önceki işlem geri alınabilir ({len(moves)} dosya, {batch.time})"
+        )
     
     def undo_changes(self):
         """Yeniden adlandırma işlemini geri al"""
@@ -1595,6 +2134,10 @@ class PhotoSorterApp(ctk.CTk):
             messagebox.showinfo("Bilgi", "Geri alınacak değişiklik yok!")
             return
         
+        if self.active_job is not None:
+            messagebox.showwarning("Uyarı", "Devam eden işlem bitmeden geri alma yapılamaz!")
+            return
+        
         result = messagebox.askyesno(
             "Onay",
             "Tüm değişiklikler geri alınacak. Emin misiniz?"
@@ -1604,31 +2147,65 @@ class PhotoSorterApp(ctk.CTk):
             return
         
         self.status_label.configure(text="Değişiklikler geri alınıyor...")
-        self.update()
-        
-        try:
-            # Ters sırada geri al (son değişiklikten başla)
-            for backup in reversed(self.backup_info):
-                if 'new_path' in backup and os.path.exists(backup['new_path']):
-                    old_path = backup['old_path']
-                    new_path = backup['new_path']
-                    
-                    # Eğer orijinal dosya yoksa veya farklıysa geri al
-                    if not os.path.exists(old_path) or old_path != new_path:
-                        os.rename(new_path, old_path)
-            
-            self.backup_info = []
-            self.undo_btn.configure(state="disabled")
-            
-            # Fotoğrafları yeniden yükle
-            self.sort_photos()
+        self.undo_btn.configure(state="disabled")
+        
+        backups = list(self.backup_info)
+        plans = []
+        journal = self.rename_journal
+        folder = self.selected_folder
+        undo_batch_id = self.undo_batch_id
+        
+        def restore_all(context):
+            # Takaslar ve döngüler de güvenle geri alınır (üzerine yazma yok)
+            plan = photo_engine.plan_undo([
+                (backup['old_path'], backup['new_path'])
+                for backup in backups if 'new_path' in backup
+            ])
+            plans.append(plan)
+            context.progress(0, len(plan.steps), force=True)
+            photo_engine.execute_plan(
+                plan, journal, "undo", folder, undoes=undo_batch_id,
+                check=context.check, progress=context.progress
+            )
+            return plan
+        
+        def on_done(plan, error):
+            self.finish_job(job)
+            plan = plans[0] if plans else None
+            restored = plan.completed_moves() if plan is not None else []  # (yeni_yol, eski_yol)
+            self.apply_renames(restored)
+            self.resume_previews()
             
-            self.status_label.configure(text="Değişiklikler başarıyla geri alındı!")
-            messagebox.showinfo("Başarılı", "Tüm değişiklikler geri alındı!")
+            # Geri alınanları çıkar; kalanlar (hata, iptal, çakışma) tekrar denenebilir
+            restored_paths = {new_path for new_path, _ in restored}
+            skipped_paths = {src for src, _ in plan.missing} if plan is not None else set()
+            self.backup_info = [
+                backup for backup in self.backup_info
+                if backup.get('new_path') not in restored_paths
+                and backup.get('new_path') not in skipped_paths
+            ]
+            if self.backup_info:
+                self.undo_btn.configure(state="normal")
             
-        except Exception as e:
-            messagebox.showerror("Hata", f"Geri alma işlemi sırasında hata oluştu: {str(e)}")
-            self.status_label.configure(text="Geri alma hatası!")
+            if isinstance(error, JobCancelled):
+                self.status_label.configure(
+                    text=f"Geri alma iptal edildi ({len(restored)} dosya geri alındı)"
+                )
+            elif error is not None:
+                messagebox.showerror("Hata", f"Geri alma işlemi sırasında hata oluştu: {str(error)}")
+                self.status_label.configure(text="Geri alma hatası!")
+                if plan is not None and plan.parked:
+                    self.check_rename_journal()
+            elif plan.conflicts:
+                self.status_label.configure(
+                    text=f"{len(plan.conflicts)} dosya geri alınamadı: orijinal adı başka bir dosya kullanıyor"
+                )
+            else:
+                self.status_label.configure(text="Değişiklikler başarıyla geri alındı!")
+                messagebox.showinfo("Başarılı", "Tüm değişiklikler geri alındı!")
+        
+        self.pause_previews()
+        job = self.start_job("undo", "Geri alınıyor", restore_all, on_done=on_done)
 
 if __name__ == "__main__":
     app = PhotoSorterApp()
@@ -0,0 +1,401 @@
+"""Fotoğraf Tarih Sıralayıcı - komut satırı aracı (ekransız sunucular ve betikler için).
+
+Örnekler:
+    python photo_sorter_cli.py scan /fotograflar
+    python photo_sorter_cli.py sort /fotograflar --descending --json
+    python photo_sorter_cli.py plan /fotograflar
+    python photo_sorter_cli.py duplicates /fotograflar
+    python photo_sorter_cli.py apply /fotograflar --yes
+    python photo_sorter_cli.py undo --yes
+    python photo_sorter_cli.py recover forward
+
+`--json` ile her satır bir JSON nesnesidir ("type": "photo", "rename",
+"duplicate" veya "summary"); milyonlarca dosyada da çıktı akış halinde işlenebilir.
+"""
+import argparse
+import json
+import os
+import signal
+import sys
+import threading
+
+import photo_engine
+import photo_scanner
+from background_jobs import JobCancelled
+from exact_duplicates import find_duplicates
+from rename_planner import plan_renames
+
+# Çıkış kodları
+EXIT_OK = 0
+EXIT_ERROR = 1
+EXIT_USAGE = 2
+EXIT_CANCELLED = 130
+
+
+class Output:
+    """Metin veya JSON satırları olarak stdout'a, ilerlemeyi stderr'e yazar"""
+
+    def __init__(self, as_json):
+        self.as_json = as_json
+        self.show_progress = sys.stderr.isatty()
+
+    def photo(self, index, photo):
+        photo_path, date, filename = photo
+        if self.as_json:
+            self._json({"type": "photo", "index": index, "path": photo_path,
+                        "name": filename, "date": date.isoformat()})
+        else:
+            print(f"{index}\t{date:%Y-%m-%d %H:%M:%S}\t{photo_path}")
+
+    def rename(self, old_path, new_path):
+        if self.as_json:
+            self._json({"type": "rename", "old": old_path, "new": new_path})
+        else:
+            print(f"{old_path} -> {os.path.basename(new_path)}")
+
+    def duplicate(self, group, photo_path, size):
+        if self.as_json:
+            self._json({"type": "duplicate", "group": group, "path": photo_path, "size": size})
+        else:
+            print(f"{group}\t{size}\t{photo_path}")
+
+    def summary(self, text, **fields):
+        if self.as_json:
+            self._json({"type": "summary", **fields})
+        else:
+            print(text)
+
+    def progress(self, text):
+        if self.show_progress:
+            sys.stderr.write(f"\r{text}\033[K")
+            sys.stderr.flush()
+
+    def end_progress(self):
+        if self.show_progress:
+            sys.stderr.write("\r\033[K")
+            sys.stderr.flush()
+
+    def _json(self, record):
+        sys.stdout.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+
+def _cancel_on_interrupt():
+    """Ctrl+C'yi iptal isteğine çevir: iş güvenli bir noktada durur"""
+    cancel = threading.Event()
+    signal.signal(signal.SIGINT, lambda signum, frame: cancel.set())
+
+    def check():
+        if cancel.is_set():
+            raise JobCancelled()
+
+    return cancel, check
+
+
+def _confirm(args, message):
+    """--yes verilmediyse kullanıcıdan onay al (etkileşimsiz kabukta reddet)"""
+    if args.yes:
+        return True
+    if not sys.stdin.isatty():
+        print("Hata: etkileşimsiz çalıştırmada --yes gerekli", file=sys.stderr)
+        return False
+    answer = input(f"{message} Devam edilsin mi? [e/H] ").strip().lower()
+    return answer in ("e", "evet", "y", "yes")
+
+
+def _scan(args, out, cancel=None):
+    index = photo_engine.open_index(not args.no_index)
+    try:
+        photos = photo_engine.scan_sorted(
+            args.folder,
+            reverse=getattr(args, "descending", False),
+            workers=args.workers,
+            index=index,
+            cancel=cancel,
+            progress=lambda found: out.progress(f"Taranıyor: {found} fotoğraf"),
+        )
+    finally:
+        out.end_progress()
+        if index is not None:
+            index.close()
+    return photos
+
+
+def cmd_scan(args, out):
+    """Fotoğrafları klasör sırasıyla listele"""
+    index = photo_engine.open_index(not args.no_index)
+    records = []
+    try:
+        for batch in photo_scanner.iter_scan(args.folder, workers=args.workers, index=index):
+            records.extend(batch)
+            out.progress(f"Taranıyor: {len(records)} fotoğraf")
+    finally:
+        out.end_progress()
+        if index is not None:
+            index.close()
+    records.sort(key=lambda record: record[0])
+    for count, (_, photo_path, date, filename, _) in enumerate(records, 1):
+        out.photo(count, (photo_path, date, filename))
+    out.summary(f"{len(records)} fotoğraf bulundu", command="scan", folder=args.folder,
+                photos=len(records))
+    return EXIT_OK
+
+
+def cmd_sort(args, out):
+    """Fotoğrafları çekim tarihine göre sıralı listele"""
+    photos = _scan(args, out)
+    for index, photo in enumerate(photos, 1):
+        out.photo(index, photo)
+    out.summary(
+        f"{len(photos)} fotoğraf sıralandı", command="sort", folder=args.folder,
+        photos=len(photos), order="descending" if args.descending else "ascending"
+    )
+    return EXIT_OK
+
+
+def cmd_duplicates(args, out):
+    """Bayt bayt aynı dosyaları grup grup listele (dosyalara dokunmaz)"""
+    cancel, check = _cancel_on_interrupt()
+    index = photo_engine.open_index(not args.no_index)
+    files = []
+    try:
+        for batch in photo_scanner.iter_scan(args.folder, workers=args.workers, index=index, cancel=cancel):
+            files.extend((photo_path, photo_path, size) for _, photo_path, _, _, size in batch)
+            out.progress(f"Taranıyor: {len(files)} fotoğraf")
+        check()
+        sizes = {photo_path: size for _, photo_path, size in files}
+        stages = {"head": "Baş bloklar", "full": "Tam hash"}
+        groups = find_duplicates(
+            files, check=check,
+            progress=lambda done, total, stage: out.progress(f"{stages[stage]}: {done} / {total}")
+        )
+    except JobCancelled:
+        return EXIT_CANCELLED
+    finally:
+        out.end_progress()
+        if index is not None:
+            index.close()
+
+    extra_bytes = 0
+    for number, group in enumerate(groups, 1):
+        for photo_path in group:
+            out.duplicate(number, photo_path, sizes[photo_path])
+        extra_bytes += (sizes[group[0]] or 0) * (len(group) - 1)
+    extra = sum(len(group) - 1 for group in groups)
+    out.summary(
+        f"{len(groups)} kopya grubu, {extra} fazla kopya ({extra_bytes / (1024 * 1024):.1f} MB)",
+        command="duplicates", folder=args.folder, photos=len(files), groups=len(groups),
+        extra_copies=extra, extra_bytes=extra_bytes
+    )
+    return EXIT_OK
+
+
+def cmd_plan(args, out):
+    """Yapılacak yeniden adlandırmaları göster (dosyalara dokunmaz)"""
+    photos = _scan(args, out)
+    plan = plan_renames(photos)
+    moves = plan.final_moves()
+    for old_path, new_path in moves:
+        out.rename(old_path, new_path)
+    out.summary(
+        f"{len(moves)} dosya yeniden adlandırılacak, {plan.skipped} zaten doğru adda "
+        f"({len(plan.steps)} adım)",
+        command="plan", folder=args.folder, photos=len(photos), renames=len(moves),
+        skipped=plan.skipped, steps=len(plan.steps)
+    )
+    return EXIT_OK
+
+
+def cmd_apply(args, out):
+    """Fotoğrafları eskiden yeniye `IMG_0001...` olarak yeniden adlandır"""
+    journal = photo_engine.open_journal(not args.no_journal)
+    if journal is not None and journal.incomplete():
+        print("Hata: yarım kalmış bir işlem var; önce 'recover forward' veya "
+              "'recover back' çalıştırın", file=sys.stderr)
+        return EXIT_USAGE
+
+    # Tarama sırasında ve onay isteminde Ctrl+C doğrudan çıkar (KeyboardInterrupt);
+    # iptal işleyicisi yalnızca yeniden adlandırma başlarken kurulur
+    photos = _scan(args, out)
+    if not photos:
+        out.summary("Fotoğraf bulunamadı", command="apply", folder=args.folder, renamed=0)
+        return EXIT_OK
+    if not _confirm(args, f"{len(photos)} fotoğraf yeniden adlandırılacak."):
+        return EXIT_USAGE
+
+    cancel, check = _cancel_on_interrupt()
+    index = photo_engine.open_index(not args.no_index)
+    plan = plan_renames(photos)
+    try:
+        photo_engine.execute_plan(
+            plan, journal, "apply", args.folder, check=check,
+            progress=lambda done, total: out.progress(f"Yeniden adlandırılıyor: {done} / {total}")
+        )
+        status = EXIT_OK
+    except JobCancelled:
+        status = EXIT_CANCELLED
+    finally:
+        out.end_progress()
+        moves = plan.completed_moves()
+        photo_engine.record_renames(index, moves)
+        if index is not None:
+            index.close()
+
+    for old_path, new_path in moves:
+        out.rename(old_path, new_path)
+    text = f"{len(moves)} dosya yeniden adlandırıldı, {plan.skipped} zaten doğru adda"
+    if status == EXIT_CANCELLED:
+        text += " (iptal edildi)"
+    out.summary(
+        text, command="apply", folder=args.folder, renamed=len(moves), skipped=plan.skipped,
+        conflicts=len(plan.conflicts), cancelled=status == EXIT_CANCELLED, batch=plan.journal_id
+    )
+    return status
+
+
+def cmd_undo(args, out):
+    """Günlükteki son uygulamayı geri al (önceki oturumlar dahil)"""
+    journal = photo_engine.open_journal()
+    if journal is None:
+        print("Hata: yeniden adlandırma günlüğü açılamadı", file=sys.stderr)
+        return EXIT_ERROR
+    undoable = journal.undoable()
+    if undoable is None:
+        out.summary("Geri alınacak değişiklik yok", command="undo", restored=0)
+        return EXIT_OK
+    batch, moves = undoable
+    if not _confirm(args, f"{batch.time} tarihli işlemdeki {len(moves)} dosya geri alınacak."):
+        return EXIT_USAGE
+
+    cancel, check = _cancel_on_interrupt()
+    index = photo_engine.open_index(not args.no_index)
+    plan = photo_engine.plan_undo(moves)
+    try:
+        photo_engine.execute_plan(
+            plan, journal, "undo", batch.folder, undoes=batch.id, check=check,
+            progress=lambda done, total: out.progress(f"Geri alınıyor: {done} / {total}")
+        )
+        status = EXIT_OK
+    except JobCancelled:
+        status = EXIT_CANCELLED
+    finally:
+        out.end_progress()
+        restored = plan.completed_moves()
+        photo_engine.record_renames(index, restored)
+        if index is not None:
+            index.close()
+
+    for new_path, old_path in restored:
+        out.rename(new_path, old_path)
+    out.summary(
+        f"{len(restored)} dosya geri alındı"
+        + (f", {len(plan.conflicts)} dosyanın orijinal adı kullanımda" if plan.conflicts else ""),
+        command="undo", restored=len(restored), conflicts=len(plan.conflicts),
+        missing=len(plan.missing), cancelled=status == EXIT_CANCELLED
+    )
+    return status
+
+
+def cmd_recover(args, out):
+    """Yarıda kalmış işlemleri tamamla (forward) veya geri sar (back)"""
+    journal = photo_engine.open_journal()
+    if journal is None:
+        print("Hata: yeniden adlandırma günlüğü açılamadı", file=sys.stderr)
+        return EXIT_ERROR
+    index = photo_engine.open_index(not args.no_index)
+    try:
+        moves = photo_engine.recover(
+            journal, args.direction == "forward", index=index,
+            progress=lambda done, total: out.progress(f"Kurtarılıyor: {done} / {total}")
+        )
+    finally:
+        out.end_progress()
+        if index is not None:
+            index.close()
+    for old_path, new_path in moves:
+        out.rename(old_path, new_path)
+    out.summary(f"{len(moves)} dosya taşındı", command="recover",
+                direction=args.direction, moved=len(moves))
+    return EXIT_OK
+
+
+def _add_common_options(parser, defaults=True):
+    """--json, --no-index ve --workers seçenekleri
+
+    Seçenekler komuttan önce de sonra da yazılabilir. Alt komutlarda
+    varsayılan SUPPRESS'tir: orada verilmeyen seçenek, komuttan önce
+    verilmiş değeri ezmez.
+    """
+    def default(value):
+        return value if defaults else argparse.SUPPRESS
+
+    parser.add_argument("--json", action="store_true", default=default(False),
+                        help="çıktıyı JSON satırları olarak yaz")
+    parser.add_argument("--no-index", action="store_true", default=default(False),
+                        help="kalıcı metadata indeksini kullanma")
+    parser.add_argument("--workers", type=int, default=default(photo_scanner.default_scan_workers()),
+                        help="tarih çıkarma için process sayısı")
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="photo_sorter_cli",
+        description="Fotoğrafları EXIF çekim tarihine göre sıralar ve yeniden adlandırır."
+    )
+    _add_common_options(parser)
+    common = argparse.ArgumentParser(add_help=False)
+    _add_common_options(common, defaults=False)
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    scan = commands.add_parser("scan", help="fotoğrafları ve tarihlerini listele", parents=[common])
+    scan.add_argument("folder")
+    scan.set_defaults(func=cmd_scan)
+
+    sort = commands.add_parser("sort", help="fotoğrafları tarihe göre sıralı listele", parents=[common])
+    sort.add_argument("folder")
+    sort.add_argument("--descending", action="store_true", help="yeniden eskiye sırala")
+    sort.set_defaults(func=cmd_sort)
+
+    plan = commands.add_parser("plan", help="yapılacak yeniden adlandırmaları göster", parents=[common])
+    plan.add_argument("folder")
+    plan.set_defaults(func=cmd_plan)
+
+    duplicates = commands.add_parser("duplicates", help="bayt bayt aynı dosyaları grup grup listele", parents=[common])
+    duplicates.add_argument("folder")
+    duplicates.set_defaults(func=cmd_duplicates)
+
+    apply = commands.add_parser("apply", help="eskiden yeniye IMG_0001... olarak yeniden adlandır", parents=[common])
+    apply.add_argument("folder")
+    apply.add_argument("--yes", "-y", action="store_true", help="onay sorma")
+    apply.add_argument("--no-journal", action="store_true",
+                       help="günlük tutma (çökme sonrası kurtarma ve geri alma olmaz)")
+    apply.set_defaults(func=cmd_apply)
+
+    undo = commands.add_parser("undo", help="son uygulamayı geri al", parents=[common])
+    undo.add_argument("--yes", "-y", action="store_true", help="onay sorma")
+    undo.set_defaults(func=cmd_undo)
+
+    recover = commands.add_parser("recover", help="yarıda kalmış işlemi tamamla veya geri sar", parents=[common])
+    recover.add_argument("direction", choices=("forward", "back"))
+    recover.set_defaults(func=cmd_recover)
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    if getattr(args, "folder", None) is not None and not os.path.isdir(args.folder):
+        print(f"Hata: klasör bulunamadı: {args.folder}", file=sys.stderr)
+        return EXIT_USAGE
+    out = Output(args.json)
+    try:
+        return args.func(args, out)
+    except KeyboardInterrupt:
+        out.end_progress()
+        return EXIT_CANCELLED
+    except Exception as e:
+        out.end_progress()
+        print(f"Hata: {e}", file=sys.stderr)
+        return EXIT_ERROR
+
+
+if __name__ == "__main__":
+    sys.exit(main())
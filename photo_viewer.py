@@ -0,0 +1,244 @@
+"""Büyük görünüm penceresi.
+
+Pencere ve widget ağacı ilk açılışta bir kez oluşturulur; kapatılınca yok
+edilmez, gizlenir ve sonraki açılışlarda yeniden kullanılır. Başlık, tarih ve
+dosya adı katalog kaydından gelir (dosya yeniden açılıp EXIF okunmaz).
+Fotoğraf `ZoomableImageView` ile çizilir; önceki/sonraki gezinmede komşu
+fotoğraflar önden hazırlandığı için geçiş anında olur.
+
+Gezinme fotoğraf ID'si üzerinden yapılır: pencere açıkken tarama sürüp
+katalog büyüse de konum katalogdan yeniden bulunur.
+"""
+from tkinter import Canvas, messagebox
+
+import customtkinter as ctk
+
+from zoom_viewer import ZoomableImageView
+
+WINDOW_GEOMETRY = "1000x750"
+ZOOM_KEY_STEP = 1.5  # +/- tuşlarının zoom çarpanı
+PREFETCH_AHEAD = 2  # Gezinme yönünde önden hazırlanan fotoğraf sayısı
+HELP_TEXT = "Tekerlek: yakınlaştır  •  Sürükle: kaydır  •  Çift tık: sığdır/%100  •  ← →: önceki/sonraki"
+
+
+class PhotoViewerWindow(ctk.CTkToplevel):
+    """Yeniden kullanılan, yakınlaştırılabilir büyük görünüm penceresi"""
+
+    def __init__(self, master, theme, pipeline, load_pyramid, load_overview):
+        colors = theme.palette
+        super().__init__(master)
+        self.geometry(WINDOW_GEOMETRY)
+        theme.register(self, fg_color="background")
+        self.configure(fg_color=colors['background'])
+        self.catalog = None
+        self.photo_id = None
+        self.direction = 1  # Son gezinme yönü (ön yükleme bu yöne ağırlık verir)
+
+        # macOS benzeri header
+        header_frame = ctk.CTkFrame(self, fg_color=colors['surface'], corner_radius=0, height=60)
+        theme.register(header_frame, fg_color="surface")
+        header_frame.pack(fill="x", padx=0, pady=0)
+        header_frame.pack_propagate(False)
+
+        self.title_label = ctk.CTkLabel(
+            header_frame,
+            text="",
+            font=ctk.CTkFont(size=18, weight="bold"),
+            text_color=colors['text_primary']
+        )
+        theme.register(self.title_label, text_color="text_primary")
+        self.title_label.pack(pady=18)
+
+        # Ana içerik container
+        content_frame = ctk.CTkFrame(self, fg_color=colors['background'], corner_radius=0)
+        theme.register(content_frame, fg_color="background")
+        content_frame.pack(fill="both", expand=True, padx=30, pady=25)
+
+        # Fotoğraf kartı
+        photo_card = ctk.CTkFrame(
+            content_frame,
+            fg_color=colors['card'],
+            corner_radius=12,
+            border_width=1,
+            border_color=colors['border']
+        )
+        theme.register(photo_card, fg_color="card", border_color="border")
+        photo_card.pack(fill="both", expand=True, padx=0, pady=(0, 15))
+
+        # Fotoğraf tuvali: yalnızca görünür alana düşen döşemeler çözülür ve çizilir
+        photo_canvas = Canvas(photo_card, highlightthickness=0, bg=colors['card'], cursor="fleur")
+        theme.register(photo_canvas, bg="card")
+        photo_canvas.pack(fill="both", expand=True, padx=12, pady=12)
+
+        # Dosya bilgileri kartı
+        info_card = ctk.CTkFrame(
+            content_frame,
+            fg_color=colors['card'],
+            corner_radius=12,
+            border_width=1,
+            border_color=colors['border']
+        )
+        theme.register(info_card, fg_color="card", border_color="border")
+        info_card.pack(pady=(0, 15), padx=0, fill="x")
+
+        info_inner = ctk.CTkFrame(info_card, fg_color="transparent")
+        info_inner.pack(fill="x", padx=20, pady=15)
+
+        self.info_label = ctk.CTkLabel(
+            info_inner,
+            text="",
+            font=ctk.CTkFont(size=14),
+            text_color=colors['text_primary']
+        )
+        theme.register(self.info_label, text_color="text_primary")
+        self.info_label.pack(side="left")
+
+        self.zoom_label = ctk.CTkLabel(
+            info_inner,
+            text="",
+            font=ctk.CTkFont(size=12),
+            text_color=colors['text_tertiary']
+        )
+        theme.register(self.zoom_label, text_color="text_tertiary")
+        self.zoom_label.pack(side="right")
+
+        # Gezinme ve kapatma butonları
+        controls = ctk.CTkFrame(content_frame, fg_color="transparent")
+        controls.pack()
+
+        self.prev_btn = ctk.CTkButton(
+            controls,
+            text="⬅️ Önceki",
+            command=lambda: self.step(-1),
+            width=120,
+            height=38,
+            font=ctk.CTkFont(size=14, weight="normal"),
+            fg_color=colors['secondary'],
+            hover_color="#4A4AC4",
+            corner_radius=8
+        )
+        theme.register(self.prev_btn, fg_color="secondary")
+        self.prev_btn.pack(side="left", padx=(0, 10))
+
+        # Kapat butonu - macOS benzeri
+        close_btn = ctk.CTkButton(
+            controls,
+            text="Kapat (ESC)",
+            command=self.hide,
+            width=120,
+            height=38,
+            font=ctk.CTkFont(size=14, weight="normal"),
+            fg_color=colors['primary'],
+            hover_color=colors['primary_hover'],
+            corner_radius=8
+        )
+        theme.register(close_btn, fg_color="primary", hover_color="primary_hover")
+        close_btn.pack(side="left", padx=10)
+
+        self.next_btn = ctk.CTkButton(
+            controls,
+            text="Sonraki ➡️",
+            command=lambda: self.step(1),
+            width=120,
+            height=38,
+            font=ctk.CTkFont(size=14, weight="normal"),
+            fg_color=colors['secondary'],
+            hover_color="#4A4AC4",
+            corner_radius=8
+        )
+        theme.register(self.next_btn, fg_color="secondary")
+        self.next_btn.pack(side="left", padx=(10, 0))
+
+        self.viewer = ZoomableImageView(
+            photo_canvas,
+            pipeline,
+            load_pyramid=load_pyramid,
+            load_overview=load_overview,
+            on_zoom=lambda zoom: self.zoom_label.configure(text=f"🔍 %{zoom * 100:.0f}  •  {HELP_TEXT}"),
+            on_error=self._on_error,
+            ahead=PREFETCH_AHEAD + 1
+        )
+
+        self.protocol("WM_DELETE_WINDOW", self.hide)
+        self.bind("<Escape>", lambda e: self.hide())
+        self.bind("<Left>", lambda e: self.step(-1))
+        self.bind("<Right>", lambda e: self.step(1))
+        self.bind("<plus>", lambda e: self._zoom_center(ZOOM_KEY_STEP))
+        self.bind("<minus>", lambda e: self._zoom_center(1 / ZOOM_KEY_STEP))
+        self.bind("<Key-0>", lambda e: self.viewer.fit())
+
+    def show_photo(self, catalog, photo_id):
+        """Katalogdaki fotoğrafı göster; pencere gizliyse yeniden açılır (modal)"""
+        self.catalog = catalog
+        self.photo_id = photo_id
+        self._load()
+        if self.state() == "withdrawn":
+            self.deiconify()
+        # Pencereyi modal yap (ana pencereyi blokla)
+        self.transient(self.master)
+        self.grab_set()
+        self.lift()
+        self.focus_set()
+
+    def step(self, delta):
+        """Önceki (-1) veya sonraki (+1) fotoğrafa geç"""
+        if self.catalog is None or self.photo_id is None:
+            return
+        position = self.catalog.position(self.photo_id)
+        if position is None:
+            return
+        target = position + delta
+        if 0 <= target < len(self.catalog):
+            self.direction = 1 if delta > 0 else -1
+            self.photo_id = self.catalog.order[target]
+            self._load()
+
+    def hide(self):
+        """Pencereyi gizle (yok edilmez); bekleyen işler iptal edilir"""
+        self.viewer.close()
+        self.grab_release()
+        self.withdraw()
+
+    def forget_prefetched(self):
+        """Dosya yolları değiştiğinde önden hazırlanmış fotoğrafları bırak"""
+        self.viewer.forget_prefetched()
+
+    def pause(self):
+        """Dosyalar yeniden adlandırılırken pencereyi gizle ve yüklemeleri durdur"""
+        if self.state() != "withdrawn":
+            self.hide()
+        self.viewer.pause()
+
+    def resume(self):
+        self.viewer.resume()
+
+    def _load(self):
+        catalog = self.catalog
+        photo_path = catalog.path(self.photo_id)
+        name = catalog.name(self.photo_id)
+        date_str = catalog.date(self.photo_id).strftime("%d.%m.%Y %H:%M:%S")
+        position = catalog.position(self.photo_id)
+
+        self.title(f"Fotoğraf: {name}")
+        self.title_label.configure(text=name)
+        self.info_label.configure(
+            text=f"📅 {date_str}  •  📁 {name}  •  {position + 1} / {len(catalog)}"
+        )
+        self.prev_btn.configure(state="normal" if position > 0 else "disabled")
+        self.next_btn.configure(state="normal" if position + 1 < len(catalog) else "disabled")
+
+        self.viewer.open(photo_path)
+
+        # Komşular: gezinme yönünde PREFETCH_AHEAD, ters yönde bir fotoğraf
+        order = catalog.order
+        forward = [position + self.direction * offset for offset in range(1, PREFETCH_AHEAD + 1)]
+        neighbours = forward[:1] + [position - self.direction] + forward[1:]
+        self.viewer.prefetch([
+            catalog.path(order[index]) for index in neighbours if 0 <= index < len(order)
+        ])
+
+    def _zoom_center(self, factor):
+        self.viewer.zoom_at(factor, self.viewer.view_width / 2, self.viewer.view_height / 2)
+
+    def _on_error(self, error):
+        messagebox.showerror("Hata", f"Fotoğraf açılamadı: {str(error)}", parent=self)
@@ -0,0 +1,92 @@
+"""Ortak önizleme yükleyici.
+
+Tam çözünürlüklü bitmap'i çözüp sonra küçültmek yerine, çözücüden hedefi
+karşılayan en küçük ölçeği ister:
+
+* JPEG: draft modu ile DCT ölçekleme (1/2, 1/4, 1/8) - çözme sırasında küçültür
+* Diğer formatlar: `Image.reduce` ile tam sayı katlı hızlı kutu küçültme
+* Son adım: kalan en fazla 2x'lik fark için LANCZOS yerine BICUBIC
+
+Ayrıca kameraların EXIF IFD1 bloğuna gömdüğü küçük JPEG önizlemeyi, ana
+görüntüyü hiç çözmeden anında göstermek için okuyabilir.
+"""
+import io
+
+from PIL import Image
+
+from exif_reader import read_embedded_thumbnail
+
+# Son adımda kullanılan yeniden örnekleme filtresi
+FINAL_RESAMPLE = Image.Resampling.BICUBIC
+
+# reduce/resize'ın doğrudan desteklediği modlar
+_RESIZABLE_MODES = {"RGB", "RGBA", "L", "LA", "I", "F", "RGBa", "La"}
+
+
+def fit_size(width, height, max_width, max_height, allow_upscale=True):
+    """Aspect ratio korunarak kutuya sığan boyutu hesapla"""
+    scale = min(max_width / width, max_height / height)
+    if not allow_upscale:
+        scale = min(scale, 1.0)
+    return max(1, round(width * scale)), max(1, round(height * scale))
+
+
+def _normalize_mode(img):
+    """Palet, CMYK, 16 bit vb. modları yeniden boyutlandırılabilir bir moda çevir"""
+    if img.mode in _RESIZABLE_MODES:
+        return img
+    if img.mode == "PA" or (img.mode == "P" and "transparency" in img.info):
+        return img.convert("RGBA")
+    if img.mode == "1" or img.mode.startswith("I;16"):
+        return img.convert("L")
+    return img.convert("RGB")
+
+
+def scale_image(img, target_size):
+    """Yüklenmiş bir görseli hedef boyuta getir: önce reduce, sonra BICUBIC"""
+    img = _normalize_mode(img)
+    target_width, target_height = target_size
+    if img.size == (target_width, target_height):
+        return img
+    # Hedefin altına düşmeyecek en büyük tam sayı küçültme katsayısı
+    factor = int(min(img.width / target_width, img.height / target_height))
+    if factor >= 2:
+        img = img.reduce(factor)
+    if img.size != (target_width, target_height):
+        img = img.resize((target_width, target_height), FINAL_RESAMPLE)
+    return img
+
+
+def fit_image(img, size, allow_upscale=True):
+    """Yüklenmiş bir görseli aspect ratio korunarak kutuya sığdır"""
+    target = fit_size(img.width, img.height, size[0], size[1], allow_upscale)
+    return scale_image(img, target)
+
+
+def load_preview(photo_path, size, allow_upscale=True):
+    """Fotoğrafı verilen kutuya sığacak şekilde, mümkün olan en küçük ölçekte çöz"""
+    img = Image.open(photo_path)
+    target = fit_size(img.width, img.height, size[0], size[1], allow_upscale)
+
+    if img.format == "JPEG" and img.mode in ("RGB", "L", "CMYK"):
+        # Çözücü hedeften küçük olmayan en küçük DCT ölçeğini seçer
+        img.draft(img.mode, target)
+
+    return scale_image(img, target)
+
+
+def load_embedded_preview(photo_path, size):
+    """EXIF'e gömülü thumbnail'i (IFD1) kutuya sığdırarak döndür; yoksa None
+
+    Gömülü önizleme genellikle 160x120 boyutundadır; kalıcı thumbnail
+    üretilene kadar geçici olarak gösterilir.
+    """
+    data = read_embedded_thumbnail(photo_path)
+    if data is None:
+        return None
+    try:
+        img = Image.open(io.BytesIO(data))
+        img.load()
+    except Exception:
+        return None
+    return fit_image(img, size)
@@ -0,0 +1,353 @@
+"""Çökmeye dayanıklı yeniden adlandırma günlüğü (write-ahead journal).
+
+Her yeniden adlandırma grubu çalışmadan önce, tüm adımlarıyla birlikte
+diskteki yalnızca-eklemeli bir günlük dosyasına yazılır ve fsync edilir.
+Yürütme sırasında ilerleme işaretleri her dosya için değil, her
+`JOURNAL_SYNC_INTERVAL` adımda bir eklenip fsync edilir; grup bitince bir
+`commit` kaydı yazılır.
+
+Uygulama açılışında `commit` veya `abort` kaydı olmayan gruplar yarıda
+kalmış sayılır. Son işaretten sonraki adımlar dosya sisteminden (inode ile)
+yoklanarak gerçekte kaç adımın yapıldığı bulunur; grup ileri (tamamlanır)
+veya geri (yapılanlar tersine çevrilir) sarılabilir. Tamamlanmış son
+uygulama grubu bir sonraki oturumda da geri alınabilir.
+
+Dosya biçimi (JSON satırları):
+    {"type": "begin", "id": ..., "kind": "apply", "folder": ..., "undoes": null, "steps": N}
+    {"s": kaynak, "d": hedef, "o": ilk_yol, "i": inode}   (N satır)
+    {"type": "progress", "executed": k}
+    {"type": "commit", "executed": n}  veya  {"type": "abort", "executed": k}
+"""
+import json
+import os
+import time
+from datetime import datetime
+
+from rename_planner import RenamePlan
+from thumbnail_cache import default_cache_dir
+
+# İlerleme işareti yazılıp fsync edilen adım aralığı
+JOURNAL_SYNC_INTERVAL = 1024
+
+# Saklanan en fazla tamamlanmış grup dosyası
+KEEP_BATCHES = 20
+
+# Dosya sonunda bitiş kaydı aranırken okunan bayt sayısı
+_TAIL_BYTES = 4096
+
+
+def default_journal_dir():
+    """Önbellek klasöründeki günlük klasörünün yolu"""
+    return default_cache_dir() / "rename_journal"
+
+
+def _fsync_dir(folder):
+    """Yeni oluşturulan dosyanın klasör kaydını kalıcı yap (Windows'ta desteklenmez)"""
+    try:
+        fd = os.open(folder, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def _inode(path):
+    try:
+        return os.lstat(path).st_ino
+    except OSError:
+        return 0
+
+
+class JournalBatch:
+    """Diske yazılmış bir yeniden adlandırma grubu
+
+    Okunurken `steps` [(kaynak, hedef, ilk_yol), ...] listesi, `inodes` ise
+    her ilk_yol'un grup başındaki inode'udur.
+    """
+
+    def __init__(self, path, header, steps=None, inodes=None, marker=0, end=None):
+        self.path = path
+        self.id = header["id"]
+        self.kind = header["kind"]
+        self.folder = header.get("folder")
+        self.undoes = header.get("undoes")
+        self.time = header.get("time")
+        self.step_count = header["steps"]
+        self.steps = steps
+        self.inodes = inodes or {}
+        self.marker = marker  # Son ilerleme işareti
+        self.end = end  # Bitiş kaydı (commit/abort) veya None
+
+    @property
+    def complete(self):
+        return self.end is not None
+
+    def _is_done(self, index):
+        """Adım gerçekten yapılmış mı? (dosya artık kaynakta değil)"""
+        src, _, origin = self.steps[index]
+        inode = self.inodes.get(origin, 0)
+        try:
+            st = os.lstat(src)
+        except OSError:
+            return True
+        # Kaynakta başka bir dosya varsa (zincirde yeri dolduran) adım yapılmıştır
+        return bool(inode) and st.st_ino != inode
+
+    def probe_executed(self):
+        """Son işaretten başlayıp dosya sistemini yoklayarak yapılmış adım sayısını bul"""
+        if self.end is not None:
+            return self.end["executed"]
+        executed = self.marker
+        while executed < len(self.steps) and self._is_done(executed):
+            executed += 1
+        return executed
+
+    def plan(self, executed=None):
+        """Grubu, yapılmış adımları sayılmış bir RenamePlan olarak döndür"""
+        if executed is None:
+            executed = self.probe_executed()
+        return RenamePlan(self.steps, executed=executed)
+
+    def rollback_plan(self, executed=None):
+        """Yapılmış adımları tersine çeviren planı döndür"""
+        plan = self.plan(executed)
+        locations = dict(plan.completed_moves())
+        steps = []
+        for src, dst, origin in reversed(self.steps[:plan.executed]):
+            steps.append((dst, src, locations.get(origin, origin)))
+        return RenamePlan(steps)
+
+
+class JournalWriter:
+    """Yürütülen bir grubun günlüğüne ilerleme ve bitiş kayıtlarını ekler"""
+
+    def __init__(self, journal, path, batch_id, executed=0):
+        self.journal = journal
+        self.path = path
+        self.id = batch_id
+        self._file = open(path, "a", encoding="utf-8")
+        self._synced = executed
+
+    def _write(self, record, sync=True):
+        self._file.write(json.dumps(record, ensure_ascii=False) + "\n")
+        if sync:
+            self._file.flush()
+            os.fsync(self._file.fileno())
+
+    def progress(self, executed):
+        """Adım yapıldı; her JOURNAL_SYNC_INTERVAL adımda bir işaret yazıp fsync et"""
+        if executed - self._synced >= JOURNAL_SYNC_INTERVAL:
+            self._write({"type": "progress", "executed": executed})
+            self._synced = executed
+
+    def finish(self, plan, commit=True):
+        """Grubu kapat: geçici adda dosya yoksa commit yaz, varsa yarım bırak
+
+        commit=False ise grup her durumda yarım bırakılır; yarım bırakılan
+        grup bir sonraki kontrolde kurtarılır.
+        """
+        try:
+            if plan.parked or not commit:
+                self._write({"type": "progress", "executed": plan.executed})
+                return False
+            self._write({"type": "commit", "executed": plan.executed})
+            return True
+        finally:
+            self._file.close()
+            self.journal.prune()
+
+    def abort(self, executed):
+        """Grubu geçersiz say (geri sarılmadan önce yazılır)"""
+        try:
+            self._write({"type": "abort", "executed": executed})
+        finally:
+            self._file.close()
+
+
+class RenameJournal:
+    """Yeniden adlandırma gruplarının disk üzerindeki günlüğü (tek yazar)"""
+
+    def __init__(self, journal_dir=None):
+        self.journal_dir = os.fspath(journal_dir or default_journal_dir())
+        os.makedirs(self.journal_dir, exist_ok=True)
+
+    def begin(self, plan, kind, folder=None, undoes=None):
+        """Planı çalıştırmadan önce tüm adımlarıyla günlüğe yaz ve fsync et"""
+        batch_id = f"{time.time_ns():020d}"
+        path = os.path.join(self.journal_dir, f"{batch_id}.jsonl")
+        header = {
+            "type": "begin",
+            "id": batch_id,
+            "kind": kind,
+            "folder": folder,
+            "undoes": undoes,
+            "time": datetime.now().isoformat(timespec="seconds"),
+            "steps": len(plan.steps),
+        }
+        inodes = {}
+        with open(path, "x", encoding="utf-8") as f:
+            f.write(json.dumps(header, ensure_ascii=False) + "\n")
+            for src, dst, origin in plan.steps:
+                if origin not in inodes:
+                    inodes[origin] = _inode(origin)
+                f.write(json.dumps(
+                    {"s": src, "d": dst, "o": origin, "i": inodes[origin]}, ensure_ascii=False
+                ) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        _fsync_dir(self.journal_dir)
+        return JournalWriter(self, path, batch_id)
+
+    def resume(self, batch, executed):
+        """Yarım kalmış grubun günlüğüne kaldığı yerden yazmaya devam et"""
+        return JournalWriter(self, batch.path, batch.id, executed)
+
+    def _batch_files(self):
+        try:
+            names = os.listdir(self.journal_dir)
+        except OSError:
+            return []
+        return sorted(
+            os.path.join(self.journal_dir, name) for name in names if name.endswith(".jsonl")
+        )
+
+    def _read_summary(self, path):
+        """Yalnızca başlığı ve dosya sonundaki bitiş kaydını oku (adımlar okunmaz)"""
+        try:
+            with open(path, "rb") as f:
+                header = json.loads(f.readline())
+                f.seek(0, os.SEEK_END)
+                size = f.tell()
+                f.seek(max(0, size - _TAIL_BYTES))
+                tail = f.read().splitlines()
+        except (OSError, ValueError):
+            return None
+        end = None
+        for line in reversed(tail):
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue  # Yarım yazılmış son satır veya kesilmiş ilk satır
+            if record.get("type") in ("commit", "abort"):
+                end = record
+            break
+        return JournalBatch(path, header, end=end)
+
+    def load(self, path):
+        """Grubu tüm adımlarıyla oku"""
+        steps = []
+        inodes = {}
+        marker = 0
+        end = None
+        with open(path, encoding="utf-8") as f:
+            header = json.loads(f.readline())
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    break  # Çökme sırasında yarım kalmış satır
+                kind = record.get("type")
+                if kind is None:
+                    steps.append((record["s"], record["d"], record["o"]))
+                    inodes[record["o"]] = record["i"]
+                elif kind == "progress":
+                    marker = max(marker, record["executed"])
+                elif kind in ("commit", "abort"):
+                    end = record
+        if len(steps) < header["steps"]:
+            # Adımlar tam yazılamadan çökülmüş: hiçbir adım yapılmamıştır
+            end = {"type": "abort", "executed": 0}
+        return JournalBatch(path, header, steps, inodes, marker, end)
+
+    def incomplete(self):
+        """Bitiş kaydı olmayan (yarıda kalmış) grupları tüm adımlarıyla döndür"""
+        summaries = [s for s in map(self._read_summary, self._batch_files()) if s is not None]
+        # Geri sarması başlatılmış gruplar artık o geri sarma grubuyla kurtarılır
+        rolled_back = {s.undoes for s in summaries if s.kind == "rollback"}
+        batches = []
+        for summary in summaries:
+            path = summary.path
+            if summary.complete or summary.id in rolled_back:
+                continue
+            batch = self.load(path)
+            if batch.complete:
+                continue
+            batches.append(batch)
+        return batches
+
+    def recover(self, batch, forward, progress=None):
+        """Yarıda kalmış grubu ileri (tamamla) veya geri (tersine çevir) sar
+
+        Geri sarma kendi grubu olarak günlüğe yazılır; o da yarıda kalırsa bir
+        sonraki kontrolde kurtarılır. Uygulanan planı döndürür.
+        """
+        if batch.kind == "rollback":
+            # Geri aldığı grup artık kurtarılamaz (abort yazıldı); geri sarma
+            # tersine çevrilirse dosyalar yarım veya geçici adda kalırdı
+            forward = True
+        executed = batch.probe_executed()
+        if forward:
+            plan = batch.plan(executed)
+            writer = self.resume(batch, executed)
+        else:
+            plan = batch.rollback_plan(executed)
+            writer = self.begin(plan, "rollback", batch.folder, undoes=batch.id)
+            self.resume(batch, executed).abort(executed)
+        def on_step(done, total):
+            writer.progress(done)
+            if progress is not None:
+                progress(done, total)
+
+        try:
+            plan.execute(progress=on_step)
+        except BaseException:
+            # Kurtarma tamamlanamadı - grup bir sonraki kontrolde yeniden denenir
+            writer.finish(plan, commit=False)
+            raise
+        writer.finish(plan)
+        return plan
+
+    def undoable(self):
+        """Son tamamlanmış uygulama grubunun hâlâ geri alınabilir taşımaları
+
+        (grup, [(ilk_yol, şimdiki_yol), ...]) döndürür; geri alınacak bir şey
+        yoksa None.
+        """
+        summaries = [s for s in map(self._read_summary, self._batch_files()) if s is not None]
+        applied = None
+        for summary in reversed(summaries):
+            if summary.kind == "apply" and summary.end is not None and summary.end["type"] == "commit":
+                applied = summary
+                break
+        if applied is None:
+            return None
+        batch = self.load(applied.path)
+        moves = batch.plan().completed_moves()
+        # Bu grubu geri alan (kısmen de olsa) sonraki grupların geri aldıklarını düş
+        restored = set()
+        for summary in summaries:
+            if summary.undoes != batch.id or summary.end is None or summary.end["type"] != "commit":
+                continue
+            undo = self.load(summary.path)
+            restored.update(src for src, _ in undo.plan().completed_moves())
+        moves = [(origin, location) for origin, location in moves if location not in restored]
+        if not moves:
+            return None
+        return batch, moves
+
+    def prune(self):
+        """En yeni KEEP_BATCHES tamamlanmış grup dışındakileri sil"""
+        complete = []
+        for path in self._batch_files():
+            summary = self._read_summary(path)
+            if summary is not None and summary.complete:
+                complete.append(path)
+        for path in complete[:-KEEP_BATCHES]:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
@@ -0,0 +1,230 @@
+"""Çakışmasız toplu yeniden adlandırma planlayıcısı (arayüzden bağımsız).
+
+Dosyaları tek tek adlandırıp her çakışmada `os.path.exists` ile `_1`, `_2`
+denemek yerine tüm eski -> yeni eşlemesi önce bellekte hesaplanır:
+
+* Her hedef klasör yalnızca bir kez listelenir.
+* Zaten doğru adı taşıyan dosyalar atlanır.
+* Hedef adı başka bir planlı dosyanın tuttuğu zincirler, yer boşaldıkça
+  doğru sırayla yürütülür. Takas ve döngüler (A -> B, B -> A) iki aşamalı
+  geçici adlarla çözülür, böylece istenen `IMG_0001...` adları her zaman elde
+  edilir.
+* Hedef adı plan dışı bir dosya tutuyorsa (ör. aynı adlı başka bir dosya)
+  eski davranıştaki gibi `_1`, `_2` ekli ilk boş ad seçilir.
+"""
+import os
+import uuid
+from pathlib import Path
+
+DEFAULT_PREFIX = "IMG_"
+DEFAULT_DIGITS = 4
+
+# Döngüleri kırarken kullanılan geçici ad öneki (gizli dosya)
+TEMP_PREFIX = ".photo_sorter_tmp_"
+
+
+def _key(path):
+    """Dosya sistemindeki konumu temsil eden karşılaştırma anahtarı"""
+    return os.path.normcase(os.path.abspath(path))
+
+
+def _is_temp(path):
+    return os.path.basename(path).startswith(TEMP_PREFIX)
+
+
+def target_name(index, filename, prefix=DEFAULT_PREFIX, digits=DEFAULT_DIGITS):
+    """Sıra numarasından hedef dosya adını üret (uzantı korunur)"""
+    return f"{prefix}{index:0{digits}d}{Path(filename).suffix}"
+
+
+class _Listing:
+    """Klasör içeriklerini bir kez okuyup bellekte tutar"""
+
+    def __init__(self):
+        self._names = {}  # klasör -> {normcase(ad), ...}
+
+    def names(self, folder):
+        folder = os.path.abspath(folder)
+        names = self._names.get(folder)
+        if names is None:
+            try:
+                names = {os.path.normcase(name) for name in os.listdir(folder)}
+            except OSError:
+                names = set()
+            self._names[folder] = names
+        return names
+
+    def exists(self, path):
+        return os.path.normcase(os.path.basename(path)) in self.names(os.path.dirname(path))
+
+    def add(self, path):
+        self.names(os.path.dirname(path)).add(os.path.normcase(os.path.basename(path)))
+
+
+class RenamePlan:
+    """Sıralı yeniden adlandırma adımları ve yürütme durumu
+
+    `steps` [(kaynak, hedef, ilk_yol), ...] yürütme sırasıdır; ilk_yol adımın
+    taşıdığı dosyanın plan başındaki yoludur. Yürütme yarıda kalsa bile
+    `completed_moves()` her dosyanın o anki yerini doğru bildirir.
+    """
+
+    def __init__(self, steps, skipped=0, missing=(), conflicts=(), executed=0):
+        self.steps = steps
+        self.skipped = skipped  # Zaten doğru adı taşıyan dosya sayısı
+        self.missing = list(missing)  # Kaynağı bulunamayan taşımalar
+        self.conflicts = list(conflicts)  # Hedefi plan dışı bir dosyanın tuttuğu taşımalar
+        self.executed = 0
+        self.journal_id = None  # Yürütülürken yazıldığı günlük grubu
+        self._locations = {}  # ilk_yol -> şimdiki yol
+        # Geçici adda bekleyen dosya sayısı (geri sarma planları geçici adda başlayabilir)
+        self.parked = len({origin for _, _, origin in steps if _is_temp(origin)})
+        # Yarıda kalmış bir planı sürdürmek için yapılmış adımları yeniden say
+        for _ in range(executed):
+            self._advance()
+
+    def final_moves(self):
+        """Plan tamamlandığında gerçekleşecek [(ilk_yol, son_yol), ...] eşlemesi"""
+        final = {}
+        for _, dst, origin in self.steps:
+            final[origin] = dst
+        return [(origin, dst) for origin, dst in final.items() if dst != origin]
+
+    def execute(self, check=None, progress=None):
+        """Adımları sırayla uygula
+
+        check() iptal için bir istisna fırlatabilir; yalnızca geçici adda
+        bekleyen dosya yokken çağrılır, böylece iptal hiçbir dosyayı geçici
+        adda bırakmaz. progress(yapılan, toplam) her adımdan sonra çağrılır.
+        """
+        total = len(self.steps)
+        while self.executed < total:
+            if check is not None and not self.parked:
+                check()
+            src, dst, origin = self.steps[self.executed]
+            # Plan, hedefin bu adımda boş olmasını garanti eder; POSIX'te
+            # os.rename üzerine yazdığı için dışarıdan değişikliğe karşı bir
+            # kez daha kontrol edilir (büyük/küçük harf değişimi hariç)
+            if _key(src) != _key(dst) and os.path.lexists(dst):
+                raise FileExistsError(f"Hedef dosya zaten var: {dst}")
+            os.rename(src, dst)
+            self._advance()
+            if progress is not None:
+                progress(self.executed, total)
+
+    def _advance(self):
+        """Sıradaki adımı yapılmış say"""
+        src, dst, origin = self.steps[self.executed]
+        self.executed += 1
+        self.parked += _is_temp(dst) - _is_temp(self._locations.get(origin, origin))
+        self._locations[origin] = dst
+
+    def completed_moves(self):
+        """Şu ana kadar yeri değişen dosyalar: [(ilk_yol, şimdiki_yol), ...]"""
+        return [(origin, path) for origin, path in self._locations.items() if path != origin]
+
+
+def plan_moves(moves, listing=None, skipped=0):
+    """[(kaynak, hedef), ...] taşımalarını çakışmasız adımlara dönüştür
+
+    Hedefler birbirinden farklı olmalıdır. Kaynağı bulunmayan veya hedefi plan
+    dışı bir dosya tarafından tutulan taşımalar plana alınmaz.
+    """
+    listing = listing or _Listing()
+    pending = {}  # kaynak anahtarı -> (kaynak, hedef, ilk_yol)
+    missing = []
+    targets = set()  # Hedef anahtarları (tekrar kontrolü)
+    for src, dst in moves:
+        if src == dst:
+            skipped += 1
+            continue
+        if not listing.exists(src):
+            missing.append((src, dst))
+            continue
+        if _key(dst) in targets:
+            raise ValueError(f"Aynı hedefe birden fazla dosya taşınamaz: {dst}")
+        targets.add(_key(dst))
+        pending[_key(src)] = (src, dst, src)
+
+    # Hedefi, plandaki bir kaynak dışında bir dosyanın tuttuğu taşımalar; bir
+    # taşıma çıkarılınca kaynağı yerinde kalır, onu bekleyen taşıma da çakışır
+    conflicts = []
+    changed = True
+    while changed:
+        changed = False
+        for src_key, (src, dst, origin) in list(pending.items()):
+            dst_key = _key(dst)
+            if dst_key != src_key and dst_key not in pending and listing.exists(dst):
+                conflicts.append((src, dst))
+                del pending[src_key]
+                changed = True
+
+    # hedef anahtarı -> o hedefi bekleyen taşımanın kaynak anahtarı
+    wanted_by = {_key(dst): src_key for src_key, (_, dst, _) in pending.items()}
+    ready = [
+        src_key for src_key, (_, dst, _) in pending.items()
+        if _key(dst) == src_key or _key(dst) not in pending
+    ]
+    token = uuid.uuid4().hex[:8]
+    temp_count = 0
+    steps = []
+    while pending:
+        if ready:
+            src_key = ready.pop()
+            src, dst, origin = pending.pop(src_key)
+            steps.append((src, dst, origin))
+            # Boşalan yeri bekleyen taşıma artık yapılabilir
+            waiting = wanted_by.get(src_key)
+            if waiting is not None and waiting in pending:
+                ready.append(waiting)
+            continue
+
+        # Kalan her taşıma bir döngüde: birini geçici ada park et (1. aşama),
+        # döngü çözülünce geçici addan hedefe taşınır (2. aşama)
+        src_key, (src, dst, origin) = next(iter(pending.items()))
+        while True:
+            temp_count += 1
+            temp = os.path.join(
+                os.path.dirname(src), f"{TEMP_PREFIX}{token}_{temp_count}{Path(src).suffix}"
+            )
+            if not listing.exists(temp):
+                break
+        listing.add(temp)
+        steps.append((src, temp, origin))
+        del pending[src_key]
+        temp_key = _key(temp)
+        pending[temp_key] = (temp, dst, origin)
+        wanted_by[_key(dst)] = temp_key
+        waiting = wanted_by.get(src_key)
+        if waiting is not None and waiting in pending:
+            ready.append(waiting)
+
+    return RenamePlan(steps, skipped=skipped, missing=missing, conflicts=conflicts)
+
+
+def plan_renames(photos, prefix=DEFAULT_PREFIX, digits=DEFAULT_DIGITS):
+    """Sıralı [(yol, tarih, dosya adı), ...] listesini `IMG_0001...` adlarına planla
+
+    Numara listedeki sıradır. Hedef adı plan dışı bir dosya tutuyorsa `_1`,
+    `_2` ekli ilk boş ad kullanılır (klasör listesi bellekte aranır).
+    """
+    listing = _Listing()
+    sources = {_key(photo_path) for photo_path, _, _ in photos}
+    chosen = set()
+    moves = []
+    for index, (photo_path, _, filename) in enumerate(photos, 1):
+        folder = os.path.dirname(photo_path)
+        new_path = os.path.join(folder, target_name(index, filename, prefix, digits))
+        key = _key(new_path)
+        if key != _key(photo_path) and (key in chosen or (key not in sources and listing.exists(new_path))):
+            counter = 1
+            base_name = f"{prefix}{index:0{digits}d}"
+            while True:
+                new_path = os.path.join(folder, f"{base_name}_{counter}{Path(filename).suffix}")
+                key = _key(new_path)
+                if key not in chosen and key not in sources and not listing.exists(new_path):
+                    break
+                counter += 1
+        chosen.add(key)
+        moves.append((photo_path, new_path))
+    return plan_moves(moves, listing)
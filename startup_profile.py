@@ -0,0 +1,68 @@
+"""Açılış süresi ölçümü.
+
+`PHOTO_SORTER_STARTUP_PROFILE=1` ile uygulama açılış aşamalarının (modül
+yükleme, pencere, depolar, widget'lar, ilk etkileşimli çizim) sürelerini
+stderr'e yazar. Değer `exit` ise pencere hazır olunca uygulama kapanır;
+`benchmarks/bench_startup.py` bunu açılış süresini ölçmek için kullanır.
+
+Bu modül `photo_sorter.py`'de ilk olarak yüklenmelidir ki sayaç
+customtkinter/tkinter yüklenmeden başlasın.
+"""
+import os
+import sys
+import time
+
+# Ortam değişkeni: "1" aşamaları yazar, "exit" yazar ve pencere hazır olunca kapatır
+PROFILE_ENV = "PHOTO_SORTER_STARTUP_PROFILE"
+
+# Çıktı satırlarının öneki (kıyaslama betiği bu öneke göre ayrıştırır)
+LINE_PREFIX = "startup:"
+
+
+class StartupProfile:
+    """Açılış aşamalarının sürelerini toplar"""
+
+    def __init__(self, mode=None):
+        self.mode = (os.environ.get(PROFILE_ENV, "") if mode is None else mode).strip().lower()
+        self.enabled = self.mode not in ("", "0")
+        self.exit_when_ready = self.mode == "exit"
+        self.started = time.perf_counter()
+        self._last = self.started
+        self.phases = []  # [(aşama, aşama süresi, toplam süre), ...] (saniye)
+
+    def mark(self, phase):
+        """Bir aşamanın bittiğini kaydet"""
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        self.phases.append((phase, now - self._last, now - self.started))
+        self._last = now
+
+    def report(self, stream=None):
+        """Aşama sürelerini `startup: aşama  süre ms  (toplam ms)` satırları olarak yaz"""
+        if not self.enabled:
+            return
+        stream = stream or sys.stderr
+        for phase, duration, total in self.phases:
+            stream.write(
+                f"{LINE_PREFIX} {phase:<10} {duration * 1000:8.1f} ms  ({total * 1000:8.1f} ms)\n"
+            )
+        stream.flush()
+
+
+def parse_report(text):
+    """report() çıktısını {aşama: (aşama ms, toplam ms)} sözlüğüne çevir"""
+    phases = {}
+    for line in text.splitlines():
+        if not line.startswith(LINE_PREFIX):
+            continue
+        parts = line[len(LINE_PREFIX):].replace("(", " ").replace(")", " ").split()
+        try:
+            phases[parts[0]] = (float(parts[1]), float(parts[3]))
+        except (IndexError, ValueError):
+            continue
+    return phases
+
+
+# Süreç genelinde tek ölçüm - photo_sorter.py en başta yükler
+PROFILE = StartupProfile()
@@ -0,0 +1,167 @@
+"""Swipe modu için önden yükleme halkası ve çözülmüş kare önbelleği.
+
+Gösterilen fotoğrafın yanında sonraki N ve önceki M fotoğraf da arka plan
+hattında, swipe alanının o anki boyutuna ölçeklenmiş olarak hazırlanır.
+Hazır kareler sınırlı bir LRU'da tutulur; karar verip sonraki fotoğrafa
+geçmek veya geri dönmek dosya okuma ve çözmeyi beklemez.
+
+Kareler (yol, kutu boyutu) ile anahtarlanır: alan yeniden boyutlandırılınca
+eski boyuttaki kareler kullanılmaz ve LRU'dan zamanla düşer. Halkadaki
+fotoğrafların orta çözünürlüklü ana önizlemeleri de bellekte tutulur; yeni
+boyuttaki kare dosya yeniden okunmadan bu ana görselden ölçeklenir.
+"""
+import threading
+from collections import OrderedDict
+from functools import partial
+
+SWIPE_GROUP = "swipe"  # Thumbnail hattındaki iş grubu
+POLL_INTERVAL_MS = 20  # Sonuçların kontrol aralığı
+
+DEFAULT_AHEAD = 3  # Önden hazırlanan sonraki fotoğraf sayısı
+DEFAULT_BEHIND = 1  # Hazır tutulan önceki fotoğraf sayısı
+DEFAULT_CAPACITY = 12  # Bellekte tutulan kare sayısı
+
+
+class SwipePrefetcher:
+    """Swipe karelerini önden hazırlayan, LRU önbellekli yükleyici"""
+
+    def __init__(self, widget, pipeline, load_master, scale_frame, make_image=None,
+                 ahead=DEFAULT_AHEAD, behind=DEFAULT_BEHIND, capacity=DEFAULT_CAPACITY,
+                 masters=None):
+        self.widget = widget  # after() zamanlaması için Tk widget'ı
+        self.pipeline = pipeline  # ThumbnailPipeline
+        # Worker thread'de çalışırlar: yol -> ana görsel, (ana görsel, kutu) -> kare
+        self.load_master = load_master
+        self.scale_frame = scale_frame
+        # PIL Image -> gösterilecek nesne (ör. CTkImage; ana thread'de çalışır)
+        self.make_image = make_image or (lambda frame: frame)
+        self.ahead = ahead
+        self.behind = behind
+        self.capacity = max(capacity, ahead + behind + 1)
+        self._frames = OrderedDict()  # (yol, kutu) -> hazır kare (LRU)
+        self._waiting = {}  # (yol, kutu) -> [callback(kare, hata), ...]
+        # Ana önizlemeler (varsayılan: halkadaki fotoğraf sayısı kadar)
+        self.master_capacity = masters or ahead + behind + 1
+        self._masters = OrderedDict()  # yol -> PIL Image (LRU, worker'lar paylaşır)
+        self._masters_lock = threading.Lock()
+        self._generation = 0  # clear() ile artar; eski yolla yüklenen ana görseller saklanmaz
+        self._poll_id = None
+
+    def get(self, photo_path, box):
+        """Hazır kareyi döndür (yoksa None)"""
+        key = (photo_path, box)
+        frame = self._frames.get(key)
+        if frame is not None:
+            self._frames.move_to_end(key)
+        return frame
+
+    def request(self, photo_path, box, callback):
+        """Kareyi en yüksek öncelikle iste; hazır olunca callback(kare, hata)
+
+        Kare önbellekteyse callback hemen çağrılır.
+        """
+        frame = self.get(photo_path, box)
+        if frame is not None:
+            callback(frame, None)
+            return
+        key = (photo_path, box)
+        self._waiting.setdefault(key, []).append(callback)
+        self._submit(key, priority=0)
+
+    def prefetch(self, current, before, after, box):
+        """Gösterilen fotoğrafın çevresini hazırla, halka dışındaki işleri iptal et
+
+        before ve after yakından uzağa sıralı yol listeleridir; en fazla
+        `behind` ve `ahead` kadarı kullanılır. Sonrakiler öncelikli hazırlanır.
+        """
+        ring = list(after[:self.ahead])
+        ring[1:1] = before[:self.behind]  # Hemen sonrakinden sonra bir önceki
+        needed = {(current, box)} if current is not None else set()
+        for priority, photo_path in enumerate(ring, 1):
+            key = (photo_path, box)
+            needed.add(key)
+            if key not in self._frames:
+                self._submit(key, priority)
+        self.pipeline.cancel(SWIPE_GROUP, keep=needed)
+        for key in list(self._waiting):
+            if key not in needed:
+                del self._waiting[key]
+
+    def cancel(self):
+        """Bekleyen işleri iptal et (hazır kareler korunur)"""
+        self.pipeline.cancel(SWIPE_GROUP)
+        self._waiting.clear()
+
+    def clear(self):
+        """Bekleyen işleri iptal et ve önbelleği boşalt"""
+        self.cancel()
+        self._frames.clear()
+        with self._masters_lock:
+            self._masters.clear()
+            self._generation += 1
+
+    def pause(self):
+        """Önbelleği boşalt ve resume() çağrılana kadar yükleme yapma
+
+        Dosyalar yeniden adlandırılırken kullanılır: o sırada yolla yüklenen
+        bir kare başka bir fotoğrafa ait olabilir.
+        """
+        self.clear()
+        self.pipeline.pause(SWIPE_GROUP)
+
+    def resume(self):
+        self.pipeline.resume(SWIPE_GROUP)
+
+    def _submit(self, key, priority):
+        self.pipeline.submit(
+            key, partial(self._load_frame, *key), self._on_result,
+            priority=priority, group=SWIPE_GROUP
+        )
+        self._ensure_polling()
+
+    def _load_frame(self, photo_path, box):
+        """Kareyi ana önizlemeden ölçekle (worker thread'de çalışır)"""
+        return self.scale_frame(self._master(photo_path), box)
+
+    def _master(self, photo_path):
+        """Ana önizlemeyi bellekten al; yoksa yükleyip sakla"""
+        with self._masters_lock:
+            master = self._masters.get(photo_path)
+            if master is not None:
+                self._masters.move_to_end(photo_path)
+                return master
+            generation = self._generation
+        # Yükleme kilit dışında: diğer worker'lar beklemesin
+        master = self.load_master(photo_path)
+        with self._masters_lock:
+            if generation != self._generation:
+                # Yükleme sürerken önbellek boşaltıldı (ör. yol artık başka dosyanın)
+                return master
+            self._masters[photo_path] = master
+            self._masters.move_to_end(photo_path)
+            while len(self._masters) > self.master_capacity:
+                self._masters.popitem(last=False)
+        return master
+
+    def _on_result(self, key, frame, error):
+        callbacks = self._waiting.pop(key, ())
+        image = None
+        if error is None and frame is not None:
+            image = self.make_image(frame)
+            self._frames[key] = image
+            self._frames.move_to_end(key)
+            while len(self._frames) > self.capacity:
+                self._frames.popitem(last=False)
+        for callback in callbacks:
+            callback(image, error)
+
+    def _ensure_polling(self):
+        if self._poll_id is None:
+            self._poll_id = self.widget.after(POLL_INTERVAL_MS, self._poll)
+
+    def _poll(self):
+        """Hazır kareleri ana thread'de teslim et"""
+        self._poll_id = None
+        self.pipeline.poll(limit=16)
+        if self.pipeline.busy:
+            self._ensure_polling()
@@ -0,0 +1,157 @@
+import threading
+import time
+
+from background_jobs import JobCancelled, JobRunner
+
+TIMEOUT = 5.0
+
+
+def poll_until(runner, condition):
+    """Koşul sağlanana kadar olayları ana thread'deymiş gibi teslim et"""
+    deadline = time.monotonic() + TIMEOUT
+    while not condition():
+        assert time.monotonic() < deadline, "iş zamanında bitmedi"
+        runner.poll()
+        time.sleep(0.001)
+
+
+def test_result_and_events_are_delivered_in_order():
+    runner = JobRunner()
+    events = []
+
+    def work(context):
+        for i in range(3):
+            context.emit(i)
+            context.progress(i + 1, 3, force=True)
+        return "ok"
+
+    runner.start(
+        "work", work,
+        on_progress=lambda progress: events.append(("progress", progress.done)),
+        on_partial=lambda value: events.append(("partial", value)),
+        on_done=lambda value, error: events.append(("done", value, error)),
+    )
+    poll_until(runner, lambda: not runner.busy)
+
+    assert events == [
+        ("partial", 0), ("progress", 1), ("partial", 1), ("progress", 2),
+        ("partial", 2), ("progress", 3), ("done", "ok", None),
+    ]
+
+
+def test_cancelled_job_drops_partial_results():
+    runner = JobRunner()
+    emitted = threading.Event()
+    partials, done = [], []
+
+    def work(context):
+        context.emit("before")
+        emitted.set()
+        context.cancel_event.wait(TIMEOUT)
+        context.emit("after")
+        context.progress(1, 1, force=True)
+        context.check()
+        return "unreachable"
+
+    job = runner.start(
+        "work", work,
+        on_progress=partials.append,
+        on_partial=partials.append,
+        on_done=lambda value, error: done.append((value, error)),
+    )
+    assert emitted.wait(TIMEOUT)
+    # Ara sonuç kuyrukta beklerken iptal edilirse o da teslim edilmez
+    job.cancel()
+    poll_until(runner, lambda: done)
+
+    assert partials == []
+    assert done[0][0] is None and isinstance(done[0][1], JobCancelled)
+
+
+def test_job_returning_normally_after_cancel_reports_cancelled():
+    runner = JobRunner()
+    started = threading.Event()
+    done = []
+
+    def work(context):
+        started.set()
+        context.cancel_event.wait(TIMEOUT)
+        # İptali kendi yakalayıp erken dönen iş (ör. yarım kalan tarama)
+        return "partial value"
+
+    job = runner.start("work", work, on_done=lambda value, error: done.append((value, error)))
+    assert started.wait(TIMEOUT)
+    job.cancel()
+    poll_until(runner, lambda: done)
+
+    value, error = done[0]
+    assert value == "partial value"
+    assert isinstance(error, JobCancelled)
+
+
+def test_errors_are_reported_to_on_done():
+    runner = JobRunner()
+    done = []
+
+    def work(context):
+        raise OSError("disk")
+
+    runner.start("work", work, on_done=lambda value, error: done.append((value, error)))
+    poll_until(runner, lambda: done)
+
+    assert done[0][0] is None and isinstance(done[0][1], OSError)
+
+
+def test_busy_until_finished_job_is_polled():
+    runner = JobRunner()
+    release = threading.Event()
+    job = runner.start("work", lambda context: release.wait(TIMEOUT))
+    assert runner.busy
+
+    release.set()
+    job.join(TIMEOUT)
+    # İş bitti ama "done" olayı teslim edilmedi: hâlâ meşgul
+    assert runner.busy
+    assert runner._jobs == [job]
+
+    assert runner.poll() == 1
+    assert job.finished
+    assert runner._jobs == []
+    assert not runner.busy
+
+
+def test_poll_limit_leaves_remaining_events_queued():
+    runner = JobRunner()
+    partials = []
+
+    def work(context):
+        for i in range(5):
+            context.emit(i)
+
+    job = runner.start("work", work, on_partial=partials.append)
+    job.join(TIMEOUT)
+
+    assert runner.poll(limit=2) == 2
+    assert partials == [0, 1]
+    assert runner.busy
+    assert runner.poll() == 4
+    assert partials == [0, 1, 2, 3, 4]
+    assert not runner.busy
+
+
+def test_shutdown_cancels_and_joins_running_jobs():
+    runner = JobRunner()
+    started = threading.Event()
+
+    def work(context):
+        started.set()
+        while True:
+            context.check()
+            time.sleep(0.001)
+
+    job = runner.start("work", work)
+    assert started.wait(TIMEOUT)
+    runner.shutdown(TIMEOUT)
+
+    assert job.cancelled
+    assert not job._thread.is_alive()
@@ -0,0 +1,95 @@
+import json
+import os
+
+import pytest
+
+import photo_sorter_cli
+from photo_sorter_cli import EXIT_CANCELLED, EXIT_OK, EXIT_USAGE, main
+
+# Çekim tarihi EXIF olmadığı için dosya tarihinden gelir: ad -> mtime
+PHOTOS = {"c.jpg": 1_600_000_000, "a.jpg": 1_600_000_200, "b.jpg": 1_600_000_100}
+
+
+@pytest.fixture
+def folder(tmp_path, monkeypatch):
+    monkeypatch.setenv("PHOTO_SORTER_CACHE_DIR", str(tmp_path / "cache"))
+    folder = tmp_path / "photos"
+    folder.mkdir()
+    for name, mtime in PHOTOS.items():
+        path = folder / name
+        path.write_bytes(name.encode())
+        os.utime(path, (mtime, mtime))
+    return folder
+
+
+def run(capsys, *argv):
+    """main()'i çalıştır: (çıkış kodu, JSON kayıtları)"""
+    status = main([*argv, "--workers", "1"])
+    lines = capsys.readouterr().out.splitlines()
+    return status, [json.loads(line) for line in lines]
+
+
+def contents(folder):
+    return {path.name: path.read_bytes() for path in folder.iterdir()}
+
+
+def test_plan_apply_undo_round_trip(folder, capsys):
+    original = contents(folder)
+    renamed = {"IMG_0001.jpg": b"c.jpg", "IMG_0002.jpg": b"b.jpg", "IMG_0003.jpg": b"a.jpg"}
+
+    status, records = run(capsys, "plan", str(folder), "--json")
+    assert status == EXIT_OK
+    assert {os.path.basename(r["new"]) for r in records if r["type"] == "rename"} == set(renamed)
+    assert contents(folder) == original
+
+    status, records = run(capsys, "apply", str(folder), "--yes", "--json")
+    assert status == EXIT_OK
+    assert records[-1]["renamed"] == 3 and records[-1]["cancelled"] is False
+    assert contents(folder) == renamed
+
+    status, records = run(capsys, "undo", "--yes", "--json")
+    assert status == EXIT_OK
+    assert records[-1]["restored"] == 3
+    assert contents(folder) == original
+
+    status, records = run(capsys, "undo", "--yes", "--json")
+    assert status == EXIT_OK
+    assert records[-1]["restored"] == 0
+
+
+@pytest.mark.parametrize("position", ["before", "after"])
+def test_json_records_with_option_before_or_after_the_command(folder, capsys, position):
+    argv = ["sort", str(folder), "--descending"]
+    argv = ["--json", *argv] if position == "before" else [*argv, "--json"]
+
+    status, records = run(capsys, *argv)
+    assert status == EXIT_OK
+    photos = [record for record in records if record["type"] == "photo"]
+    assert [record["name"] for record in photos] == ["a.jpg", "b.jpg", "c.jpg"]
+    assert [record["index"] for record in photos] == [1, 2, 3]
+    assert records[-1] == {
+        "type": "summary", "command": "sort", "folder": str(folder), "photos": 3,
+        "order": "descending",
+    }
+
+
+def test_usage_errors_exit_with_2(folder, tmp_path, capsys):
+    assert main(["sort", str(tmp_path / "missing")]) == EXIT_USAGE
+    # Etkileşimsiz çalıştırmada onay istenemez: --yes olmadan dosyalara dokunulmaz
+    original = contents(folder)
+    assert main(["apply", str(folder), "--workers", "1"]) == EXIT_USAGE
+    assert contents(folder) == original
+    with pytest.raises(SystemExit) as error:
+        main(["sort"])
+    assert error.value.code == EXIT_USAGE
+
+
+def test_interrupted_apply_exits_with_130(folder, capsys, monkeypatch):
+    # Ctrl+C işleyici kurulur kurulmaz gelmiş gibi: ilk güvenli noktada iptal
+    monkeypatch.setattr(photo_sorter_cli.signal, "signal", lambda signum, handler: handler(signum, None))
+    original = contents(folder)
+
+    status, records = run(capsys, "apply", str(folder), "--yes", "--json")
+    assert status == EXIT_CANCELLED
+    assert records[-1]["cancelled"] is True and records[-1]["renamed"] == 0
+    assert contents(folder) == original
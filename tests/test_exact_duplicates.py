@@ -0,0 +1,111 @@
+import hashlib
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import exact_duplicates
+from exact_duplicates import HASH_BATCH_FILES, HEAD_BYTES, _regroup, find_duplicates, full_digest
+
+LARGE = HEAD_BYTES * 2 + 123
+
+
+def write(folder, name, data):
+    path = folder / name
+    path.write_bytes(data)
+    return str(path)
+
+
+@pytest.fixture
+def full_reads(monkeypatch):
+    """Tümüyle hash'lenen dosyaların adları"""
+    calls = []
+
+    def counting(photo_path):
+        calls.append(os.path.basename(photo_path))
+        return full_digest(photo_path)
+
+    monkeypatch.setattr(exact_duplicates, "full_digest", counting)
+    return calls
+
+
+def test_stages_separate_lookalikes_and_find_true_copies(tmp_path, full_reads):
+    body = os.urandom(LARGE)
+    other_head = os.urandom(HEAD_BYTES) + body[HEAD_BYTES:]
+    other_tail = body[:-1] + bytes([body[-1] ^ 1])
+    small = os.urandom(1000)
+    paths = {
+        "original.jpg": write(tmp_path, "original.jpg", body),
+        "other_head.jpg": write(tmp_path, "other_head.jpg", other_head),
+        "other_tail.jpg": write(tmp_path, "other_tail.jpg", other_tail),
+        "copy.jpg": write(tmp_path, "copy.jpg", body),
+        "small.jpg": write(tmp_path, "small.jpg", small),
+        "small_copy.jpg": write(tmp_path, "small_copy.jpg", small),
+        "small_other.jpg": write(tmp_path, "small_other.jpg", os.urandom(1000)),
+        "unique_size.jpg": write(tmp_path, "unique_size.jpg", body[:5000]),
+        "empty1.jpg": write(tmp_path, "empty1.jpg", b""),
+        "empty2.jpg": write(tmp_path, "empty2.jpg", b""),
+    }
+    files = [(name, path, None if name.startswith("small") else os.path.getsize(path))
+             for name, path in paths.items()]
+    files.append(("missing.jpg", str(tmp_path / "missing.jpg"), None))
+
+    groups = find_duplicates(files, workers=2)
+
+    assert groups == [["original.jpg", "copy.jpg"], ["small.jpg", "small_copy.jpg"]]
+    # Baş bloğu farklı olan dosya tam okunmaz; küçük dosyalar baş blokta biter
+    assert sorted(full_reads) == ["copy.jpg", "original.jpg", "other_tail.jpg"]
+
+
+def test_zero_byte_files_are_never_duplicates(tmp_path):
+    files = [(i, write(tmp_path, f"{i}.jpg", b""), 0) for i in range(3)]
+    assert find_duplicates(files) == []
+
+
+def test_full_digest_of_empty_file_falls_back_to_reading(tmp_path):
+    # Boş dosya mmap edilemez (ValueError): akış halinde okumaya düşülür
+    empty = write(tmp_path, "empty.jpg", b"")
+    assert full_digest(empty) == hashlib.blake2b(b"", digest_size=16).digest()
+
+    data = os.urandom(LARGE)
+    assert full_digest(write(tmp_path, "data.jpg", data)) == hashlib.blake2b(data, digest_size=16).digest()
+
+
+def test_regroup_batches_groups_and_drops_unreadable_files():
+    # Gruplar HASH_BATCH_FILES sınırını aşacak kadar çok: birden fazla parti
+    groups = [[(g * 10 + i, f"k{g}-{i}", f"{g}/{i}", 1) for i in range(3)] for g in range(HASH_BATCH_FILES)]
+
+    def digest_of(path):
+        group, item = map(int, path.split("/"))
+        if group % 3 == 0 and item == 0:
+            raise OSError("okunamadı")
+        # Her grubun 1. ve 2. dosyası aynı, 3. grupta hepsi aynı
+        return "same" if item or group % 3 == 1 else f"{group}-{item}"
+
+    reports = []
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        result = _regroup(groups, digest_of, executor, lambda done, total: reports.append((done, total)))
+
+    total = 3 * HASH_BATCH_FILES
+    assert len(reports) > 1
+    assert reports[-1] == (total, total)
+    assert [done for done, _ in reports] == sorted(done for done, _ in reports)
+    expected = [
+        group if g % 3 == 1 else group[1:]
+        for g, group in enumerate(groups)
+    ]
+    assert result == expected
+
+
+def test_check_can_cancel_between_batches(tmp_path):
+    data = os.urandom(100)
+    files = [(i, write(tmp_path, f"{i}.jpg", data), 100) for i in range(4)]
+
+    class Stop(Exception):
+        pass
+
+    def check():
+        raise Stop()
+
+    with pytest.raises(Stop):
+        find_duplicates(files, check=check)
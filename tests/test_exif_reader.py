@@ -0,0 +1,93 @@
+import struct
+import time
+from datetime import datetime
+
+import pytest
+
+import exif_reader
+
+
+def make_tiff(ifd0, ifd1=None, extra=b""):
+    """Küçük-endian TIFF: ifd0/ifd1 [(etiket, tip, adet, ham 4 bayt)] listeleri"""
+    def ifd(entries, next_offset):
+        data = struct.pack("<H", len(entries))
+        for tag, typ, count, raw in entries:
+            data += struct.pack("<HHI", tag, typ, count) + raw
+        return data + struct.pack("<I", next_offset)
+
+    ifd0_size = 2 + 12 * len(ifd0) + 4
+    ifd1_offset = 8 + ifd0_size if ifd1 is not None else 0
+    data = b"II*\x00" + struct.pack("<I", 8) + ifd(ifd0, ifd1_offset)
+    if ifd1 is not None:
+        data += ifd(ifd1, 0)
+    return data + extra
+
+
+def write(tmp_path, data, name="photo.tif"):
+    path = tmp_path / name
+    path.write_bytes(data)
+    return str(path)
+
+
+def test_thumbnail_with_huge_count_is_rejected_quickly(tmp_path):
+    huge = [
+        (exif_reader.TAG_JPEG_INTERCHANGE_FORMAT, exif_reader.TYPE_LONG, 2 ** 27, struct.pack("<I", 8)),
+        (exif_reader.TAG_JPEG_INTERCHANGE_FORMAT_LENGTH, exif_reader.TYPE_LONG, 2 ** 32 - 1, struct.pack("<I", 8)),
+    ]
+    path = write(tmp_path, make_tiff([], huge).ljust(100, b"\x00"))
+    start = time.perf_counter()
+    assert exif_reader.read_embedded_thumbnail(path) is None
+    assert time.perf_counter() - start < 1
+
+
+def test_value_rejects_oversized_and_truncated_entries():
+    reader = exif_reader.TiffReader.from_bytes(make_tiff([]))
+    with pytest.raises(ValueError):
+        reader.value((exif_reader.TYPE_LONG, 2 ** 27, struct.pack("<I", 8)))
+    with pytest.raises(ValueError):
+        reader.value((exif_reader.TYPE_SHORT, 100, struct.pack("<I", 8)))
+
+
+def test_thumbnail_is_read(tmp_path):
+    thumbnail = b"\xff\xd8" + b"\x00" * 30 + b"\xff\xd9"
+    ifd1 = [
+        (exif_reader.TAG_JPEG_INTERCHANGE_FORMAT, exif_reader.TYPE_LONG, 1, b"\x00\x00\x00\x00"),
+        (exif_reader.TAG_JPEG_INTERCHANGE_FORMAT_LENGTH, exif_reader.TYPE_LONG, 1,
+         struct.pack("<I", len(thumbnail))),
+    ]
+    offset = len(make_tiff([], ifd1))
+    ifd1[0] = (ifd1[0][0], ifd1[0][1], 1, struct.pack("<I", offset))
+    path = write(tmp_path, make_tiff([], ifd1, thumbnail))
+    assert exif_reader.read_embedded_thumbnail(path) == thumbnail
+
+
+def test_thumbnail_offset_must_be_single_long(tmp_path):
+    ifd1 = [
+        (exif_reader.TAG_JPEG_INTERCHANGE_FORMAT, exif_reader.TYPE_SHORT, 2, b"\x08\x00\x08\x00"),
+        (exif_reader.TAG_JPEG_INTERCHANGE_FORMAT_LENGTH, exif_reader.TYPE_LONG, 1, struct.pack("<I", 4)),
+    ]
+    assert exif_reader.read_embedded_thumbnail(write(tmp_path, make_tiff([], ifd1))) is None
+
+
+def test_date_is_read_from_exif_ifd(tmp_path):
+    date = b"2021:05:06 07:08:09\x00"
+    exif_ifd_offset = len(make_tiff([(exif_reader.TAG_EXIF_IFD, exif_reader.TYPE_LONG, 1, b"\x00" * 4)]))
+    date_offset = exif_ifd_offset + 2 + 12 + 4
+    data = make_tiff(
+        [(exif_reader.TAG_EXIF_IFD, exif_reader.TYPE_LONG, 1, struct.pack("<I", exif_ifd_offset))],
+        extra=struct.pack("<HHHI", 1, exif_reader.TAG_DATETIME_ORIGINAL, exif_reader.TYPE_ASCII, len(date))
+        + struct.pack("<I", date_offset) + struct.pack("<I", 0) + date
+    )
+    assert exif_reader.read_exif_date(write(tmp_path, data)) == datetime(2021, 5, 6, 7, 8, 9)
+
+
+def test_corrupt_date_entries_are_skipped_quickly(tmp_path):
+    data = make_tiff([
+        # Exif IFD işaretçisi tek bir LONG değil
+        (exif_reader.TAG_EXIF_IFD, exif_reader.TYPE_LONG, 2 ** 30, struct.pack("<I", 8)),
+        # Tarih metni için anlamsız uzunluk
+        (exif_reader.TAG_DATETIME, exif_reader.TYPE_ASCII, 2 ** 32 - 1, struct.pack("<I", 8)),
+    ]).ljust(100, b"\x00")
+    start = time.perf_counter()
+    assert exif_reader.read_exif_date(write(tmp_path, data)) is None
+    assert time.perf_counter() - start < 1
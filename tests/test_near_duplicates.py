@@ -0,0 +1,95 @@
+import random
+
+import pytest
+from PIL import Image
+
+from near_duplicates import DEFAULT_RADIUS, _chunks, find_groups, hamming, photo_hash
+
+RADII = range(11)
+
+
+def brute_force_groups(hashes, radius):
+    """Tüm çiftleri karşılaştıran union-find: find_groups ile aynı biçimde"""
+    keys = list(hashes)
+    parent = list(range(len(keys)))
+
+    def find(i):
+        while parent[i] != i:
+            i = parent[i]
+        return i
+
+    for a in range(len(keys)):
+        for b in range(a + 1, len(keys)):
+            if hamming(hashes[keys[a]], hashes[keys[b]]) <= radius:
+                parent[max(find(a), find(b))] = min(find(a), find(b))
+    groups = {}
+    for i, key in enumerate(keys):
+        groups.setdefault(find(i), []).append(key)
+    return sorted((group for group in groups.values() if len(group) > 1), key=lambda g: keys.index(g[0]))
+
+
+def clustered_hashes(rng, count=300):
+    """Rastgele merkezler ve onlardan 0-12 bit uzaklıktaki hash'ler (eşitler dahil)"""
+    centers = [rng.getrandbits(64) for _ in range(count // 10)]
+    hashes = {}
+    for key in range(count):
+        value = rng.choice(centers)
+        for bit in rng.sample(range(64), rng.randrange(13)):
+            value ^= 1 << bit
+        hashes[f"IMG_{key:04d}"] = value
+    return hashes
+
+
+@pytest.mark.parametrize("radius", RADII)
+@pytest.mark.parametrize("seed", range(3))
+def test_find_groups_matches_brute_force(radius, seed):
+    hashes = clustered_hashes(random.Random(seed))
+    assert find_groups(hashes, radius) == brute_force_groups(hashes, radius)
+
+
+@pytest.mark.parametrize("radius", RADII)
+def test_chunks_cover_all_bits_with_at_most_one_bit_per_chunk(radius):
+    chunks = _chunks(radius)
+    assert len(chunks) == radius // 2 + 1
+    assert chunks[0][0] == 0
+    assert sum(width for _, width in chunks) == 64
+    for (shift, width), (next_shift, _) in zip(chunks, chunks[1:]):
+        assert shift + width == next_shift
+    # Güvercin yuvası: radius bit fark parçalardan birinde en fazla 1 bite düşer
+    assert radius // len(chunks) <= 1
+
+
+def test_pair_at_exact_radius_is_grouped_across_chunk_boundaries():
+    base = random.Random(7).getrandbits(64)
+    for radius in RADII:
+        # Farklı bitler her parçaya eşit dağılsın: hiçbir parça birebir aynı değil
+        bits = [shift + i for shift, width in _chunks(radius) for i in range(2) if i < width][:radius]
+        other = base
+        for bit in bits:
+            other ^= 1 << bit
+        assert hamming(base, other) == radius
+        assert find_groups({"a": base, "b": other, "far": ~base & (2**64 - 1)}, radius) == [["a", "b"]]
+
+
+def scene(seed):
+    """Yumuşak geçişli, rastgele bir sahne (gerçek fotoğraf gibi düşük frekanslı)"""
+    rng = random.Random(seed)
+    small = Image.frombytes("RGB", (6, 5), bytes(rng.randrange(256) for _ in range(6 * 5 * 3)))
+    return small.resize((1200, 900), Image.Resampling.BICUBIC)
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_dhash_survives_resize_and_recompression(tmp_path, seed):
+    image = scene(seed)
+    original = tmp_path / "original.jpg"
+    copy = tmp_path / "copy.jpg"
+    image.save(original, quality=95)
+    image.resize((640, 480), Image.Resampling.LANCZOS).save(copy, quality=60)
+    other = tmp_path / "other.jpg"
+    scene(seed + 100).save(other, quality=95)
+
+    assert hamming(photo_hash(original), photo_hash(copy)) <= DEFAULT_RADIUS
+    assert hamming(photo_hash(original), photo_hash(other)) > DEFAULT_RADIUS
+    assert find_groups({
+        "original": photo_hash(original), "other": photo_hash(other), "copy": photo_hash(copy),
+    }) == [["original", "copy"]]
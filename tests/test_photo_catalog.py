@@ -0,0 +1,98 @@
+import random
+from datetime import datetime, timedelta
+
+import pytest
+
+from photo_catalog import MERGE_BATCH_SIZE, PhotoCatalog
+
+BASE = datetime(2024, 5, 1, 12, 0, 0)
+
+
+def make_records(count, rng):
+    """Tarama sırasıyla kayıtlar; az sayıda farklı tarih (bol eşitlik)"""
+    records = []
+    for seq in range(count):
+        date = BASE + timedelta(seconds=rng.randrange(count // 4 + 1), microseconds=rng.choice((0, 1)))
+        path = f"/photos/DSC_{seq:05d}.jpg"
+        records.append((seq, path, date, path.rsplit("/", 1)[1], seq * 10))
+    return records
+
+
+def expected(records, reverse):
+    return [(path, date, name) for _, path, date, name, _ in sorted(records, key=lambda r: r[2], reverse=reverse)]
+
+
+def add_in_batches(catalog, records, sizes, rng):
+    """Kayıtları karışık sırada gelen gruplar halinde ekle (paralel tarama gibi)"""
+    batches = []
+    start = 0
+    while start < len(records):
+        size = rng.choice(sizes)
+        batches.append(records[start:start + size])
+        start += size
+    rng.shuffle(batches)
+    for batch in batches:
+        catalog.add(batch)
+
+
+@pytest.mark.parametrize("reverse", [False, True])
+@pytest.mark.parametrize("sizes", [(1, 7, MERGE_BATCH_SIZE), (MERGE_BATCH_SIZE + 1, 300), (1, 40, 65, 500)])
+@pytest.mark.parametrize("seed", range(5))
+def test_incremental_add_matches_sorted(reverse, sizes, seed):
+    rng = random.Random(seed)
+    records = make_records(1200, rng)
+    catalog = PhotoCatalog(reverse=reverse)
+    add_in_batches(catalog, records, sizes, rng)
+
+    assert list(catalog.photos) == expected(records, reverse)
+    for position, photo in enumerate(catalog.photos):
+        assert catalog.photos.index(photo) == position
+
+
+def test_ties_keep_scan_order():
+    records = [(seq, f"/p/{seq}.jpg", BASE, f"{seq}.jpg", None) for seq in range(5)]
+    for reverse in (False, True):
+        catalog = PhotoCatalog(reverse=reverse)
+        catalog.add(records[3:])
+        catalog.add(records[:3])
+        assert [name for _, _, name in catalog.photos] == ["0.jpg", "1.jpg", "2.jpg", "3.jpg", "4.jpg"]
+
+
+def test_reset_keeps_ids_and_sizes():
+    rng = random.Random(1)
+    records = make_records(200, rng)
+    catalog = PhotoCatalog()
+    catalog.add(records)
+    ids = {path: catalog.id_of(path) for _, path, _, _, _ in records}
+    catalog.set_hashes([(ids[records[0][1]], 42)])
+
+    catalog.reset(reverse=True)
+    assert len(catalog) == 0
+    assert catalog.position(ids[records[0][1]]) is None
+    assert catalog.hash(ids[records[0][1]]) is None
+
+    add_in_batches(catalog, records, (MERGE_BATCH_SIZE + 1,), rng)
+    assert {path: catalog.id_of(path) for _, path, _, _, _ in records} == ids
+    assert list(catalog.photos) == expected(records, reverse=True)
+    assert catalog.size(ids[records[3][1]]) == 30
+
+
+def test_rename_swap_keeps_ids_and_order():
+    records = [
+        (0, "/p/A.jpg", BASE, "A.jpg", 1),
+        (1, "/p/B.jpg", BASE + timedelta(days=1), "B.jpg", 2),
+        (2, "/p/C.jpg", BASE + timedelta(days=2), "C.jpg", 3),
+    ]
+    catalog = PhotoCatalog()
+    catalog.add(records)
+    id_a, id_b, id_c = (catalog.id_of(path) for _, path, _, _, _ in records)
+    order = list(catalog.order)
+
+    catalog.rename({"/p/A.jpg": "/p/B.jpg", "/p/B.jpg": "/p/A.jpg", "/p/missing.jpg": "/p/X.jpg"})
+    assert catalog.id_of("/p/B.jpg") == id_a
+    assert catalog.id_of("/p/A.jpg") == id_b
+    assert catalog.id_of("/p/C.jpg") == id_c
+    assert catalog.id_of("/p/X.jpg") is None
+    assert list(catalog.order) == order
+    assert catalog.photo(id_a) == ("/p/B.jpg", BASE, "B.jpg")
+    assert catalog.size(id_a) == 1
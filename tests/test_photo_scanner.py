@@ -0,0 +1,142 @@
+import os
+import threading
+from datetime import datetime
+
+import pytest
+
+import photo_scanner
+from metadata_index import MetadataIndex
+from photo_scanner import iter_scan
+
+# EXIF olmadığı için tarih dosya tarihinden gelir: ad -> mtime
+PHOTOS = {"a.jpg": 1_600_000_000, "b.jpg": 1_600_000_100, "c.jpg": 1_600_000_200}
+
+
+@pytest.fixture
+def folder(tmp_path):
+    folder = tmp_path / "photos"
+    folder.mkdir()
+    for name, mtime in PHOTOS.items():
+        path = folder / name
+        path.write_bytes(name.encode())
+        os.utime(path, (mtime, mtime))
+    return folder
+
+
+@pytest.fixture
+def index(tmp_path):
+    index = MetadataIndex(tmp_path / "cache" / "metadata.sqlite3")
+    yield index
+    index.close()
+
+
+@pytest.fixture
+def reads(monkeypatch):
+    """Tarihi dosyadan yeniden çıkarılan yollar"""
+    calls = []
+    get_photo_date = photo_scanner.get_photo_date
+
+    def counting(photo_path, mtime=None):
+        calls.append(os.path.basename(photo_path))
+        return get_photo_date(photo_path, mtime)
+
+    monkeypatch.setattr(photo_scanner, "get_photo_date", counting)
+    return calls
+
+
+def scan(folder, index, cancel=None):
+    """{dosya adı: tarih}"""
+    return {
+        name: date
+        for batch in iter_scan(str(folder), index=index, cancel=cancel)
+        for _, _, date, name, _ in batch
+    }
+
+
+def test_unchanged_files_come_from_the_index(folder, index, reads):
+    first = scan(folder, index)
+    assert sorted(reads) == sorted(PHOTOS)
+    assert first == {name: datetime.fromtimestamp(mtime) for name, mtime in PHOTOS.items()}
+
+    reads.clear()
+    assert scan(folder, index) == first
+    assert reads == []
+
+
+def test_changed_file_is_dated_again(folder, index, reads):
+    scan(folder, index)
+    reads.clear()
+
+    path = folder / "b.jpg"
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 5_000_000_000))
+    dates = scan(folder, index)
+
+    assert reads == ["b.jpg"]
+    assert dates["b.jpg"] == datetime.fromtimestamp(PHOTOS["b.jpg"] + 5)
+    # Yeni tarih indekse yazıldı: bir sonraki taramada dosya okunmaz
+    reads.clear()
+    assert scan(folder, index) == dates
+    assert reads == []
+
+
+def test_changed_size_is_dated_again(folder, index, reads):
+    scan(folder, index)
+    reads.clear()
+
+    path = folder / "c.jpg"
+    path.write_bytes(b"larger content")
+    os.utime(path, (PHOTOS["c.jpg"], PHOTOS["c.jpg"]))
+    scan(folder, index)
+
+    assert reads == ["c.jpg"]
+
+
+def test_removed_paths_are_pruned_only_after_a_complete_scan(folder, index):
+    scan(folder, index)
+    os.remove(folder / "a.jpg")
+    removed = str(folder / "a.jpg")
+
+    cancel = threading.Event()
+    cancel.set()
+    assert scan(folder, index, cancel) == {}
+    assert removed in index.load_folder(folder)
+
+    # Tüketilmeden kapatılan tarama da yarım kalmış sayılır
+    batches = iter_scan(str(folder), index=index, flush_interval=0)
+    next(batches)
+    batches.close()
+    assert removed in index.load_folder(folder)
+
+    assert set(scan(folder, index)) == {"b.jpg", "c.jpg"}
+    assert set(index.load_folder(folder)) == {str(folder / "b.jpg"), str(folder / "c.jpg")}
+
+
+def test_rename_carries_rows_and_hashes(folder, index, reads):
+    scan(folder, index)
+    a, b, c = (str(folder / name) for name in ("a.jpg", "b.jpg", "c.jpg"))
+    # İşaret biti dolu hash de SQLite'tan aynı değerle geri gelmeli
+    index.set_hashes([(a, 0xFFFF_0000_FFFF_0001), (b, 7)])
+    before = index.load_folder(folder)
+
+    # Takas ve yeni ada taşıma
+    moves = [(a, b), (b, a), (c, str(folder / "IMG_0003.jpg"))]
+    temp = str(folder / "swap.tmp")
+    os.rename(a, temp)
+    os.rename(b, a)
+    os.rename(temp, b)
+    os.rename(c, str(folder / "IMG_0003.jpg"))
+    index.rename(moves)
+
+    after = index.load_folder(folder)
+    assert after == {new: before[old] for old, new in moves}
+    assert index.load_hashes(folder) == {b: 0xFFFF_0000_FFFF_0001, a: 7}
+
+    reads.clear()
+    dates = scan(folder, index)
+    assert reads == []
+    assert dates == {
+        "a.jpg": datetime.fromtimestamp(PHOTOS["b.jpg"]),
+        "b.jpg": datetime.fromtimestamp(PHOTOS["a.jpg"]),
+        "IMG_0003.jpg": datetime.fromtimestamp(PHOTOS["c.jpg"]),
+    }
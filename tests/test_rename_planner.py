@@ -0,0 +1,97 @@
+import os
+
+from rename_planner import TEMP_PREFIX, plan_moves, plan_renames
+
+
+def make_files(folder, names):
+    """Her dosyanın içeriği kendi ilk adıdır"""
+    for name in names:
+        (folder / name).write_text(name)
+
+
+def contents(folder):
+    return {path.name: path.read_text() for path in folder.iterdir()}
+
+
+def photos(folder, names):
+    return [(str(folder / name), None, name) for name in names]
+
+
+def temp_steps(plan):
+    return [step for step in plan.steps if os.path.basename(step[1]).startswith(TEMP_PREFIX)]
+
+
+def test_three_cycle_is_broken_with_one_temp_name(tmp_path):
+    make_files(tmp_path, ["a.jpg", "b.jpg", "c.jpg"])
+    moves = [(str(tmp_path / src), str(tmp_path / dst))
+             for src, dst in [("a.jpg", "b.jpg"), ("b.jpg", "c.jpg"), ("c.jpg", "a.jpg")]]
+
+    plan = plan_moves(moves)
+    assert len(temp_steps(plan)) == 1
+    assert len(plan.steps) == 4
+    plan.execute()
+
+    assert contents(tmp_path) == {"b.jpg": "a.jpg", "c.jpg": "b.jpg", "a.jpg": "c.jpg"}
+    assert sorted(plan.completed_moves()) == sorted(moves)
+    assert plan.parked == 0
+
+
+def test_swap_gets_the_requested_names(tmp_path):
+    make_files(tmp_path, ["IMG_0001.jpg", "IMG_0002.jpg"])
+
+    plan = plan_renames(photos(tmp_path, ["IMG_0002.jpg", "IMG_0001.jpg"]))
+    assert len(temp_steps(plan)) == 1
+    plan.execute()
+
+    assert contents(tmp_path) == {"IMG_0001.jpg": "IMG_0002.jpg", "IMG_0002.jpg": "IMG_0001.jpg"}
+    assert plan.conflicts == []
+
+
+def test_chain_runs_in_order_without_temp_names(tmp_path):
+    make_files(tmp_path, ["IMG_0002.jpg", "IMG_0003.jpg", "DSC_0001.jpg"])
+
+    # 2 -> 1 hemen yapılır; 3 -> 2 ve DSC -> 3 yer boşaldıkça sırayla
+    plan = plan_renames(photos(tmp_path, ["IMG_0002.jpg", "IMG_0003.jpg", "DSC_0001.jpg"]))
+    assert temp_steps(plan) == []
+    plan.execute()
+
+    assert contents(tmp_path) == {
+        "IMG_0001.jpg": "IMG_0002.jpg",
+        "IMG_0002.jpg": "IMG_0003.jpg",
+        "IMG_0003.jpg": "DSC_0001.jpg",
+    }
+
+
+def test_correctly_named_files_are_skipped(tmp_path):
+    make_files(tmp_path, ["IMG_0001.jpg", "IMG_0002.jpg", "DSC_0009.jpg"])
+
+    plan = plan_renames(photos(tmp_path, ["IMG_0001.jpg", "IMG_0002.jpg", "DSC_0009.jpg"]))
+    assert plan.skipped == 2
+    assert [(os.path.basename(src), os.path.basename(dst)) for src, dst, _ in plan.steps] == [
+        ("DSC_0009.jpg", "IMG_0003.jpg")
+    ]
+
+
+def test_target_held_by_file_outside_the_plan_gets_suffix(tmp_path):
+    make_files(tmp_path, ["IMG_0001.jpg", "IMG_0001_1.jpg", "DSC_0001.jpg", "DSC_0002.jpg"])
+
+    # IMG_0001 ve IMG_0001_1 plan dışı: ilk boş ek seçilir, onlara dokunulmaz
+    plan = plan_renames(photos(tmp_path, ["DSC_0001.jpg", "DSC_0002.jpg"]))
+    plan.execute()
+
+    assert contents(tmp_path) == {
+        "IMG_0001.jpg": "IMG_0001.jpg",
+        "IMG_0001_1.jpg": "IMG_0001_1.jpg",
+        "IMG_0001_2.jpg": "DSC_0001.jpg",
+        "IMG_0002.jpg": "DSC_0002.jpg",
+    }
+
+
+def test_move_onto_file_outside_the_plan_is_a_conflict(tmp_path):
+    make_files(tmp_path, ["a.jpg", "b.jpg", "outside.jpg"])
+    a, b, outside = (str(tmp_path / name) for name in ("a.jpg", "b.jpg", "outside.jpg"))
+
+    # b bekleyen a'nın hedefi çakışınca a yerinde kalır, b de çakışır
+    plan = plan_moves([(a, outside), (b, a)])
+    assert plan.steps == []
+    assert sorted(plan.conflicts) == sorted([(a, outside), (b, a)])
@@ -0,0 +1,187 @@
+import os
+import random
+
+import pytest
+
+import photo_engine
+import rename_journal
+import rename_planner
+from rename_journal import RenameJournal
+
+SEEDS = range(40)
+
+
+class Crash(BaseException):
+    """Sürecin öldürülmesi: sonrasında hiçbir dosya işlemi veya günlük kaydı yapılmaz"""
+
+
+class CrashPoint:
+    """Yeniden adlandırmaları ve günlük kayıtlarını sayıp seçilen olayda çöker"""
+
+    def __init__(self, monkeypatch):
+        self.remaining = None
+        self.crashed = False
+        rename = os.rename
+        write = rename_journal.JournalWriter._write
+
+        def crashing_rename(src, dst):
+            after = self._tick()
+            rename(src, dst)
+            if after:
+                raise Crash()
+
+        def crashing_write(writer, record, sync=True):
+            after = self._tick()
+            write(writer, record, sync)
+            if after:
+                raise Crash()
+
+        monkeypatch.setattr(rename_planner.os, "rename", crashing_rename)
+        monkeypatch.setattr(rename_journal.JournalWriter, "_write", crashing_write)
+
+    def arm(self, rng, events):
+        """0..events arasında rastgele bir olayda çök (adından önce veya sonra)"""
+        self.remaining = rng.randrange(events + 1)
+        self.crashed = False
+        self.after = rng.random() < 0.5
+
+    def disarm(self):
+        self.remaining = None
+        self.crashed = False
+
+    def _tick(self):
+        if self.crashed:
+            raise Crash()
+        if self.remaining is None:
+            return False
+        if self.remaining == 0:
+            self.crashed = True
+            if not self.after:
+                raise Crash()
+            return True
+        self.remaining -= 1
+        return False
+
+
+@pytest.fixture
+def crash(monkeypatch):
+    # Her adımdan sonra ilerleme işareti yazılsın; çökme işaret yazımına da denk gelebilir
+    monkeypatch.setattr(rename_journal, "JOURNAL_SYNC_INTERVAL", 2)
+    return CrashPoint(monkeypatch)
+
+
+def make_tree(folder, rng):
+    """Takas, döngü ve zincir içeren rastgele bir klasör; (sıralı liste, içerik) döndürür"""
+    folder.mkdir()
+    count = rng.randint(2, 12)
+    numbers = rng.sample(range(1, count + 3), count)
+    names = [
+        f"IMG_{number:04d}.jpg" if rng.random() < 0.7 else f"DSC_{number:04d}.jpg"
+        for number in numbers
+    ]
+    for name in names:
+        (folder / name).write_bytes(name.encode())
+    if rng.random() < 0.3:
+        # Hedef adlardan birini tutan, plan dışı bir dosya
+        outsider = f"IMG_{rng.randint(1, count):04d}.jpg"
+        if outsider not in names:
+            (folder / outsider).write_bytes(b"outsider")
+    rng.shuffle(names)
+    return [(str(folder / name), None, name) for name in names]
+
+
+def contents(folder):
+    """{dosya adı: içerik}; geçici adda kalan dosyalar da görünür"""
+    return {path.name: path.read_bytes() for path in folder.iterdir()}
+
+
+def renamed(before, moves):
+    """before durumuna [(eski_yol, yeni_yol), ...] taşımaları uygulanmış hali"""
+    names = {os.path.basename(old): os.path.basename(new) for old, new in moves}
+    return {names.get(name, name): data for name, data in before.items()}
+
+
+def crash_apply(tmp_path, rng, crash):
+    """Ağacı kur ve uygulamayı rastgele bir noktada çökert
+
+    (klasör, günlük, özgün durum, planlanan son durum) döndürür. Çökme
+    uygulama bittikten sonraya denk gelirse yarım grup kalmaz.
+    """
+    folder = tmp_path / "photos"
+    photos = make_tree(folder, rng)
+    journal = RenameJournal(tmp_path / "journal")
+    original = contents(folder)
+    planned = renamed(original, rename_planner.plan_renames(photos).final_moves())
+
+    crash.arm(rng, 2 * len(photos) + 4)
+    try:
+        photo_engine.apply_order(photos, journal)
+    except Crash:
+        pass
+    crash.disarm()
+    return folder, journal, original, planned
+
+
+def recover_all(journal, forward):
+    photo_engine.recover(journal, forward)
+    assert journal.incomplete() == []
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_crashed_apply_rolls_forward_to_planned_names(tmp_path, crash, seed):
+    rng = random.Random(seed)
+    folder, journal, original, planned = crash_apply(tmp_path, rng, crash)
+
+    recover_all(journal, forward=True)
+    assert contents(folder) == planned
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_crashed_apply_rolls_back_to_original_names(tmp_path, crash, seed):
+    rng = random.Random(seed)
+    folder, journal, original, planned = crash_apply(tmp_path, rng, crash)
+
+    pending = bool(journal.incomplete())
+    recover_all(journal, forward=False)
+    assert contents(folder) == (original if pending else planned)
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_crash_during_rollback_is_recoverable(tmp_path, crash, seed):
+    rng = random.Random(seed)
+    folder, journal, original, planned = crash_apply(tmp_path, rng, crash)
+    pending = bool(journal.incomplete())
+
+    crash.arm(rng, 2 * len(original) + 4)
+    try:
+        photo_engine.recover(journal, forward=False)
+    except Crash:
+        pass
+    crash.disarm()
+
+    # Yarım kalan geri sarma her iki yönde de tamamlanır
+    recover_all(journal, forward=rng.random() < 0.5)
+    assert contents(folder) == (original if pending else planned)
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_crashed_undo_recovers_in_both_directions(tmp_path, crash, seed):
+    rng = random.Random(seed)
+    folder = tmp_path / "photos"
+    photos = make_tree(folder, rng)
+    journal = RenameJournal(tmp_path / "journal")
+    original = contents(folder)
+    photo_engine.apply_order(photos, journal)
+    applied = contents(folder)
+
+    crash.arm(rng, 2 * len(photos) + 4)
+    try:
+        photo_engine.undo_last(journal)
+    except Crash:
+        pass
+    crash.disarm()
+    pending = bool(journal.incomplete())
+
+    forward = rng.random() < 0.5
+    recover_all(journal, forward)
+    assert contents(folder) == (original if forward or not pending else applied)
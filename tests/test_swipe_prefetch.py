@@ -0,0 +1,27 @@
+import threading
+
+from swipe_prefetch import SwipePrefetcher
+from thumbnail_pipeline import ThumbnailPipeline
+
+
+def test_master_loaded_across_clear_is_not_stored():
+    started, release = threading.Event(), threading.Event()
+
+    def load_master(photo_path):
+        started.set()
+        release.wait(5)
+        return f"master:{photo_path}"
+
+    pipeline = ThumbnailPipeline(workers=1)
+    try:
+        prefetcher = SwipePrefetcher(None, pipeline, load_master, lambda master, box: master)
+        worker = threading.Thread(target=prefetcher._master, args=("IMG_0005.jpg",))
+        worker.start()
+        assert started.wait(5)
+        # Yükleme sürerken yollar değişti: önbellek boşaltılır
+        prefetcher.clear()
+        release.set()
+        worker.join(5)
+        assert prefetcher._masters == {}
+    finally:
+        pipeline.shutdown()
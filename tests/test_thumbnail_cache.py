@@ -0,0 +1,93 @@
+import os
+
+from PIL import Image
+
+from thumbnail_cache import PREVIEWS_NAME, ThumbnailCache
+
+SIZE = (64, 64)
+
+
+def noise():
+    """Sıkıştırılamayan, her seferinde farklı bir görsel"""
+    return Image.frombytes("RGB", SIZE, os.urandom(SIZE[0] * SIZE[1] * 3))
+
+
+def make_photo(folder, name):
+    path = folder / name
+    path.write_bytes(name.encode())
+    return str(path)
+
+
+def test_entry_survives_rename(tmp_path):
+    cache = ThumbnailCache(tmp_path / "cache")
+    photo_path = make_photo(tmp_path, "DSC_0001.jpg")
+    cache.put(photo_path, SIZE, noise())
+
+    renamed = str(tmp_path / "IMG_0001.jpg")
+    os.rename(photo_path, renamed)
+    assert cache.get(renamed, SIZE) is not None
+    cache.close()
+
+
+def test_changed_mtime_misses(tmp_path):
+    cache = ThumbnailCache(tmp_path / "cache")
+    photo_path = make_photo(tmp_path, "IMG_0001.jpg")
+    cache.put(photo_path, SIZE, noise())
+
+    st = os.stat(photo_path)
+    os.utime(photo_path, ns=(st.st_atime_ns, st.st_mtime_ns + 1))
+    assert cache.get(photo_path, SIZE) is None
+    cache.close()
+
+
+def test_eviction_goes_down_to_ninety_percent_of_budget(tmp_path):
+    photos = [make_photo(tmp_path, f"IMG_{i:04d}.jpg") for i in range(20)]
+    probe = ThumbnailCache(tmp_path / "probe")
+    probe.put(photos[0], SIZE, noise())
+    entry_bytes = probe.total_bytes
+    probe.close()
+
+    budget = entry_bytes * 10
+    cache = ThumbnailCache(tmp_path / "cache", max_bytes=budget)
+    evictions = 0
+    for photo_path in photos:
+        before = cache.total_bytes
+        cache.put(photo_path, SIZE, noise())
+        assert cache.total_bytes <= budget
+        if cache.total_bytes < before:
+            evictions += 1
+            assert cache.total_bytes <= budget * 0.9
+    assert evictions
+    # En uzun süredir kullanılmayanlar silinir, en yeniler kalır
+    assert cache.get(photos[0], SIZE) is None
+    assert cache.get(photos[-1], SIZE) is not None
+    cache.close()
+
+
+def test_corrupt_blob_is_discarded(tmp_path):
+    cache = ThumbnailCache(tmp_path / "cache")
+    photo_path = make_photo(tmp_path, "IMG_0001.jpg")
+    cache.put(photo_path, SIZE, noise())
+    key = cache.make_key(photo_path, SIZE)
+    cache._conn.execute("UPDATE thumbnails SET data = ?, nbytes = 7 WHERE key = ?", (b"garbage", key))
+    cache._conn.commit()
+    cache._total_bytes = 7
+
+    assert cache.get(photo_path, SIZE) is None
+    assert cache.total_bytes == 0
+    assert cache._conn.execute("SELECT COUNT(*) FROM thumbnails").fetchone()[0] == 0
+    cache.close()
+
+
+def test_large_previews_do_not_evict_thumbnails(tmp_path):
+    photos = [make_photo(tmp_path, f"IMG_{i:04d}.jpg") for i in range(20)]
+    thumbnails = ThumbnailCache(tmp_path / "cache")
+    previews = ThumbnailCache(tmp_path / "cache", max_bytes=1, name=PREVIEWS_NAME)
+    thumbnails.put(photos[0], SIZE, noise())
+
+    for photo_path in photos:
+        previews.put(photo_path, (2048, 2048), noise())
+    assert thumbnails.get(photos[0], SIZE) is not None
+    assert previews.total_bytes <= 1
+    thumbnails.close()
+    previews.close()
@@ -0,0 +1,168 @@
+import threading
+import time
+
+import pytest
+
+from thumbnail_pipeline import ThumbnailPipeline
+
+TIMEOUT = 5.0
+
+
+@pytest.fixture
+def pipeline():
+    # Tek worker: bloklayan iş sürerken diğerleri kuyrukta bekler
+    pipeline = ThumbnailPipeline(workers=1)
+    yield pipeline
+    pipeline.shutdown()
+
+
+class Blocker:
+    """Worker'ı release() çağrılana kadar meşgul tutan iş"""
+
+    def __init__(self):
+        self.started = threading.Event()
+        self.gate = threading.Event()
+
+    def __call__(self):
+        self.started.set()
+        self.gate.wait(TIMEOUT)
+        return "blocked"
+
+    def release(self):
+        self.gate.set()
+
+
+def delivered(results):
+    """Sonuçları (anahtar, değer, hata) olarak listeye ekleyen geri çağrı"""
+    return lambda key, value, error: results.append((key, value, error))
+
+
+def drain(pipeline):
+    deadline = time.monotonic() + TIMEOUT
+    while pipeline.busy:
+        assert time.monotonic() < deadline, "işler zamanında bitmedi"
+        pipeline.poll()
+        time.sleep(0.001)
+    pipeline.poll()
+
+
+def hold(pipeline, results, group="default"):
+    """Worker'ı meşgul et; sonucu results'a düşen Blocker döndür"""
+    blocker = Blocker()
+    pipeline.submit("block", blocker, delivered(results), group=group)
+    assert blocker.started.wait(TIMEOUT)
+    return blocker
+
+
+def submit_all(pipeline, results, keys, group="default", priority=0):
+    for key in keys:
+        pipeline.submit(key, lambda key=key: key.upper(), delivered(results), priority, group)
+
+
+def test_priority_upgrade_runs_task_earlier(pipeline):
+    results = []
+    blocker = hold(pipeline, results)
+    submit_all(pipeline, results, ["a", "b", "c"], priority=5)
+    # Aynı anahtar tekrar gönderilince iş çoğalmaz, yalnızca öne alınır
+    pipeline.submit("c", lambda: "ignored", delivered(results), priority=1)
+    pipeline.submit("a", lambda: "ignored", delivered(results), priority=9)
+    blocker.release()
+    drain(pipeline)
+
+    assert results == [("block", "blocked", None), ("c", "C", None), ("a", "A", None), ("b", "B", None)]
+
+
+def test_cancel_with_keep_delivers_kept_and_running_tasks(pipeline):
+    results = []
+    blocker = hold(pipeline, results, group="gallery")
+    submit_all(pipeline, results, ["a", "b", "c"], group="gallery")
+    submit_all(pipeline, results, ["other"], group="swipe")
+
+    pipeline.cancel("gallery", keep={"b"})
+    assert not pipeline.is_pending("a", "gallery")
+    assert pipeline.is_pending("b", "gallery")
+    blocker.release()
+    drain(pipeline)
+
+    # Devam eden iş keep dışında olsa da sonucu teslim edilir
+    assert sorted(key for key, _, _ in results) == ["b", "block", "other"]
+
+
+def test_cancel_without_keep_drops_running_results(pipeline):
+    results = []
+    blocker = hold(pipeline, results, group="gallery")
+    submit_all(pipeline, results, ["a"], group="gallery")
+    submit_all(pipeline, results, ["other"], group="swipe")
+
+    pipeline.cancel("gallery")
+    # İptalden sonra gönderilen işler yeni nesildedir: teslim edilir
+    submit_all(pipeline, results, ["b"], group="gallery")
+    blocker.release()
+    drain(pipeline)
+
+    assert sorted(key for key, _, _ in results) == ["b", "other"]
+
+
+def test_result_finished_before_cancel_is_dropped_at_poll(pipeline):
+    results = []
+    submit_all(pipeline, results, ["a"])
+    deadline = time.monotonic() + TIMEOUT
+    while pipeline._results.empty():
+        assert time.monotonic() < deadline
+        time.sleep(0.001)
+
+    pipeline.cancel()
+    assert pipeline.poll() == 1
+    assert results == []
+
+
+def test_pause_ignores_submissions_until_resume(pipeline):
+    results = []
+    blocker = hold(pipeline, results, group="gallery")
+    submit_all(pipeline, results, ["a"], group="gallery")
+
+    pipeline.pause("gallery")
+    submit_all(pipeline, results, ["b"], group="gallery")
+    assert not pipeline.is_pending("b", "gallery")
+    submit_all(pipeline, results, ["other"], group="swipe")
+    blocker.release()
+    drain(pipeline)
+    assert [key for key, _, _ in results] == ["other"]
+
+    pipeline.resume("gallery")
+    submit_all(pipeline, results, ["c"], group="gallery")
+    drain(pipeline)
+    assert [key for key, _, _ in results] == ["other", "c"]
+
+
+def test_errors_are_passed_to_the_callback(pipeline):
+    results = []
+
+    def fail():
+        raise OSError("bozuk dosya")
+
+    pipeline.submit("bad", fail, delivered(results))
+    drain(pipeline)
+
+    (key, value, error), = results
+    assert key == "bad" and value is None and isinstance(error, OSError)
+
+
+def test_poll_limit_and_busy(pipeline):
+    results = []
+    blocker = hold(pipeline, results)
+    submit_all(pipeline, results, ["a", "b"])
+    assert pipeline.busy
+    blocker.release()
+
+    deadline = time.monotonic() + TIMEOUT
+    while pipeline._tasks or pipeline._inflight:
+        assert time.monotonic() < deadline
+        time.sleep(0.001)
+    # Tüm işler bitti ama sonuçlar teslim edilmedi: hâlâ meşgul
+    assert pipeline.busy
+    assert pipeline.poll(limit=2) == 2
+    assert pipeline.busy
+    assert pipeline.poll() == 1
+    assert not pipeline.busy
+    assert [key for key, _, _ in results] == ["block", "a", "b"]
@@ -0,0 +1,44 @@
+from PIL import Image, ImageChops
+
+import tile_pyramid
+
+
+class MemoryCache:
+    """ThumbnailCache'in piramidin kullandığı kısmı"""
+
+    def __init__(self):
+        self.items = {}
+
+    def get(self, photo_path, label):
+        return self.items.get((photo_path, label))
+
+    def put_many(self, photo_path, images):
+        for label, image in images.items():
+            self.items[(photo_path, label)] = image
+
+
+def make_photo(tmp_path):
+    path = tmp_path / "photo.jpg"
+    Image.effect_mandelbrot((1300, 900), (-2, -1.5, 1, 1.5), 100).convert("RGB").save(path, quality=95)
+    return str(path)
+
+
+def test_full_resolution_tiles_are_lossless_and_not_cached(tmp_path):
+    photo_path = make_photo(tmp_path)
+    cache = MemoryCache()
+    pyramid = tile_pyramid.TilePyramid(photo_path, cache)
+    source = Image.open(photo_path).convert("RGB")
+
+    tile = pyramid.tile(0, 2, 1)
+    assert ImageChops.difference(tile, source.crop((1024, 512, 1300, 900))).getbbox() is None
+    assert not cache.items
+
+    pyramid.release_source()
+    assert tile_pyramid._SOURCE == [None, None]
+
+
+def test_reduced_levels_are_cached(tmp_path):
+    cache = MemoryCache()
+    pyramid = tile_pyramid.TilePyramid(make_photo(tmp_path), cache)
+    assert pyramid.tile(1, 0, 0).size == (512, 450)
+    assert len(cache.items) == 2  # Seviye 1'in tüm döşemeleri
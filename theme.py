@@ -0,0 +1,50 @@
+"""Tema kaydı: widget renklerini paletteki rollere bağlar.
+
+Widget'lar oluşturulurken hangi seçeneğin hangi palet rolünü kullandığı
+kaydedilir (ör. `fg_color="surface"`). Tema değişince kayıtlı widget'lar
+yok edilip yeniden oluşturulmadan yalnızca `configure` ile yeniden
+renklendirilir; görseller ve widget durumu (metinler, seçimler, kaydırma
+konumu) korunur. Maliyet yüklü fotoğraf sayısından bağımsızdır.
+"""
+
+
+class ThemeRegistry:
+    """Renkleri palet rollerine bağlı widget'ların kaydı"""
+
+    def __init__(self, palette):
+        self.palette = palette
+        self._entries = []  # [(widget, {seçenek: rol veya palette -> renk}), ...]
+        self._listeners = []  # palette -> None (kendi renklerini yöneten bileşenler)
+
+    def register(self, widget, **roles):
+        """widget'ın seçeneklerini palet rollerine bağla; widget'ı döndürür
+
+        Rol bir palet anahtarı ya da paleti alıp renk döndüren bir fonksiyon
+        olabilir (ör. duruma göre değişen renkler için).
+        """
+        self._entries.append((widget, roles))
+        return widget
+
+    def add_listener(self, callback):
+        """Tema değişince callback(palette)'i çağır (ör. kendi kartlarını tutan galeri)"""
+        self._listeners.append(callback)
+
+    def color(self, role):
+        """Rolün geçerli paletteki rengi"""
+        return role(self.palette) if callable(role) else self.palette[role]
+
+    def apply(self, palette):
+        """Yeni paleti tüm kayıtlı widget'lara uygula (yok edilmiş olanlar atılır)"""
+        self.palette = palette
+        alive = []
+        for widget, roles in self._entries:
+            try:
+                if not widget.winfo_exists():
+                    continue
+                widget.configure(**{option: self.color(role) for option, role in roles.items()})
+            except Exception:
+                continue  # Yok edilmiş widget
+            alive.append((widget, roles))
+        self._entries = alive
+        for callback in self._listeners:
+            callback(palette)
@@ -0,0 +1,247 @@
+"""Kalıcı (disk üzerinde) thumbnail önbelleği.
+
+Önizlemeler dosya kimliğine (inode veya yol, boyut, mtime_ns) ve hedef kutu
+boyutuna göre anahtarlanır ve bir SQLite veritabanında saklanır. Toplam
+boyut bütçeyi aştığında en uzun süredir kullanılmayan kayıtlar (LRU) silinir.
+
+Galeri thumbnail'leri ile büyük önizlemeler (swipe ana önizlemesi, büyük
+görünümün genel görünümü ve döşeme piramidi) ayrı veritabanlarında, ayrı
+bütçelerle tutulur: tek bir büyük önizleme onlarca thumbnail kadar yer
+kapladığından, aynı LRU'da swipe modunda gezinmek galeri thumbnail'lerini
+silerdi.
+"""
+import io
+import os
+import sqlite3
+import sys
+import threading
+import time
+from pathlib import Path
+
+# Varsayılan önbellek bütçeleri: galeri thumbnail'leri ve büyük önizlemeler için ayrı ayrı 1 GB
+DEFAULT_MAX_BYTES = 1024 * 1024 * 1024
+DEFAULT_PREVIEW_MAX_BYTES = 1024 * 1024 * 1024
+
+# Veritabanı dosya adları (önbellek klasöründe, .sqlite3 uzantısıyla)
+THUMBNAILS_NAME = "thumbnails"
+PREVIEWS_NAME = "previews"
+
+# Son erişim zamanları bu kadar isabette bir toplu olarak yazılır
+TOUCH_FLUSH_INTERVAL = 256
+
+
+def default_cache_dir():
+    """Platforma uygun önbellek klasörünü döndür"""
+    override = os.environ.get("PHOTO_SORTER_CACHE_DIR")
+    if override:
+        return Path(override)
+    if sys.platform == "win32":
+        base = os.environ.get("LOCALAPPDATA") or (Path.home() / "AppData" / "Local")
+        return Path(base) / "PhotoSorter" / "Cache"
+    if sys.platform == "darwin":
+        return Path.home() / "Library" / "Caches" / "PhotoSorter"
+    base = os.environ.get("XDG_CACHE_HOME") or (Path.home() / ".cache")
+    return Path(base) / "photo_sorter"
+
+
+def file_identity(photo_path, st=None):
+    """Dosya kimliğini döndür: (inode veya yol, boyut, mtime_ns)
+
+    Yeniden adlandırma inode'u değiştirmediği için, inode destekleyen dosya
+    sistemlerinde "Uygula" sonrasında önbellek geçerliliğini korur.
+    """
+    if st is None:
+        st = os.stat(photo_path)
+    if st.st_ino:
+        ident = f"{st.st_dev}:{st.st_ino}"
+    else:
+        # inode bilgisi olmayan dosya sistemleri (FAT vb.) için yolu kullan
+        ident = os.path.normcase(os.path.abspath(photo_path))
+    return f"{ident}:{st.st_size}:{st.st_mtime_ns}"
+
+
+class ThumbnailCache:
+    """SQLite tabanlı, boyut bütçeli LRU thumbnail deposu (thread-safe)
+
+    name aynı klasördeki veritabanı dosyasını seçer; her dosyanın bütçesi ayrıdır.
+    """
+
+    def __init__(self, cache_dir=None, max_bytes=DEFAULT_MAX_BYTES, name=THUMBNAILS_NAME):
+        self.cache_dir = Path(cache_dir) if cache_dir else default_cache_dir()
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._pending_touches = {}
+
+        self._conn = sqlite3.connect(
+            str(self.cache_dir / f"{name}.sqlite3"),
+            check_same_thread=False
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS thumbnails ("
+            " key TEXT PRIMARY KEY,"
+            " data BLOB NOT NULL,"
+            " nbytes INTEGER NOT NULL,"
+            " last_access REAL NOT NULL)"
+        )
+        # Kapsayan indeks: açılıştaki toplam boyut sorgusu blob sayfalarını
+        # okumadan yalnızca indeksi tarar
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS thumbnails_lru ON thumbnails(last_access, nbytes)"
+        )
+        self._conn.commit()
+        self._total_bytes = self._conn.execute(
+            "SELECT COALESCE(SUM(nbytes), 0) FROM thumbnails"
+        ).fetchone()[0]
+
+    @staticmethod
+    def make_key(photo_path, size, st=None):
+        """Önbellek anahtarı: dosya kimliği + hedef kutu boyutu
+
+        size bir (genişlik, yükseklik) çifti ya da kutu boyutuyla ifade
+        edilemeyen kayıtlar için bir etikettir (ör. döşeme "tile512-1-3-2").
+        """
+        label = size if isinstance(size, str) else "{}x{}".format(*size)
+        return f"{file_identity(photo_path, st)}:{label}"
+
+    def get(self, photo_path, size):
+        """Önbellekteki önizlemeyi döndür (yoksa None)"""
+        try:
+            key = self.make_key(photo_path, size)
+        except OSError:
+            return None
+
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT data FROM thumbnails WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            self._pending_touches[key] = time.time()
+            if len(self._pending_touches) >= TOUCH_FLUSH_INTERVAL:
+                self._flush_touches()
+
+        # PIL yalnızca gerektiğinde yüklenir (başsız motor önbellek klasörünü de kullanır)
+        from PIL import Image
+
+        try:
+            img = Image.open(io.BytesIO(row[0]))
+            img.load()
+            return img
+        except Exception:
+            # Bozuk kayıt - sil ve yeniden oluşturulmasına izin ver
+            self.discard(key)
+            return None
+
+    def put(self, photo_path, size, image):
+        """Önizlemeyi önbelleğe yaz"""
+        self.put_many(photo_path, {size: image})
+
+    def put_many(self, photo_path, images):
+        """Aynı dosyanın {boyut veya etiket: görsel} kayıtlarını tek işlemde yaz"""
+        try:
+            st = os.stat(photo_path)
+        except OSError:
+            return
+        rows = [
+            (self.make_key(photo_path, size, st), self._encode(image))
+            for size, image in images.items()
+        ]
+
+        with self._lock:
+            for key, data in rows:
+                old = self._conn.execute(
+                    "SELECT nbytes FROM thumbnails WHERE key = ?", (key,)
+                ).fetchone()
+                if old is not None:
+                    self._total_bytes -= old[0]
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO thumbnails (key, data, nbytes, last_access) VALUES (?, ?, ?, ?)",
+                    (key, sqlite3.Binary(data), len(data), time.time())
+                )
+                self._total_bytes += len(data)
+                self._pending_touches.pop(key, None)
+            self._flush_touches()
+            if self._total_bytes > self.max_bytes:
+                self._evict()
+            self._conn.commit()
+
+    @staticmethod
+    def _encode(image):
+        buffer = io.BytesIO()
+        if image.mode in ("RGBA", "LA", "P", "1"):
+            # Şeffaflık / palet içeren görseller kayıpsız saklanır
+            image.save(buffer, format="PNG")
+        else:
+            if image.mode not in ("RGB", "L"):
+                image = image.convert("RGB")
+            image.save(buffer, format="JPEG", quality=90)
+        return buffer.getvalue()
+
+    def get_or_create(self, photo_path, size, factory):
+        """Önbellekte varsa döndür, yoksa factory(photo_path, size) ile üret ve kaydet"""
+        img = self.get(photo_path, size)
+        if img is None:
+            img = factory(photo_path, size)
+            self.put(photo_path, size, img)
+        return img
+
+    def discard(self, key):
+        """Tek bir kaydı sil"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT nbytes FROM thumbnails WHERE key = ?", (key,)
+            ).fetchone()
+            if row is not None:
+                self._conn.execute("DELETE FROM thumbnails WHERE key = ?", (key,))
+                self._total_bytes -= row[0]
+                self._conn.commit()
+
+    def clear(self):
+        """Tüm önbelleği temizle"""
+        with self._lock:
+            self._conn.execute("DELETE FROM thumbnails")
+            self._conn.commit()
+            self._pending_touches.clear()
+            self._total_bytes = 0
+
+    def close(self):
+        """Bekleyen erişim zamanlarını yaz ve bağlantıyı kapat"""
+        with self._lock:
+            self._flush_touches()
+            self._conn.commit()
+            self._conn.close()
+
+    @property
+    def total_bytes(self):
+        return self._total_bytes
+
+    def _flush_touches(self):
+        """Biriken son erişim zamanlarını toplu olarak yaz (kilit alınmış olmalı)"""
+        if not self._pending_touches:
+            return
+        self._conn.executemany(
+            "UPDATE thumbnails SET last_access = ? WHERE key = ?",
+            [(stamp, key) for key, stamp in self._pending_touches.items()]
+        )
+        self._pending_touches.clear()
+        self._conn.commit()
+
+    def _evict(self):
+        """Bütçenin %90'ına inene kadar en eski kayıtları sil (kilit alınmış olmalı)"""
+        target = int(self.max_bytes * 0.9)
+        cursor = self._conn.execute(
+            "SELECT key, nbytes FROM thumbnails ORDER BY last_access ASC"
+        )
+        victims = []
+        freed = 0
+        for key, nbytes in cursor:
+            if self._total_bytes - freed <= target:
+                break
+            victims.append((key,))
+            freed += nbytes
+        cursor.close()
+        self._conn.executemany("DELETE FROM thumbnails WHERE key = ?", victims)
+        self._total_bytes -= freed
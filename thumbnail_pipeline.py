@@ -0,0 +1,165 @@
+"""Arka plan thumbnail üretim hattı.
+
+İşler öncelikli bir kuyrukta bekler ve worker thread'ler tarafından yürütülür
+(PIL çözme ve yeniden boyutlandırma sırasında GIL'i bırakır). Sonuçlar
+thread-safe bir kuyrukta toplanır; ana thread bunları `poll()` ile (Tk
+tarafında `after()` döngüsünden) alır ve geri çağrıları kendi thread'inde
+çalıştırır. Bu yüzden geri çağrılar widget'lara güvenle dokunabilir.
+"""
+import heapq
+import itertools
+import os
+import queue
+import threading
+from collections import defaultdict
+
+
+def default_worker_count():
+    """Arayüz thread'ine bir çekirdek bırakacak şekilde worker sayısı"""
+    return max(2, min(8, (os.cpu_count() or 2) - 1))
+
+
+class _Task:
+    __slots__ = ("key", "group", "func", "callback", "priority", "seq", "generation", "cancelled")
+
+    def __init__(self, key, group, func, callback, priority, seq, generation):
+        self.key = key
+        self.group = group
+        self.func = func
+        self.callback = callback
+        self.priority = priority
+        self.seq = seq
+        self.generation = generation
+        self.cancelled = False
+
+
+class ThumbnailPipeline:
+    """Öncelikli, iptal edilebilir worker havuzu
+
+    İşler bir grup (örn. "gallery") ve grup içinde benzersiz bir anahtarla
+    gönderilir. Aynı anahtar tekrar gönderilirse yalnızca önceliği güncellenir.
+    Bir grup iptal edildiğinde bekleyen işleri silinir, devam eden işlerin
+    sonuçları ise `poll()` sırasında atılır. Duraklatılan bir grup `resume()`
+    çağrılana kadar yeni iş kabul etmez.
+    """
+
+    def __init__(self, workers=None):
+        self._cond = threading.Condition()
+        self._heap = []  # (öncelik, sıra, görev)
+        self._tasks = {}  # (grup, anahtar) -> bekleyen görev
+        self._results = queue.SimpleQueue()
+        self._seq = itertools.count()
+        self._generations = defaultdict(int)  # grup -> nesil (yalnızca ana thread)
+        self._paused = set()  # Yeni iş kabul etmeyen gruplar
+        self._inflight = 0
+        self._closed = False
+
+        self._threads = []
+        for i in range(workers or default_worker_count()):
+            thread = threading.Thread(
+                target=self._worker, name=f"thumbnail-worker-{i}", daemon=True
+            )
+            thread.start()
+            self._threads.append(thread)
+
+    def submit(self, key, func, callback, priority=0, group="default"):
+        """func()'u arka planda çalıştır; sonuç callback(key, değer, hata) ile döner"""
+        with self._cond:
+            if group in self._paused:
+                return
+            task = self._tasks.get((group, key))
+            if task is not None:
+                # Zaten kuyrukta - gerekirse önceliğini yükselt
+                if priority < task.priority:
+                    task.priority = priority
+                    task.seq = next(self._seq)
+                    heapq.heappush(self._heap, (priority, task.seq, task))
+                return
+            task = _Task(key, group, func, callback, priority,
+                         next(self._seq), self._generations[group])
+            self._tasks[(group, key)] = task
+            heapq.heappush(self._heap, (priority, task.seq, task))
+            self._cond.notify()
+
+    def cancel(self, group="default", keep=None):
+        """Gruptaki bekleyen işleri iptal et
+
+        keep verilirse bu anahtarlara sahip işler korunur ve devam eden işlerin
+        sonuçları teslim edilir; verilmezse grubun tüm sonuçları da geçersiz olur.
+        """
+        with self._cond:
+            for (task_group, key), task in list(self._tasks.items()):
+                if task_group == group and (keep is None or key not in keep):
+                    task.cancelled = True
+                    del self._tasks[(task_group, key)]
+            if keep is None:
+                self._generations[group] += 1
+
+    def pause(self, group="default"):
+        """Grubu iptal et ve resume() çağrılana kadar gönderilen işleri yok say"""
+        with self._cond:
+            self._paused.add(group)
+        self.cancel(group)
+
+    def resume(self, group="default"):
+        """Duraklatılan grubun yeniden iş kabul etmesini sağla"""
+        with self._cond:
+            self._paused.discard(group)
+
+    def is_pending(self, key, group="default"):
+        """Anahtar kuyrukta bekliyor mu?"""
+        with self._cond:
+            return (group, key) in self._tasks
+
+    def poll(self, limit=None):
+        """Tamamlanan işlerin geri çağrılarını çalıştır (ana thread'den çağrılmalı)"""
+        processed = 0
+        while limit is None or processed < limit:
+            try:
+                task, value, error = self._results.get_nowait()
+            except queue.Empty:
+                break
+            processed += 1
+            if task.generation != self._generations[task.group]:
+                continue
+            task.callback(task.key, value, error)
+        return processed
+
+    @property
+    def busy(self):
+        """Bekleyen, yürütülen veya teslim edilmemiş iş var mı?"""
+        with self._cond:
+            if self._tasks or self._inflight:
+                return True
+        return not self._results.empty()
+
+    def shutdown(self):
+        """Worker'ları durdur (bekleyen işler atılır)"""
+        with self._cond:
+            self._closed = True
+            self._tasks.clear()
+            self._heap.clear()
+            self._cond.notify_all()
+
+    def _worker(self):
+        while True:
+            with self._cond:
+                while not self._closed and not self._heap:
+                    self._cond.wait()
+                if self._closed:
+                    return
+                priority, seq, task = heapq.heappop(self._heap)
+                # İptal edilmiş veya önceliği güncellenmiş eski kayıtları atla
+                if task.cancelled or task.seq != seq:
+                    continue
+                del self._tasks[(task.group, task.key)]
+                self._inflight += 1
+
+            try:
+                value, error = task.func(), None
+            except Exception as e:
+                value, error = None, e
+
+            self._results.put((task, value, error))
+            with self._cond:
+                self._inflight -= 1
@@ -0,0 +1,157 @@
+"""Büyük fotoğraflar için döşemeli, çok çözünürlüklü piramit.
+
+Seviye 0 tam çözünürlüktür; her üst seviye bir öncekinin yarısıdır ve en üst
+seviye tek döşemeye sığar. Her seviye `TILE_SIZE` karelik döşemelere bölünür.
+Görüntüleyici yalnızca görünür alana düşen döşemeleri ister.
+
+Küçültülmüş bir seviyenin döşemesi ilk kez istendiğinde seviye bir kez
+çözülür (JPEG'de draft ile doğrudan küçük ölçekte), tüm döşemeleri kesilip
+büyük önizleme önbelleğine yazılır ve çözülen görsel bırakılır. Sonraki istekler
+yalnızca ilgili döşemeyi okur. Aynı anda en fazla bir seviye çözülür ve
+bellekte sınırlı sayıda döşeme tutulur.
+
+Seviye 0 (tam çözünürlük, %100'de odak kontrolü için) önbelleğe yazılmaz:
+kayıplı yeniden sıkıştırma pikselleri bozar, 45 MP'lik bir karenin yüzlerce
+döşemesi de önbellekteki diğer fotoğrafların önizlemelerini silerdi. Bu
+döşemeler kaynak görselden istek üzerine kesilir; çözülmüş tam çözünürlüklü
+görsel yalnızca son kullanılan fotoğraf için bellekte tutulur.
+"""
+import math
+import threading
+from collections import OrderedDict
+
+from PIL import Image
+
+from preview_loader import scale_image
+
+TILE_SIZE = 512  # Döşeme kenarı (piksel)
+TILE_CACHE_SIZE = 32  # Bellekte tutulan çözülmüş döşeme sayısı
+
+# Seviye çözme işlemleri tam çözünürlükte büyük bellek kullanır: aynı anda bir tane
+_BUILD_LOCK = threading.Lock()
+
+# Seviye 0 döşemelerinin kesildiği tam çözünürlüklü kaynak: [piramit, görsel]
+# (_BUILD_LOCK ile korunur; aynı anda yalnızca bir fotoğrafınki tutulur)
+_SOURCE = [None, None]
+
+
+class TilePyramid:
+    """Tek bir fotoğrafın döşeme piramidi (thread-safe)"""
+
+    def __init__(self, photo_path, cache=None, tile_size=TILE_SIZE, capacity=TILE_CACHE_SIZE):
+        self.photo_path = photo_path
+        self.cache = cache  # Büyük önizleme ThumbnailCache'i (yoksa döşemeler yalnızca bellekte tutulur)
+        self.tile_size = tile_size
+        self.capacity = capacity
+        with Image.open(photo_path) as img:  # Yalnızca başlık okunur
+            self.width, self.height = img.size
+        self.levels = 1 + max(0, math.ceil(math.log2(max(self.width, self.height) / tile_size)))
+        self._tiles = OrderedDict()  # (seviye, sütun, satır) -> PIL Image (LRU)
+        self._lock = threading.Lock()
+        self._built = set()  # Döşemeleri önbelleğe yazılmış seviyeler
+
+    def level_size(self, level):
+        """Seviyenin piksel boyutu"""
+        scale = 2 ** level
+        return max(1, math.ceil(self.width / scale)), max(1, math.ceil(self.height / scale))
+
+    def grid(self, level):
+        """Seviyedeki (sütun, satır) döşeme sayısı"""
+        width, height = self.level_size(level)
+        return math.ceil(width / self.tile_size), math.ceil(height / self.tile_size)
+
+    def level_for(self, zoom):
+        """Ekran pikseli başına görüntü pikseli zoom'u için yeterli en küçük seviye"""
+        if zoom <= 0:
+            return self.levels - 1
+        level = int(math.floor(math.log2(1 / zoom))) if zoom < 1 else 0
+        return max(0, min(self.levels - 1, level))
+
+    def tile(self, level, col, row):
+        """Döşemeyi döndür (bellekte, önbellekte veya seviyeyi çözerek)"""
+        key = (level, col, row)
+        with self._lock:
+            tile = self._tiles.get(key)
+            if tile is not None:
+                self._tiles.move_to_end(key)
+                return tile
+        if level == 0:
+            tile = self._source_tile(col, row)
+        else:
+            tile = self.cache.get(self.photo_path, self._label(*key)) if self.cache is not None else None
+            if tile is None:
+                tile = self._build_tile(key)
+        self._remember(key, tile)
+        return tile
+
+    def _label(self, level, col, row):
+        return f"tile{self.tile_size}-{level}-{col}-{row}"
+
+    def _remember(self, key, tile):
+        with self._lock:
+            self._tiles[key] = tile
+            self._tiles.move_to_end(key)
+            while len(self._tiles) > self.capacity:
+                self._tiles.popitem(last=False)
+
+    def _box(self, level, col, row):
+        width, height = self.level_size(level)
+        size = self.tile_size
+        return (col * size, row * size, min((col + 1) * size, width), min((row + 1) * size, height))
+
+    def _source_tile(self, col, row):
+        """Seviye 0 döşemesini kaynak görselden kes (kayıpsız; önbelleğe yazılmaz)"""
+        with _BUILD_LOCK:
+            owner, img = _SOURCE
+            if owner is not self or img is None:
+                _SOURCE[:] = [None, None]  # Önceki fotoğrafın görseli önce bırakılır
+                img = scale_image(Image.open(self.photo_path), (self.width, self.height))
+                img.load()
+                _SOURCE[:] = [self, img]
+        return img.crop(self._box(0, col, row))
+
+    def release_source(self):
+        """Bu piramidin bellekte tutulan tam çözünürlüklü görselini bırak
+
+        Kilit beklenmez (ana thread'den çağrılır); kesmekte olan worker kendi
+        referansıyla devam eder.
+        """
+        if _SOURCE[0] is self:
+            _SOURCE[:] = [None, None]
+
+    def _build_tile(self, key):
+        """Döşemenin seviyesini çözerek döşemeyi üret"""
+        level = key[0]
+        with _BUILD_LOCK:
+            # Beklerken başka bir worker aynı seviyeyi çözmüş olabilir
+            if self.cache is not None and level in self._built:
+                tile = self.cache.get(self.photo_path, self._label(*key))
+                if tile is not None:
+                    return tile
+            tiles = self._build_level(level)
+        tile = tiles.pop(key)
+        if self.cache is None:
+            # Önbellek yoksa seviyenin diğer döşemeleri de sığdığı kadar bellekte kalır
+            for other_key, other in tiles.items():
+                self._remember(other_key, other)
+        return tile
+
+    def _build_level(self, level):
+        """Seviyeyi çöz, döşemelere böl ve önbelleğe yaz: {anahtar: döşeme} (_BUILD_LOCK alınmış olmalı)"""
+        target = self.level_size(level)
+        img = Image.open(self.photo_path)
+        if level > 0 and img.format == "JPEG" and img.mode in ("RGB", "L", "CMYK"):
+            # Çözücü hedeften küçük olmayan en küçük DCT ölçeğini seçer
+            img.draft(img.mode, target)
+        img = scale_image(img, target)
+
+        tiles = {}
+        cols, rows = self.grid(level)
+        for row in range(rows):
+            for col in range(cols):
+                tiles[(level, col, row)] = img.crop(self._box(level, col, row))
+        del img
+        if self.cache is not None:
+            self.cache.put_many(self.photo_path, {self._label(*key): tile for key, tile in tiles.items()})
+            self._built.add(level)
+        return tiles
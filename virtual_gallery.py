@@ -0,0 +1,490 @@
+"""Sanal (windowed) galeri görünümü.
+
+Yalnızca görünür satırlar ve çevresindeki birkaç satır için kart oluşturur;
+kaydırıldıkça görünümden çıkan kartlar yeni fotoğraflar için yeniden
+kullanılır. Böylece widget sayısı ve thumbnail çözme maliyeti klasör
+boyutundan bağımsız kalır. Thumbnail'ler arka plan hattında üretilir; kartlar
+önce placeholder ile gösterilir ve görsel hazır olduğunda doldurulur.
+
+Thumbnail'ler iki aşamada istenir: önce ucuz "hızlı" önizleme (önbellekteki
+thumbnail ya da EXIF'e gömülü küçük JPEG), ardından gerekirse tam kaliteli
+thumbnail. Böylece ilk görüntü neredeyse yalnızca disk okumasıyla gelir.
+"""
+import sys
+from collections import OrderedDict
+from functools import partial
+from tkinter import Canvas
+
+import customtkinter as ctk
+
+# Kart ölçüleri (ölçeklenmemiş piksel)
+CARD_WIDTH = 264  # 240 px thumbnail + 2 * 12 px iç boşluk
+CARD_HEIGHT = 340
+CARD_PADDING = 10
+THUMBNAIL_BOX = 240
+
+MAX_COLUMNS = 6  # Apple Music benzeri geniş grid
+OVERSCAN_ROWS = 2  # Görünür alanın üstünde ve altında hazır tutulan satır sayısı
+IMAGE_CACHE_SIZE = 512  # Bellekte tutulan CTkImage sayısı
+SCROLL_STEP = 60  # Fare tekerleği adımı (piksel)
+POLL_INTERVAL_MS = 30  # Thumbnail sonuçlarının kontrol aralığı
+THUMBNAIL_GROUP = "gallery"  # Thumbnail hattındaki iş grubu
+
+
+class GalleryCard(ctk.CTkFrame):
+    """Tek bir fotoğraf kartı - farklı fotoğraflar için yeniden kullanılır"""
+
+    def __init__(self, master, colors, on_open):
+        super().__init__(
+            master,
+            width=CARD_WIDTH,
+            height=CARD_HEIGHT,
+            fg_color=colors['card'],
+            corner_radius=10,
+            border_width=0,
+            cursor="hand2"
+        )
+        self.pack_propagate(False)
+        self.photo_path = None
+        self.index = None
+        self.has_image = False
+
+        # Thumbnail alanı (sabit boyutlu)
+        img_container = ctk.CTkFrame(
+            self,
+            fg_color="transparent",
+            width=THUMBNAIL_BOX,
+            height=THUMBNAIL_BOX
+        )
+        img_container.pack(padx=12, pady=(12, 0))
+        img_container.pack_propagate(False)
+
+        self.img_label = ctk.CTkLabel(
+            img_container,
+            text="📷",
+            font=ctk.CTkFont(size=48),
+            fg_color="transparent",
+            cursor="hand2"
+        )
+        self.img_label.pack(expand=True)
+
+        # Kart içerik container - Apple Music benzeri
+        card_content = ctk.CTkFrame(self, fg_color="transparent")
+        card_content.pack(fill="x", padx=12, pady=(0, 12))
+
+        self.name_label = ctk.CTkLabel(
+            card_content,
+            text="",
+            font=ctk.CTkFont(size=13, weight="bold"),
+            wraplength=200,
+            text_color=colors['text_primary'],
+            anchor="w"
+        )
+        self.name_label.pack(fill="x", pady=(10, 4))
+
+        self.date_label = ctk.CTkLabel(
+            card_content,
+            text="",
+            font=ctk.CTkFont(size=12),
+            text_color=colors['text_secondary'],
+            anchor="w"
+        )
+        self.date_label.pack(fill="x", pady=(0, 2))
+
+        self.index_label = ctk.CTkLabel(
+            card_content,
+            text="",
+            font=ctk.CTkFont(size=11),
+            text_color=colors['text_tertiary'],
+            anchor="w"
+        )
+        self.index_label.pack(fill="x", pady=(0, 0))
+
+        # Tıklama - kartın o anda gösterdiği fotoğrafı aç
+        def on_click(event):
+            if self.photo_path:
+                on_open(self.photo_path)
+
+        for widget in (self, img_container, self.img_label):
+            widget.bind("<Button-1>", on_click)
+
+    def show(self, index, photo, image):
+        """Kartı verilen fotoğrafla doldur"""
+        photo_path, photo_date, filename = photo
+        self.photo_path = photo_path
+        self.index = index
+        self.set_image(image)
+        self.name_label.configure(
+            text=filename[:25] + "..." if len(filename) > 25 else filename
+        )
+        self.date_label.configure(text=photo_date.strftime("%d.%m.%Y"))
+        self.index_label.configure(text=f"#{index + 1}")
+
+    def set_colors(self, colors):
+        """Kartı yeni paletle yeniden renklendir (görsel ve metinler korunur)"""
+        self.configure(fg_color=colors['card'])
+        self.name_label.configure(text_color=colors['text_primary'])
+        self.date_label.configure(text_color=colors['text_secondary'])
+        self.index_label.configure(text_color=colors['text_tertiary'])
+
+    def set_image(self, image):
+        """Thumbnail'i göster (None ise placeholder)"""
+        if image is None:
+            if self.has_image:
+                self.img_label.configure(image=None, text="📷")
+                # CTkLabel image=None ile eski görseli temizlemiyor
+                self.img_label._label.configure(image="")
+            self.has_image = False
+        else:
+            self.img_label.configure(image=image, text="")
+            self.has_image = True
+
+
+class VirtualGallery(ctk.CTkFrame):
+    """Yalnızca görünür kartları oluşturan, kaydırılabilir fotoğraf grid'i"""
+
+    def __init__(self, master, colors, pipeline, load_thumbnail, on_open,
+                 load_quick_thumbnail=None, **kwargs):
+        super().__init__(master, fg_color=colors['background'], corner_radius=0, **kwargs)
+        self.colors = colors
+        self.pipeline = pipeline  # ThumbnailPipeline
+        self.load_thumbnail = load_thumbnail  # photo_path -> PIL Image (worker thread'de çalışır)
+        # photo_path -> (PIL Image veya None, nihai mi?) (worker thread'de çalışır)
+        self.load_quick_thumbnail = load_quick_thumbnail
+        self.on_open = on_open  # photo_path -> None
+        self.photos = []
+
+        self._cards = {}  # fotoğraf indeksi -> GalleryCard
+        self._free_cards = []
+        self._card_items = {}  # GalleryCard -> canvas item id
+        self._images = OrderedDict()  # photo_path -> nihai CTkImage (LRU)
+        self._quick = OrderedDict()  # photo_path -> geçici CTkImage veya None (LRU)
+        self._failed = set()  # Thumbnail'i üretilemeyen dosyalar
+        self._columns = 1
+        self._refresh_pending = False
+        self._poll_id = None
+
+        self.canvas = Canvas(
+            self,
+            highlightthickness=0,
+            borderwidth=0,
+            bg=colors['background']
+        )
+        self.scrollbar = ctk.CTkScrollbar(self, command=self._on_scrollbar)
+        self.scrollbar.pack(side="right", fill="y")
+        self.canvas.pack(side="left", fill="both", expand=True)
+        self.canvas.configure(yscrollcommand=self.scrollbar.set)
+
+        self.canvas.bind("<Configure>", self._on_configure)
+        # Fare tekerleği yalnızca imleç galerinin üzerindeyken dinlenir
+        self.bind("<Enter>", self._bind_mousewheel)
+        self.bind("<Leave>", self._unbind_mousewheel)
+
+    # --- Genel API -----------------------------------------------------
+
+    def set_photos(self, photos):
+        """Gösterilecek fotoğraf listesini değiştir ve başa dön"""
+        self.photos = photos
+        # Önceki liste için bekleyen ve devam eden işleri iptal et
+        self.pipeline.cancel(THUMBNAIL_GROUP)
+        self._failed.clear()
+        for index in list(self._cards):
+            self._release_card(index)
+        self._update_layout()
+        self.canvas.yview_moveto(0)
+        self._refresh()
+
+    def set_colors(self, colors):
+        """Temayı yerinde uygula: yalnızca mevcut kartlar yeniden renklendirilir
+
+        Kart sayısı görünür alanla sınırlı olduğundan maliyet fotoğraf
+        sayısından bağımsızdır; thumbnail'ler yeniden üretilmez.
+        """
+        self.colors = colors
+        self.configure(fg_color=colors['background'])
+        self.canvas.configure(bg=colors['background'])
+        for card in list(self._cards.values()) + self._free_cards:
+            card.set_colors(colors)
+
+    def update_photos(self, photos):
+        """Listeyi kaydırma konumunu koruyarak güncelle (ör. tarama sürerken)
+
+        Devam eden thumbnail işleri iptal edilmez; kartlar yeni listedeki
+        konumlarına göre yeniden etiketlenir.
+        """
+        self.photos = photos
+        for index in list(self._cards):
+            if index >= len(photos):
+                self._release_card(index)
+        self._update_layout()
+        self.relabel()
+        self._schedule_refresh()
+
+    def rename_photos(self, photos, moves):
+        """Yeniden adlandırmadan sonra listeyi değiştir, kartları yeniden etiketle
+
+        moves {eski_yol: yeni_yol} eşlemesidir. Eski veya yeni yolu taşımaya
+        karışan hazır thumbnail'ler yeni yollara taşınmaz, atılır: zincirlerde
+        bir yol iş sürerken başka bir fotoğrafı tutmuş olabilir. Disk önbelleği
+        dosya kimliğiyle anahtarlandığı için yeniden yükleme ucuzdur.
+        """
+        # Eski yollarla gönderilmiş işlerin sonuçları artık geçersiz
+        self.pipeline.cancel(THUMBNAIL_GROUP)
+        for photo_path in set(moves) | set(moves.values()):
+            self._images.pop(photo_path, None)
+            self._quick.pop(photo_path, None)
+            self._failed.discard(photo_path)
+        self.update_photos(photos)
+
+    def pause(self):
+        """Thumbnail işlerini durdur (hazır görseller gösterilmeye devam eder)"""
+        self.pipeline.pause(THUMBNAIL_GROUP)
+
+    def resume(self):
+        """Durdurulan thumbnail işlerine devam et"""
+        self.pipeline.resume(THUMBNAIL_GROUP)
+        self._schedule_refresh()
+
+    def clear(self):
+        """Tüm kartları gizle"""
+        self.set_photos([])
+
+    def relabel(self):
+        """Görünür kartların metinlerini mevcut listeye göre güncelle"""
+        for index, card in self._cards.items():
+            if index < len(self.photos):
+                card.show(index, self.photos[index], self._get_image(self.photos[index][0]))
+
+    # --- Yerleşim --------------------------------------------------------
+
+    def _cell_size(self):
+        """Bir grid hücresinin ekran pikseli cinsinden boyutu"""
+        width = self._apply_widget_scaling(CARD_WIDTH + 2 * CARD_PADDING)
+        height = self._apply_widget_scaling(CARD_HEIGHT + 2 * CARD_PADDING)
+        return width, height
+
+    def _update_layout(self):
+        """Sütun sayısını ve kaydırma alanını yeniden hesapla"""
+        cell_width, cell_height = self._cell_size()
+        canvas_width = max(1, self.canvas.winfo_width())
+        self._columns = max(1, min(MAX_COLUMNS, int(canvas_width // cell_width)))
+        rows = (len(self.photos) + self._columns - 1) // self._columns
+        total_height = max(rows * cell_height, 1)
+        self.canvas.configure(scrollregion=(0, 0, canvas_width, total_height))
+
+    def _cell_origin(self, index):
+        """Kartın canvas üzerindeki sol üst köşesi"""
+        cell_width, cell_height = self._cell_size()
+        canvas_width = max(1, self.canvas.winfo_width())
+        # Grid'i yatayda ortala
+        left = max(0, (canvas_width - self._columns * cell_width) / 2)
+        row, col = divmod(index, self._columns)
+        padding = self._apply_widget_scaling(CARD_PADDING)
+        return left + col * cell_width + padding, row * cell_height + padding
+
+    def _visible_range(self, overscan=OVERSCAN_ROWS):
+        """Görünür (ve overscan) satırlara düşen fotoğraf indeksleri"""
+        if not self.photos:
+            return range(0)
+        _, cell_height = self._cell_size()
+        top = self.canvas.canvasy(0)
+        bottom = top + max(1, self.canvas.winfo_height())
+        first_row = max(0, int(top // cell_height) - overscan)
+        last_row = int(bottom // cell_height) + overscan
+        start = first_row * self._columns
+        stop = min(len(self.photos), (last_row + 1) * self._columns)
+        return range(start, stop)
+
+    def _refresh(self):
+        """Görünür aralıktaki kartları oluştur, dışarıda kalanları geri dönüştür"""
+        self._refresh_pending = False
+        visible = self._visible_range()
+
+        for index in list(self._cards):
+            if index not in visible:
+                self._release_card(index)
+
+        for index in visible:
+            if index in self._cards:
+                continue
+            card = self._acquire_card()
+            photo = self.photos[index]
+            card.show(index, photo, self._get_image(photo[0]))
+            x, y = self._cell_origin(index)
+            item = self._card_items[card]
+            self.canvas.coords(item, x, y)
+            self.canvas.itemconfigure(item, state="normal")
+            self._cards[index] = card
+
+        self._request_thumbnails(visible)
+
+    def _schedule_refresh(self):
+        """Aynı olay döngüsündeki kaydırma olaylarını tek bir yenilemede birleştir"""
+        if not self._refresh_pending:
+            self._refresh_pending = True
+            self.after_idle(self._refresh)
+
+    def _reposition_all(self):
+        """Genişlik değiştiğinde görünür kartları yeniden konumlandır"""
+        for index, card in self._cards.items():
+            x, y = self._cell_origin(index)
+            self.canvas.coords(self._card_items[card], x, y)
+
+    # --- Kart havuzu -----------------------------------------------------
+
+    def _acquire_card(self):
+        if self._free_cards:
+            return self._free_cards.pop()
+        card = GalleryCard(self.canvas, self.colors, self.on_open)
+        self._card_items[card] = self.canvas.create_window(
+            0, 0, window=card, anchor="nw", state="hidden"
+        )
+        return card
+
+    def _release_card(self, index):
+        card = self._cards.pop(index)
+        self.canvas.itemconfigure(self._card_items[card], state="hidden")
+        self._free_cards.append(card)
+
+    # --- Thumbnail'ler ---------------------------------------------------
+
+    def _get_image(self, photo_path):
+        """Fotoğrafın hazır CTkImage'ını döndür (nihai yoksa geçici, o da yoksa None)"""
+        image = self._images.get(photo_path)
+        if image is not None:
+            self._images.move_to_end(photo_path)
+            return image
+        return self._quick.get(photo_path)
+
+    def _request_thumbnails(self, visible):
+        """Eksik thumbnail'leri iste - önce görünür satırlar, sonra overscan"""
+        strict = self._visible_range(overscan=0)
+        needed = set()
+        for index in visible:
+            photo_path = self.photos[index][0]
+            if photo_path in self._images or photo_path in self._failed:
+                continue
+            tier = 0 if index in strict else 1
+            if self.load_quick_thumbnail is not None and photo_path not in self._quick:
+                # 1. aşama: önbellekteki ya da EXIF'e gömülü önizleme
+                key = ("quick", photo_path)
+                func = partial(self.load_quick_thumbnail, photo_path)
+                callback = self._on_quick_thumbnail
+                priority = (tier, index)
+            else:
+                # 2. aşama: tam kaliteli thumbnail (tüm hızlı işlerden sonra)
+                key = ("full", photo_path)
+                func = partial(self.load_thumbnail, photo_path)
+                callback = self._on_thumbnail
+                priority = (2 + tier, index)
+            needed.add(key)
+            self.pipeline.submit(key, func, callback, priority=priority, group=THUMBNAIL_GROUP)
+        # Görünümden çıkan kartların bekleyen işlerini iptal et
+        self.pipeline.cancel(THUMBNAIL_GROUP, keep=needed)
+        if needed:
+            self._ensure_polling()
+
+    def _on_quick_thumbnail(self, key, value, error):
+        """Hızlı önizlemeyi göster; nihai değilse tam thumbnail'i sıraya al (ana thread)"""
+        photo_path = key[1]
+        pil_image, is_final = value if error is None and value else (None, False)
+        if is_final and pil_image is not None:
+            self._store_image(photo_path, pil_image)
+            return
+        image = None
+        if pil_image is not None:
+            image = ctk.CTkImage(light_image=pil_image, dark_image=pil_image, size=pil_image.size)
+            self._set_card_image(photo_path, image)
+        self._quick[photo_path] = image
+        if len(self._quick) > IMAGE_CACHE_SIZE:
+            self._quick.popitem(last=False)
+        # Tam kaliteli thumbnail isteği bir sonraki yenilemede gönderilir
+        self._schedule_refresh()
+
+    def _on_thumbnail(self, key, pil_image, error):
+        """Hattan gelen tam thumbnail'i ilgili karta yerleştir (ana thread)"""
+        photo_path = key[1]
+        if error is not None or pil_image is None:
+            self._failed.add(photo_path)
+            return
+        self._store_image(photo_path, pil_image)
+
+    def _store_image(self, photo_path, pil_image):
+        image = ctk.CTkImage(light_image=pil_image, dark_image=pil_image, size=pil_image.size)
+        self._images[photo_path] = image
+        if len(self._images) > IMAGE_CACHE_SIZE:
+            self._images.popitem(last=False)
+        self._quick.pop(photo_path, None)
+        self._set_card_image(photo_path, image)
+
+    def _set_card_image(self, photo_path, image):
+        for card in self._cards.values():
+            if card.photo_path == photo_path:
+                card.set_image(image)
+
+    def _ensure_polling(self):
+        if self._poll_id is None:
+            self._poll_id = self.after(POLL_INTERVAL_MS, self._poll)
+
+    def _poll(self):
+        """Tamamlanan thumbnail'leri al; iş kaldıkça tekrar planla"""
+        self._poll_id = None
+        self.pipeline.poll(limit=64)
+        if self.pipeline.busy:
+            self._ensure_polling()
+
+    def destroy(self):
+        if self._poll_id is not None:
+            self.after_cancel(self._poll_id)
+            self._poll_id = None
+        self.pipeline.cancel(THUMBNAIL_GROUP)
+        super().destroy()
+
+    # --- Olaylar ---------------------------------------------------------
+
+    def _on_configure(self, event):
+        self._update_layout()
+        self._reposition_all()
+        self._schedule_refresh()
+
+    def _on_scrollbar(self, *args):
+        self.canvas.yview(*args)
+        self._schedule_refresh()
+
+    def _bind_mousewheel(self, event):
+        if sys.platform.startswith("linux"):
+            self.bind_all("<Button-4>", self._on_mousewheel)
+            self.bind_all("<Button-5>", self._on_mousewheel)
+        else:
+            self.bind_all("<MouseWheel>", self._on_mousewheel)
+
+    def _unbind_mousewheel(self, event):
+        # İmleç bir alt widget'a geçtiyse <Leave> gelir - hâlâ galerinin içindeyiz
+        pointer_x, pointer_y = self.winfo_pointerxy()
+        widget = self.winfo_containing(pointer_x, pointer_y)
+        if widget is not None and str(widget).startswith(str(self)):
+            return
+        if sys.platform.startswith("linux"):
+            self.unbind_all("<Button-4>")
+            self.unbind_all("<Button-5>")
+        else:
+            self.unbind_all("<MouseWheel>")
+
+    def _on_mousewheel(self, event):
+        if getattr(event, "num", None) == 4:
+            delta = -1
+        elif getattr(event, "num", None) == 5:
+            delta = 1
+        elif sys.platform == "darwin":
+            delta = -event.delta
+        else:
+            delta = -event.delta / 120
+        if not delta or not self.photos:
+            return
+        region = self.canvas.cget("scrollregion").split()
+        total = float(region[3]) if len(region) == 4 else 0
+        if total <= 0:
+            return
+        top = self.canvas.canvasy(0) + delta * self._apply_widget_scaling(SCROLL_STEP)
+        self.canvas.yview_moveto(max(0.0, top / total))
+        self._schedule_refresh()
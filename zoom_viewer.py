@@ -0,0 +1,435 @@
+"""Yakınlaştırılabilir büyük görüntü görüntüleyici.
+
+Fotoğraf bir Tk Canvas üzerinde iki katmanla çizilir:
+
+* Arka plan: bellekteki orta çözünürlüklü genel görünümün (overview) yalnızca
+  görünür kısmı, görünüm boyutuna ölçeklenir. Her yakınlaştırma ve kaydırma
+  adımında anında (bulanık da olsa) bir görüntü verir.
+* Döşemeler: genel görünümün çözünürlüğü yetmediğinde, `TilePyramid`'in
+  zoom'a uygun seviyesinden yalnızca görünür alana düşen döşemeler arka plan
+  hattında okunup ekran boyutuna ölçeklenir ve arka planın üstüne çizilir.
+
+Kaydırmada öğeler yalnızca taşınır; fare olayları kare başına tek çizimde
+birleştirilir. Ekrana hazırlanmış döşemeler sınırlı bir LRU'da tutulur.
+
+Fotoğraflar arasında gezinirken komşuların piramit ve genel görünümleri
+önden hazırlanır; sığdırılmış görünüm için döşeme gerekmediğinden geçiş anında olur.
+"""
+import sys
+from collections import OrderedDict
+from functools import partial
+
+from PIL import Image, ImageTk
+
+from preview_loader import scale_image
+
+ZOOM_GROUP = "zoom"  # Thumbnail hattındaki döşeme işleri grubu
+OPEN_GROUP = "zoom-open"  # Piramit ve genel görünüm hazırlama (ön yükleme dahil) grubu
+FRAME_MS = 16  # Birleştirilmiş çizim aralığı (~60 FPS)
+POLL_INTERVAL_MS = 20  # Döşeme sonuçlarının kontrol aralığı
+MAX_ZOOM = 4.0  # En fazla %400
+ZOOM_STEP = 1.25  # Fare tekerleği adımı başına çarpan
+DISPLAY_CACHE_SIZE = 96  # Ekran boyutuna ölçeklenmiş döşeme sayısı (LRU)
+DEFAULT_AHEAD = 3  # Önden hazırlanan komşu fotoğraf sayısı
+
+
+class ZoomableImageView:
+    """Döşeme piramidinden beslenen, kaydırılıp yakınlaştırılabilen görüntüleyici"""
+
+    def __init__(self, canvas, pipeline, load_pyramid, load_overview, on_zoom=None,
+                 on_error=None, max_zoom=MAX_ZOOM, capacity=DISPLAY_CACHE_SIZE,
+                 ahead=DEFAULT_AHEAD):
+        self.canvas = canvas
+        self.pipeline = pipeline  # ThumbnailPipeline
+        # Worker thread'de çalışırlar: yol -> TilePyramid, yol -> PIL Image
+        self.load_pyramid = load_pyramid
+        self.load_overview = load_overview
+        self.on_zoom = on_zoom  # zoom değişince callback(zoom)
+        self.on_error = on_error  # fotoğraf açılamazsa callback(hata)
+        self.max_zoom = max_zoom
+        self.capacity = capacity
+        self.ahead = ahead
+
+        self.photo_path = None
+        self.pyramid = None
+        self.overview = None
+        self.zoom = 1.0
+        self.fit_zoom = 1.0
+        self.fitted = True  # Kullanıcı zoom yapmadıysa boyut değişince yeniden sığdırılır
+        self.origin_x = 0.0  # Görüntünün sol üst köşesinin tuvaldeki konumu
+        self.origin_y = 0.0
+        self.view_width = 0
+        self.view_height = 0
+
+        self._backdrop_item = canvas.create_image(0, 0, anchor="nw", tags=("view",))
+        self._backdrop_image = None
+        self._items = {}  # ekran döşemesi anahtarı -> (tuval öğesi, PhotoImage)
+        self._display = OrderedDict()  # ekran döşemesi anahtarı -> PhotoImage (LRU)
+        self._wanted = set()
+        self._opened = OrderedDict()  # yol -> (TilePyramid, genel görünüm) (LRU)
+        self._render_job = None
+        self._pan_job = None
+        self._poll_id = None
+        self._drag_last = None
+        self._pending_pan = [0, 0]
+
+        canvas.bind("<Configure>", self._on_configure)
+        canvas.bind("<ButtonPress-1>", self._on_press)
+        canvas.bind("<B1-Motion>", self._on_drag)
+        canvas.bind("<ButtonRelease-1>", self._on_release)
+        canvas.bind("<Double-Button-1>", self._on_double_click)
+        if sys.platform.startswith("linux"):
+            canvas.bind("<Button-4>", lambda e: self.zoom_at(ZOOM_STEP, e.x, e.y))
+            canvas.bind("<Button-5>", lambda e: self.zoom_at(1 / ZOOM_STEP, e.x, e.y))
+        else:
+            canvas.bind("<MouseWheel>", self._on_mousewheel)
+
+    # --- Açma / kapatma -------------------------------------------------
+
+    def open(self, photo_path):
+        """Fotoğrafı aç: piramit ve genel görünüm hazırsa hemen, değilse arka planda"""
+        self._reset()
+        self.photo_path = photo_path
+        opened = self._opened.get(photo_path)
+        if opened is not None:
+            self._opened.move_to_end(photo_path)
+            self._show(opened)
+            return
+        # Ön yüklemesi kuyruktaysa önceliği yükseltilir
+        self.pipeline.submit(
+            ("open", photo_path), partial(self._load, photo_path), self._on_open,
+            priority=0, group=OPEN_GROUP
+        )
+        self._ensure_polling()
+
+    def prefetch(self, photo_paths):
+        """Komşu fotoğrafların piramit ve genel görünümlerini önden hazırla
+
+        photo_paths yakından uzağa sıralıdır; listede olmayan ön yüklemeler iptal edilir.
+        """
+        keep = {("open", self.photo_path)}
+        for priority, photo_path in enumerate(photo_paths[:self.ahead], 1):
+            keep.add(("open", photo_path))
+            if photo_path not in self._opened:
+                self.pipeline.submit(
+                    ("open", photo_path), partial(self._load, photo_path), self._on_open,
+                    priority=priority, group=OPEN_GROUP
+                )
+        self.pipeline.cancel(OPEN_GROUP, keep=keep)
+        self._ensure_polling()
+
+    def forget_prefetched(self):
+        """Önden hazırlanmış fotoğrafları bırak (ör. dosyalar yeniden adlandırılınca)"""
+        self._opened.clear()
+
+    def close(self):
+        """Tüm bekleyen işleri iptal et ve çizimi temizle (hazırlanmış fotoğraflar korunur)"""
+        self.pipeline.cancel(OPEN_GROUP)
+        if self.pyramid is not None:
+            self.pyramid.release_source()  # Tam çözünürlüklü görsel pencere gizliyken tutulmaz
+        self._reset()
+
+    def pause(self):
+        """close() ve resume() çağrılana kadar yeni işleri yok say (ör. dosyalar yeniden adlandırılırken)"""
+        self.close()
+        self.forget_prefetched()
+        self.pipeline.pause(OPEN_GROUP)
+        self.pipeline.pause(ZOOM_GROUP)
+
+    def resume(self):
+        self.pipeline.resume(OPEN_GROUP)
+        self.pipeline.resume(ZOOM_GROUP)
+
+    def _reset(self):
+        """Gösterilen fotoğrafı bırak ve döşeme işlerini iptal et"""
+        self.pipeline.cancel(ZOOM_GROUP)
+        for job in (self._render_job, self._pan_job):
+            if job is not None:
+                self.canvas.after_cancel(job)
+        self._render_job = self._pan_job = None
+        self._pending_pan = [0, 0]
+        self._clear_tiles()
+        self._display.clear()
+        self._wanted = set()
+        self.canvas.itemconfigure(self._backdrop_item, image="")
+        self._backdrop_image = None
+        self.pyramid = None
+        self.overview = None
+        self.photo_path = None
+
+    def _load(self, photo_path):
+        return self.load_pyramid(photo_path), self.load_overview(photo_path)
+
+    def _on_open(self, key, result, error):
+        photo_path = key[1]
+        if error is None:
+            self._opened[photo_path] = result
+            self._opened.move_to_end(photo_path)
+            while len(self._opened) > self.ahead + 2:  # Komşular + gösterilen + bir önceki
+                self._opened.popitem(last=False)
+        if photo_path != self.photo_path or self.pyramid is not None:
+            return
+        if error is not None:
+            if self.on_error is not None:
+                self.on_error(error)
+            return
+        self._show(result)
+
+    def _show(self, opened):
+        self.pyramid, self.overview = opened
+        self.fit()
+
+    # --- Görünüm --------------------------------------------------------
+
+    @property
+    def min_zoom(self):
+        return min(self.fit_zoom, 1.0)
+
+    def fit(self):
+        """Görüntüyü görünüme sığdır (küçük görüntüler büyütülmez)"""
+        if self.pyramid is None or self.view_width <= 0 or self.view_height <= 0:
+            return
+        self.fit_zoom = min(self.view_width / self.pyramid.width, self.view_height / self.pyramid.height)
+        self._set_zoom(min(self.fit_zoom, 1.0))
+        self.fitted = True
+        self._center()
+        self.render()
+
+    def actual_size(self, x=None, y=None):
+        """%100 zoom (bir ekran pikseli = bir görüntü pikseli)"""
+        if self.pyramid is None:
+            return
+        x = self.view_width / 2 if x is None else x
+        y = self.view_height / 2 if y is None else y
+        self.zoom_at(1.0 / self.zoom, x, y)
+
+    def zoom_at(self, factor, x, y):
+        """Zoom'u factor ile çarp; (x, y) altındaki nokta yerinde kalır"""
+        if self.pyramid is None:
+            return
+        zoom = max(self.min_zoom, min(self.max_zoom, self.zoom * factor))
+        if abs(zoom - self.zoom) < 1e-9:
+            return
+        image_x = (x - self.origin_x) / self.zoom
+        image_y = (y - self.origin_y) / self.zoom
+        self._set_zoom(zoom)
+        self.fitted = False
+        self.origin_x = x - image_x * zoom
+        self.origin_y = y - image_y * zoom
+        self._clamp()
+        # Ölçek değişti: döşeme öğeleri yeni boyutlarla yeniden çizilir
+        self._clear_tiles()
+        self._schedule_render()
+
+    def pan_by(self, dx, dy):
+        """Görüntüyü kaydır (öğeler taşınır, görünür alan sonra tamamlanır)"""
+        if self.pyramid is None:
+            return
+        old_x, old_y = self.origin_x, self.origin_y
+        self.origin_x += dx
+        self.origin_y += dy
+        self._clamp()
+        self.canvas.move("view", self.origin_x - old_x, self.origin_y - old_y)
+        self._schedule_render()
+
+    def _set_zoom(self, zoom):
+        self.zoom = zoom
+        if self.on_zoom is not None:
+            self.on_zoom(zoom)
+
+    def _center(self):
+        self.origin_x = (self.view_width - self.pyramid.width * self.zoom) / 2
+        self.origin_y = (self.view_height - self.pyramid.height * self.zoom) / 2
+
+    def _clamp(self):
+        """Görüntü görünümden küçükse ortala, büyükse kenar boşluk bırakmasın"""
+        for axis in ("x", "y"):
+            view = self.view_width if axis == "x" else self.view_height
+            size = (self.pyramid.width if axis == "x" else self.pyramid.height) * self.zoom
+            origin = getattr(self, f"origin_{axis}")
+            if size <= view:
+                origin = (view - size) / 2
+            else:
+                origin = max(view - size, min(0.0, origin))
+            setattr(self, f"origin_{axis}", origin)
+
+    # --- Çizim ----------------------------------------------------------
+
+    def _schedule_render(self):
+        if self._render_job is None:
+            self._render_job = self.canvas.after(FRAME_MS, self.render)
+
+    def _visible_rect(self):
+        """Görünür alanın görüntü koordinatlarındaki sınırları"""
+        zoom = self.zoom
+        left = max(0.0, -self.origin_x / zoom)
+        top = max(0.0, -self.origin_y / zoom)
+        right = min(float(self.pyramid.width), (self.view_width - self.origin_x) / zoom)
+        bottom = min(float(self.pyramid.height), (self.view_height - self.origin_y) / zoom)
+        return left, top, right, bottom
+
+    def render(self):
+        """Arka planı yenile ve görünür döşemeleri iste"""
+        self._render_job = None
+        if self.pyramid is None or self.view_width <= 0 or self.view_height <= 0:
+            return
+        left, top, right, bottom = self._visible_rect()
+        if right <= left or bottom <= top:
+            return
+        self._render_backdrop(left, top, right, bottom)
+        self._request_tiles(left, top, right, bottom)
+
+    def _render_backdrop(self, left, top, right, bottom):
+        zoom = self.zoom
+        size = (max(1, round((right - left) * zoom)), max(1, round((bottom - top) * zoom)))
+        # Genel görünüm boyutları yuvarlandığı için eksenler ayrı ölçeklenir
+        scale_x = self.overview.width / self.pyramid.width
+        scale_y = self.overview.height / self.pyramid.height
+        box = (left * scale_x, top * scale_y, right * scale_x, bottom * scale_y)
+        # Büyütürken hızlı BILINEAR yeterli (döşemeler üstüne gelir)
+        resample = Image.Resampling.BILINEAR if zoom > scale_x else Image.Resampling.BICUBIC
+        frame = self.overview.resize(size, resample, box=box)
+        self._backdrop_image = ImageTk.PhotoImage(frame)
+        self.canvas.itemconfigure(self._backdrop_item, image=self._backdrop_image)
+        self.canvas.coords(self._backdrop_item, self.origin_x + left * zoom, self.origin_y + top * zoom)
+        self.canvas.tag_lower(self._backdrop_item)
+
+    def _request_tiles(self, left, top, right, bottom):
+        pyramid = self.pyramid
+        overview_scale = self.overview.width / pyramid.width
+        if self.zoom <= overview_scale * 1.01:
+            # Genel görünüm bu zoom için yeterli: döşeme gerekmez
+            self._wanted = set()
+            self._clear_tiles()
+            self.pipeline.cancel(ZOOM_GROUP)
+            return
+
+        level = pyramid.level_for(self.zoom)
+        level_scale = 2 ** level
+        factor = self.zoom * level_scale  # Seviye pikseli başına ekran pikseli
+        tile_size = pyramid.tile_size
+        level_width, level_height = pyramid.level_size(level)
+        first_col = int(left / level_scale // tile_size)
+        last_col = int(min(level_width - 1, right / level_scale) // tile_size)
+        first_row = int(top / level_scale // tile_size)
+        last_row = int(min(level_height - 1, bottom / level_scale) // tile_size)
+        center_col = (first_col + last_col) / 2
+        center_row = (first_row + last_row) / 2
+
+        wanted = set()
+        for row in range(first_row, last_row + 1):
+            for col in range(first_col, last_col + 1):
+                # Kenarlar yuvarlanarak hesaplanır: komşu döşemeler arasında boşluk kalmaz
+                x0 = round(col * tile_size * factor)
+                y0 = round(row * tile_size * factor)
+                x1 = round(min((col + 1) * tile_size, level_width) * factor)
+                y1 = round(min((row + 1) * tile_size, level_height) * factor)
+                key = (level, col, row, x1 - x0, y1 - y0, x0, y0)
+                wanted.add(key)
+                if key in self._items:
+                    continue
+                image = self._display.get(key)
+                if image is not None:
+                    self._display.move_to_end(key)
+                    self._draw_tile(key, image)
+                else:
+                    # Merkeze yakın döşemeler önce
+                    priority = 1 + abs(col - center_col) + abs(row - center_row)
+                    self.pipeline.submit(
+                        key, partial(self._load_tile, pyramid, key), self._on_tile,
+                        priority=priority, group=ZOOM_GROUP
+                    )
+        self._wanted = wanted
+        self.pipeline.cancel(ZOOM_GROUP, keep=wanted)
+        self._ensure_polling()
+
+        # Görünümden çıkan döşemeleri kaldır
+        for key in [key for key in self._items if key not in wanted]:
+            item, _ = self._items.pop(key)
+            self.canvas.delete(item)
+
+    @staticmethod
+    def _load_tile(pyramid, key):
+        """Döşemeyi oku ve ekran boyutuna ölçekle (worker thread'de çalışır)"""
+        level, col, row, width, height = key[:5]
+        return scale_image(pyramid.tile(level, col, row), (width, height))
+
+    def _on_tile(self, key, frame, error):
+        if error is not None or frame is None or key not in self._wanted or key in self._items:
+            return
+        image = ImageTk.PhotoImage(frame)
+        self._display[key] = image
+        self._display.move_to_end(key)
+        while len(self._display) > self.capacity:
+            self._display.popitem(last=False)
+        self._draw_tile(key, image)
+
+    def _draw_tile(self, key, image):
+        x0, y0 = key[5:]
+        item = self.canvas.create_image(
+            self.origin_x + x0, self.origin_y + y0, anchor="nw", image=image, tags=("view", "tile")
+        )
+        self._items[key] = (item, image)  # Görsel LRU'dan düşse de ekrandayken silinmez
+
+    def _clear_tiles(self):
+        self.canvas.delete("tile")
+        self._items.clear()
+
+    def _ensure_polling(self):
+        if self._poll_id is None:
+            self._poll_id = self.canvas.after(POLL_INTERVAL_MS, self._poll)
+
+    def _poll(self):
+        self._poll_id = None
+        self.pipeline.poll(limit=16)
+        if self.pipeline.busy:
+            self._ensure_polling()
+
+    # --- Olaylar --------------------------------------------------------
+
+    def _on_configure(self, event):
+        self.view_width, self.view_height = event.width, event.height
+        if self.pyramid is None:
+            return
+        if self.fitted:
+            self._clear_tiles()
+            self.fit()
+        else:
+            old_x, old_y = self.origin_x, self.origin_y
+            self._clamp()
+            self.canvas.move("view", self.origin_x - old_x, self.origin_y - old_y)
+            self._schedule_render()
+
+    def _on_press(self, event):
+        self._drag_last = (event.x, event.y)
+
+    def _on_drag(self, event):
+        if self._drag_last is None:
+            return
+        # Hareketler biriktirilir, kare başına bir kez uygulanır
+        self._pending_pan[0] += event.x - self._drag_last[0]
+        self._pending_pan[1] += event.y - self._drag_last[1]
+        self._drag_last = (event.x, event.y)
+        if self._pan_job is None:
+            self._pan_job = self.canvas.after(FRAME_MS, self._apply_pan)
+
+    def _apply_pan(self):
+        self._pan_job = None
+        dx, dy = self._pending_pan
+        self._pending_pan = [0, 0]
+        self.pan_by(dx, dy)
+
+    def _on_release(self, event):
+        self._drag_last = None
+
+    def _on_double_click(self, event):
+        """Sığdırılmış görünümle %100 arasında geçiş"""
+        if self.fitted or self.zoom < 1.0:
+            self.actual_size(event.x, event.y)
+        else:
+            self._clear_tiles()
+            self.fit()
+
+    def _on_mousewheel(self, event):
+        factor = ZOOM_STEP if event.delta > 0 else 1 / ZOOM_STEP
+        self.zoom_at(factor, event.x, event.y)